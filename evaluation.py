@@ -1,4 +1,5 @@
 import json
+import os
 import pandas as pd
 
 # <editor-fold desc="ID Dictionaries">
@@ -811,8 +812,9 @@ def compare_process_objects(process_obj_truth, process_obj_auto, id_dict):
 
 
 def calculate_scores(json_truth, json_auto, id_dict):
-    data_truth = json.loads(json_truth)
-    data_auto = json.loads(json_auto)
+    # the logs can be handed over as json strings or as already parsed dictionaries
+    data_truth = json.loads(json_truth) if isinstance(json_truth, str) else json_truth
+    data_auto = json.loads(json_auto) if isinstance(json_auto, str) else json_auto
 
     events_truth = data_truth["events"]
     ui_objects_truth = data_truth["ui_objects"]
@@ -946,13 +948,17 @@ def calculate_scores(json_truth, json_auto, id_dict):
 
     return log_micro_f1
 
-def get_log_micro_f1():
-    # read the contents of the JSON files
-    with open(r'C:\Users\Besitzer\Documents\Master\Thesis\Code\ground truth files\json_student_record.json', 'r') as file1:
-        json_truth = file1.read()
+def get_log_micro_f1(oc_dict=None, json_truth=None):
+    # read the contents of the JSON files unless they are handed over
+    if json_truth is None:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ground truth files', 'json_student_record.json'), 'r') as file1:
+            json_truth = file1.read()
 
-    with open(r'C:\Users\Besitzer\Documents\Master\Thesis\Code\output automated transformation\oc_student_record.json', 'r') as file2:
-        json_auto = file2.read()
+    if oc_dict is None:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'output automated transformation', 'oc_student_record.json'), 'r') as file2:
+            json_auto = file2.read()
+    else:
+        json_auto = oc_dict
 
     try:
         log_micro_f1 = calculate_scores(json_truth, json_auto, id_dict_student_record)
@@ -961,5 +967,7 @@ def get_log_micro_f1():
 
     return log_micro_f1
 
-f1 = get_log_micro_f1()
-print(f1)
\ No newline at end of file
+
+if __name__ == '__main__':
+    f1 = get_log_micro_f1()
+    print(f1)
@@ -12,6 +12,11 @@ import nltk
 from nltk.corpus import wordnet
 import copy
 import json
+import hashlib
+import pickle
+import functools
+import itertools
+import shutil
 
 
 def import_log():
@@ -54,10 +59,159 @@ def import_log():
 # </editor-fold>
 
 
+# <editor-fold desc="Cache">
+# folder holding the results of threshold-independent steps, so later runs on the same file can skip them; the
+# results are saved in one subfolder per code version
+cache_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+
+
+def get_file_hash(file_path):
+    """
+    Calculates the SHA-256 hash of a file's content.
+
+    :param file_path: Path to the file.
+    :return: A string with the hexadecimal hash.
+    """
+    file_hash = hashlib.sha256()
+
+    # read the file in blocks, so large logs don't have to fit in memory
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            file_hash.update(block)
+
+    return file_hash.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def get_code_version():
+    """
+    Determines the version of the code and resources the cached results depend on.
+
+    :return: A string with a hash over the transformation code, the action labels, and the pandas version.
+    """
+    root_folder = os.path.dirname(os.path.abspath(__file__))
+    code_files = ['functions.py', 'main.py', os.path.join('resources', 'action_labels.csv')]
+
+    code_hash = hashlib.sha256(pd.__version__.encode())
+    for code_file in code_files:
+        code_hash.update(get_file_hash(os.path.join(root_folder, code_file)).encode())
+
+    return code_hash.hexdigest()
+
+
+def get_cache_key(*parts):
+    """
+    Combines the given parts into one cache key.
+
+    :param parts: Strings or tuples of strings identifying the cached result.
+    :return: A string with the hexadecimal cache key.
+    """
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+def restore_nan_values(log):
+    """
+    Replaces the missing values of an unpickled log with np.NaN.
+
+    Unpickling creates new float objects for missing values, but the transformation recognizes missing values by
+    checking for the np.NaN object itself (e.g., 'value is not np.NaN').
+
+    :param log: A pandas DataFrame representing the UI log.
+    :return: The log with np.NaN as missing values.
+    """
+    for col_index in range(len(log.columns)):
+        values = log.iloc[:, col_index].to_numpy(dtype=object, copy=True)
+        # None values are kept as they are
+        nan_mask = pd.isna(values) & (values != None)
+        if nan_mask.any():
+            values[nan_mask] = np.NaN
+            log.iloc[:, col_index] = values
+
+    return log
+
+
+def load_from_cache(cache_key):
+    """
+    Loads a cached result.
+
+    :param cache_key: A string with the cache key.
+    :return: The cached object or None if nothing has been cached under the key.
+    """
+    cache_file_path = os.path.join(cache_folder, get_code_version(), f'{cache_key}.pkl')
+
+    if not os.path.exists(cache_file_path):
+        return None
+
+    try:
+        with open(cache_file_path, 'rb') as f:
+            obj = pickle.load(f)
+    # a damaged cache file is treated like a missing one
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+    if isinstance(obj, pd.DataFrame):
+        obj = restore_nan_values(obj)
+
+    return obj
+
+
+def save_to_cache(cache_key, obj):
+    """
+    Saves a result in the cache.
+
+    :param cache_key: A string with the cache key.
+    :param obj: The object to cache, e.g., a preprocessed log.
+    """
+    version_folder = os.path.join(cache_folder, get_code_version())
+    os.makedirs(version_folder, exist_ok=True)
+    cache_file_path = os.path.join(version_folder, f'{cache_key}.pkl')
+
+    # write to a temporary file first, so parallel runs never read a half-written file
+    temp_file_path = f'{cache_file_path}.{os.getpid()}.tmp'
+    with open(temp_file_path, 'wb') as f:
+        pickle.dump(obj, f, protocol=5)
+    os.replace(temp_file_path, cache_file_path)
+
+    # results of other code versions can never be loaded again
+    prune_cache()
+
+
+def prune_cache():
+    """
+    Deletes the cached results of all code versions except the current one.
+    """
+    current_version = get_code_version()
+    for entry in os.listdir(cache_folder):
+        if entry != current_version:
+            entry_path = os.path.join(cache_folder, entry)
+            if os.path.isdir(entry_path):
+                shutil.rmtree(entry_path, ignore_errors=True)
+            else:
+                os.remove(entry_path)
+
+
+def clear_cache():
+    """
+    Deletes all cached results, e.g., the ones of logs that have been edited since they were cached.
+    """
+    shutil.rmtree(cache_folder, ignore_errors=True)
+# </editor-fold>
+
+
 # <editor-fold desc="Preprocessing">
 class WordCounter:
+    # object instances are numbered as integers that encode the code of their word above the lowest 32 bits and their
+    # count below; bit 52 keeps them apart from small numeric attribute values, and staying below 2**53 keeps them
+    # exact if a column holding them is converted to float
+    instance_offset = 1 << 52
+    count_bits = 32
+    max_codes = 1 << (52 - count_bits)  # more codes would reach into the offset bit
+    max_count = (1 << count_bits) - 1  # larger counts would reach into the code
+
     def __init__(self):
         self.counts = {}
+        self.codes = {}  # word -> code of the word in object instances
+        self.words = []  # code -> word
 
     def get_next_count(self, word):
         if word in self.counts:
@@ -66,6 +220,42 @@ class WordCounter:
             self.counts[word] = 1
         return self.counts[word]
 
+    def get_next_instance(self, word):
+        """
+        Numbers the next object instance of a word, e.g., the second instance of 'button'.
+
+        :param word: A string with the object type.
+        :return: An integer identifying the object instance.
+        """
+        code = self.codes.get(word)
+        if code is None:
+            if len(self.words) >= self.max_codes:
+                raise ValueError(f"Object instances can only be numbered for up to {self.max_codes} different object "
+                                 f"types.")
+            code = self.codes[word] = len(self.words)
+            self.words.append(word)
+        if self.counts.get(word, 0) >= self.max_count:
+            raise ValueError(f"Object instances can only be numbered up to {self.max_count} times per object type, "
+                             f"but '{word}' has more instances.")
+        return self.instance_offset | code << self.count_bits | self.get_next_count(word)
+
+    def get_instance_name(self, instance):
+        """
+        Renders an object instance as its name, e.g., 'button_2'. Missing values are returned unchanged.
+
+        :param instance: An integer identifying the object instance, or a float if its column was converted.
+        :return: A string with the name of the object instance.
+        """
+        if pd.isna(instance):
+            return instance
+        code, count = divmod(int(instance) - self.instance_offset, 1 << self.count_bits)
+        return f'{self.words[code]}_{count}'
+
+    def reset(self):
+        self.counts = {}
+        self.codes = {}
+        self.words = []
+
 counter = WordCounter()
 
 def delete_cases(log):
@@ -98,17 +288,55 @@ def delete_empty_columns_and_rows(log):
     return log
 
 
+def have_same_values(column, other_column):
+    """
+    Checks if two columns have the same value in every row. Missing values are considered equal.
+
+    :param column: A pandas Series with the values of a column.
+    :param other_column: A pandas Series with the values of the other column.
+    :return: A boolean indicating whether the values are the same.
+    """
+    values = column.to_numpy(dtype=object)
+    other_values = other_column.to_numpy(dtype=object)
+
+    # missing values have to be at the same positions, all other values have to be equal
+    missing = pd.isna(values)
+    if not np.array_equal(missing, pd.isna(other_values)):
+        return False
+
+    return bool((values[~missing] == other_values[~missing]).all())
+
+
 def remove_duplicate_columns(log):
     """
     Remove duplicate columns from the log.
 
     This function identifies and removes any columns in the log that have the same values as other columns.
+    Every column is hashed once and only compared value by value with the columns that have the same hash. Of columns
+    with the same values, the first one is kept.
     It returns the modified log with duplicate columns removed.
 
     :param log: A pandas DataFrame representing the UI log.
     :return: The modified log without duplicate columns.
     """
-    log = log.T.drop_duplicates().T
+    col_indices_per_hash = {}  # hash of the column values -> indices of the kept columns with this hash
+    is_duplicate = np.zeros(log.shape[1], dtype=bool)
+
+    for col_index in range(log.shape[1]):
+        column = log.iloc[:, col_index]
+        column_hash = hash(pd.util.hash_pandas_object(column, index=False).to_numpy().tobytes())
+
+        # columns with the same hash are only duplicates if their values are the same as well
+        kept_col_indices = col_indices_per_hash.setdefault(column_hash, [])
+        if any(have_same_values(log.iloc[:, kept_col_index], column) for kept_col_index in kept_col_indices):
+            is_duplicate[col_index] = True
+        else:
+            kept_col_indices.append(col_index)
+
+    # select the columns by position, since column titles do not have to be unique
+    if is_duplicate.any():
+        log = log.take(np.flatnonzero(~is_duplicate), axis=1)
+
     return log
 
 
@@ -116,41 +344,33 @@ def unify_string_format(log):
     """
     Modifies the string values in a given log to have a consistent format.
 
-    The function iterates over each column and row in the log. For each string value found,
-    it checks if the value matches a specific pattern and performs modifications to unify the format.
+    The function works column by column. For each value that matches a specific pattern,
+    it performs modifications to unify the format.
 
     :param log: A pandas DataFrame representing the UI log.
     :return: The modified log with unified string format.
     """
     # regex that matches strings consisting of only letters (uppercase or lowercase),
     #  with an optional underscore (_) character in between, and nothing else before or after
-    string_regex = '^[A-Za-z]*([_])?[A-Za-z]*$'
+    string_regex = re.compile('^[A-Za-z]*([_])?[A-Za-z]*$')
 
     # regex that matches boundaries between lowercase and uppercase letters,
     #  boundaries between non-uppercase and uppercase followed by lowercase letters,
     #   and boundaries between letters and digits or underscores
-    camel_underscore_regex = r'(?<=[a-z])(?=[A-Z])|_'
-
+    camel_underscore_regex = re.compile(r'(?<=[a-z])(?=[A-Z])|_')
 
-    for column, row in log.items():
-        for index, value in row.items():
-            # check if the value (without any leading or trailing whitespace) matches the regex pattern
-            if re.fullmatch(string_regex, str(value).strip()):
-                # remove leading or trailing whitespace from the value
-                value = str(value).strip()
+    for column in log.columns:
+        # values are compared as strings without any leading or trailing whitespace, so missing values become 'nan'
+        values = log[column].astype(str).str.strip()
 
-                if value is np.NaN:
-                    break
+        # mask of the values that match the regex pattern
+        mask = values.str.fullmatch(string_regex)
 
-                else:
-                    # split the value according to the regex pattern
-                    term = [word for word in re.split(camel_underscore_regex, value)]
-                    # put single words back together with a whitespace
-                    new_value = " ".join(term).lower()
-                    # remove leading or trailing whitespace from the value
-                    new_value = str(new_value).strip()
-                    # write the changed value back to the log
-                    log.at[index, column] = new_value
+        if mask.any():
+            # split the values according to the regex pattern and put single words back together with a whitespace
+            new_values = values[mask].str.replace(camel_underscore_regex, ' ', regex=True).str.lower().str.strip()
+            # write the changed values back to the log
+            log.loc[mask, column] = new_values
 
     return log
 
@@ -198,35 +418,299 @@ def unify_nan_values(log):
     :return: Modified log with proper np.NaN values.
     """
 
-    log.replace('nan', np.NaN, inplace=True) # replace string 'nan'
-    log.replace('', np.NaN, inplace=True) # replace empty strings
-    log.fillna(value=np.NaN, inplace=True) # replace None
+    object_col_indices = []  # indices of the object columns
+    replaced = False  # whether any value of an object column has been replaced
+
+    for col_index in range(log.shape[1]):
+        column = log.iloc[:, col_index]
+
+        # only object columns can hold strings and None; the missing values of other columns are replaced as before
+        if column.dtype != object:
+            log.isetitem(col_index, column.replace('nan', np.NaN).replace('', np.NaN).fillna(value=np.NaN))
+            continue
+
+        object_col_indices.append(col_index)
+
+        # find the string 'nan', empty strings, and missing values like None in one pass over the values
+        values = column.to_numpy()
+        mask = pd.isna(values) | (values == 'nan') | (values == '')
+
+        # columns without such values stay untouched, so normalizing a log again is cheap
+        if mask.any():
+            values = values.copy()
+            values[mask] = np.NaN
+            log.isetitem(col_index, pd.Series(values, index=log.index, dtype=object))
+            replaced = True
+
+    # like replace and fillna did, give the object columns that only hold numbers and np.NaN a numeric dtype once a
+    # value has been replaced
+    if replaced:
+        for col_index in object_col_indices:
+            column = log.iloc[:, col_index].infer_objects()
+            if column.dtype != object:
+                log.isetitem(col_index, column)
 
     return log
 # </editor-fold>
 
 
-# <editor-fold desc="1. Column Type Classification">
-def get_unique_value_ratio(log):
+# <editor-fold desc="Column Profiles">
+class ColumnProfile:
+    """
+    Summarizes the values of a log column, so the column type classification does not have to scan the column again
+    for every step, and a log that is read in chunks can be classified without holding all of its rows in memory.
+
+    Once a column has clearly more distinct values than a categorical column, the profile stops storing all of them.
+    It keeps the counts and a sample of the distinct values with the smallest hashes. The sample is a uniform sample of
+    the distinct values, its counts stay exact, and it does not depend on how the column is split into chunks.
+    """
+    def __init__(self, max_uniqueness_ratio=None, max_values=None):
+        """
+        :param max_uniqueness_ratio: An optional float indicating the ratio of distinct values to rows above which the
+                                        distinct values are sampled.
+        :param max_values: An optional number of distinct values above which the distinct values are sampled, and the
+                            size of the sample. If it or max_uniqueness_ratio is not given, all values are kept.
+        """
+        self.max_uniqueness_ratio = max_uniqueness_ratio
+        self.max_values = max_values
+        self.value_counts = {}  # non-missing values and how often they occur; only the sample once it is sampled
+        self.non_null_count = 0  # number of non-missing values
+        self.null_count = 0  # number of missing values
+        self.regex_match_counts = {}  # name of a regular expression -> number of values matching it
+        self.sample_hashes = None  # sorted hashes of the sampled values, or None if all values are kept
+
+    def update(self, column):
+        """
+        Adds the values of a chunk to the profile.
+
+        :param column: A pandas Series holding the column's values of one chunk.
+        """
+        value_counts = column.value_counts(sort=False)
+        self.null_count += int(column.isna().sum())
+        self.add_values(list(value_counts.index), value_counts.to_numpy())
+
+    def add(self, value, count=1):
+        """
+        Adds a value that occurs a given number of times to the profile.
+
+        :param value: The value, which may be missing.
+        :param count: Number of occurrences of the value.
+        """
+        if pd.isna(value):
+            self.null_count += count
+        else:
+            self.add_values([value], np.array([count]))
+
+    def add_values(self, values, counts):
+        """
+        Adds distinct non-missing values and how often they occur to the profile.
+
+        :param values: A list of distinct non-missing values.
+        :param counts: A NumPy array with the number of occurrences of each value.
+        """
+        self.non_null_count += int(counts.sum())
+
+        if self.sample_hashes is None:
+            for value, count in zip(values, counts):
+                self.value_counts[value] = self.value_counts.get(value, 0) + int(count)
+
+            # sample the distinct values once there are clearly too many of them to encode the column
+            if (self.max_uniqueness_ratio is not None and self.max_values is not None
+                    and len(self.value_counts) > self.max_values
+                    and len(self.value_counts) > self.max_uniqueness_ratio * (self.non_null_count + self.null_count)):
+                sample_values = list(self.value_counts)
+                sample_counts = np.fromiter(self.value_counts.values(), dtype=np.int64, count=len(sample_values))
+                self.sample_hashes = np.empty(0, dtype=np.uint64)
+                self.value_counts = {}
+                self.add_to_sample(sample_values, sample_counts)
+        else:
+            self.add_to_sample(values, counts)
+
+        # the regex match counts have to be determined again for the changed values
+        self.regex_match_counts = {}
+
+    def add_to_sample(self, values, counts):
+        """
+        Merges distinct values into the sample and keeps the max_values values with the smallest hashes. A value whose
+        hash is kept has never been dropped before, since the largest kept hash only decreases, so its count is exact.
+
+        :param values: A list of distinct non-missing values.
+        :param counts: A NumPy array with the number of occurrences of each value.
+        """
+        # the values are assigned one by one, so values like tuples are not turned into array dimensions
+        all_values = np.empty(len(self.value_counts) + len(values), dtype=object)
+        for index, value in enumerate(itertools.chain(self.value_counts, values)):
+            all_values[index] = value
+
+        all_hashes = np.concatenate([self.sample_hashes, pd.util.hash_array(all_values[len(self.value_counts):])])
+        all_counts = np.concatenate([np.fromiter(self.value_counts.values(), dtype=np.int64,
+                                                 count=len(self.value_counts)), counts.astype(np.int64)])
+
+        # combine the counts of values that are already in the sample and keep the smallest hashes
+        self.sample_hashes, first_indices, inverse = np.unique(all_hashes, return_index=True, return_inverse=True)
+        summed_counts = np.bincount(inverse, weights=all_counts).astype(np.int64)
+        self.sample_hashes = self.sample_hashes[:self.max_values]
+        self.value_counts = dict(zip(all_values[first_indices[:self.max_values]],
+                                     summed_counts[:self.max_values].tolist()))
+
+    def is_sampled(self):
+        """
+        :return: A boolean indicating whether the profile only keeps a sample of the distinct values.
+        """
+        return self.sample_hashes is not None
+
+    def is_constant(self):
+        """
+        :return: A boolean indicating whether the column has the same value in every row, missing values included.
+        """
+        return not self.is_sampled() and len(self.value_counts) + (self.null_count > 0) == 1
+
+    def count(self):
+        """
+        :return: Number of non-missing values.
+        """
+        return self.non_null_count
+
+    def nunique(self):
+        """
+        :return: Number of unique non-missing values. If the distinct values are sampled, the number is estimated from
+                    the average number of occurrences of the sampled values, so it is exact if every value is unique.
+        """
+        if not self.is_sampled():
+            return len(self.value_counts)
+        return round(self.non_null_count * len(self.value_counts) / sum(self.value_counts.values()))
+
+    def items(self):
+        """
+        :return: A list of all values, or of the sampled values if the distinct values are sampled, including np.NaN
+                    for the missing values, and how often they occur.
+        """
+        items = list(self.value_counts.items())
+        if self.null_count:
+            items.append((np.NaN, self.null_count))
+        return items
+
+
+def get_column_profiles(log, max_uniqueness_ratio, max_values, known_profiles=None):
+    """
+    Profiles every column of a log in one pass per column.
+
+    :param log: A pandas DataFrame representing the UI log.
+    :param max_uniqueness_ratio: A float indicating the ratio of distinct values to rows above which the distinct values
+                                    of a column are sampled.
+    :param max_values: Number of distinct values above which the distinct values of a column are sampled, and the size
+                        of the sample.
+    :param known_profiles: An optional dictionary mapping column names to profiles of columns that have not changed
+                            since they were profiled. These columns are not profiled again.
+    :return: A list with the ColumnProfile of each column.
     """
-    Counts how many unique values there are per column and calculates a ratio (unique_values/total_number_of_values).
+    profiles = []
+
+    for index, column in enumerate(log.columns):
+        if known_profiles is not None and column in known_profiles:
+            profile = known_profiles[column]
+        else:
+            profile = ColumnProfile(max_uniqueness_ratio, max_values)
+            profile.update(log.iloc[:, index])
+        profiles.append(profile)
+
+    return profiles
+
+
+def encode_low_cardinality_columns(log, profiles, max_uniqueness_ratio):
+    """
+    Stores object columns with few distinct values as pandas Categorical, so every distinct value is only held once
+    per column and the rows only hold integer codes.
 
     :param log: A pandas DataFrame representing the UI log.
+    :param profiles: A list with the ColumnProfile of each column of the log.
+    :param max_uniqueness_ratio: A float indicating the ratio of distinct values to rows below which a column is
+                                    encoded.
+    :return: The log with the low-cardinality columns encoded.
+    """
+    for col_index, profile in enumerate(profiles):
+        column = log.iloc[:, col_index]
+        if column.dtype == object and profile.nunique() < max_uniqueness_ratio * len(log):
+            log.isetitem(col_index, column.astype('category'))
+
+    return log
+
+
+def get_unique_value_ratio_from_profiles(profiles):
+    """
+    Calculates the uniqueness-ratio (unique_values/total_number_of_values) per column.
+
+    :param profiles: A list with the ColumnProfile of each column.
     :return: A dictionary holding the calculated uniqueness-ratio for each column.
     """
-    # dictionary to save ratio of how many unique values there are per column
     ratio_dictionary = {}
 
-    # count unique values and total number of values for each column
-    for index, column in enumerate(log.columns):
-        number_unique_values = log[column].nunique() # unique values per column
-        number_values = log[column].count() # total values per column
-        ratio_unique = number_unique_values / number_values
+    for index, profile in enumerate(profiles):
+        number_values = profile.count()
+        ratio_unique = profile.nunique() / number_values if number_values else np.NaN
         ratio_dictionary.setdefault(index, ratio_unique)
 
     return ratio_dictionary
 
 
+def get_column_completeness_from_profiles(profiles, row_count, threshold_compl):
+    """
+    Determines the completeness of the log per column and saves columns passing the set threshold in a dictionary.
+
+    :param profiles: A list with the ColumnProfile of each column.
+    :param row_count: Number of rows in the log.
+    :param threshold_compl: A float indicating the threshold value for the completeness-ratio.
+    :return: A dictionary holding the completeness-ratio of the log per column for the columns passing the set threshold.
+    """
+    col_compl_dict = {}
+
+    for index, profile in enumerate(profiles):
+        ratio = profile.count() / row_count
+        if ratio >= threshold_compl:
+            col_compl_dict.setdefault(index, ratio)
+
+    return col_compl_dict
+
+
+def find_constant_columns_from_profiles(profiles):
+    """
+    Identifies constant columns in the log.
+    Constant columns are columns that have the same value in every row.
+
+    :param profiles: A list with the ColumnProfile of each column.
+    :return: A list of column indices, where the columns are constant.
+    """
+    return [index for index, profile in enumerate(profiles) if profile.is_constant()]
+
+
+def find_element_types_from_profiles(profiles, ratio_threshold, ratio_dictionary, comparison_dictionary,
+                                     element_type_dictionary=None):
+    """
+    Identifies the element types present in columns of a log dataset based on provided dictionaries. Every unique value
+    is compared only once and its matches are weighted with the number of its occurrences.
+
+    :param profiles: A list with the ColumnProfile of each column.
+    :param ratio_threshold: A float indicating the threshold value for the uniqueness-ratio.
+    :param ratio_dictionary: A dictionary mapping column indices to uniqueness-ratio values.
+    :param comparison_dictionary: A dictionary mapping element types to their corresponding synonyms.
+    :param element_type_dictionary: An optional dictionary mapping values to their element types.
+    :return: A tuple containing the match count dictionary and the element type dictionary.
+    """
+    match_count_dictionary = {}
+
+    if element_type_dictionary is None:
+        element_type_dictionary = {}
+
+    for column, ratio in ratio_dictionary.items():
+        if ratio < ratio_threshold:
+            count_element_type_matches(column, profiles[column].items(), comparison_dictionary, match_count_dictionary,
+                                       element_type_dictionary)
+
+    return match_count_dictionary, element_type_dictionary
+# </editor-fold>
+
+
+# <editor-fold desc="1. Column Type Classification">
 def move_column(log, current_column_name, column_index_goal, new_column_name):
     """
     Moves a column of a log to a different position in the log.
@@ -245,56 +729,42 @@ def move_column(log, current_column_name, column_index_goal, new_column_name):
     return log
 
 
-def find_element_types(log, ratio_threshold, ratio_dictionary, comparison_dictionary, element_type_dictionary=None):
+def count_element_type_matches(column, value_counts, comparison_dictionary, match_count_dictionary,
+                               element_type_dictionary):
     """
-    Identifies the element types present in columns of a log dataset based on provided dictionaries.
+    Compares the unique values of a column with the synonyms of the element types and counts the matches, weighting
+    each value's matches with the number of its occurrences.
 
-    :param log: A pandas DataFrame representing the UI log.
-    :param ratio_threshold: A float indicating the threshold value for the uniqueness-ratio.
-    :param ratio_dictionary: A dictionary mapping column indices to uniqueness-ratio values.
+    :param column: Index of the column.
+    :param value_counts: An iterable of the column's unique values and how often they occur.
     :param comparison_dictionary: A dictionary mapping element types to their corresponding synonyms.
-    :param element_type_dictionary: An optional dictionary mapping values to their element types.
-    :return: A tuple containing the match count dictionary and the element type dictionary.
+    :param match_count_dictionary: A dictionary with the count of matches per column and element type that is updated.
+    :param element_type_dictionary: A dictionary mapping values to their element types that is updated.
     """
-    # create a dictionary to store the count of matches per column and object type
-    match_count_dictionary = {}
+    for value, count in value_counts:
+        # create a set to store the unique matches of the value
+        unique_matches = set()
 
-    # if there is an existing dictionary given for a certain element type, then use that one, if not, create a new one
-    if element_type_dictionary is None:
-        element_type_dictionary = {}
+        # loop over dictionary or list to compare the value
+        for element_type, synonyms in comparison_dictionary.items():
+            for synonym in synonyms:
+                if str(value) in synonym:
+                    element_type_dictionary.setdefault(value, element_type)
+                    unique_matches.add(element_type)
 
-    # find element types per column, given a ratio threshold, looping over every value in each column
-    for column, ratio in ratio_dictionary.items():
-        if ratio < ratio_threshold:
-            for index, row in log.iloc[:, column:column + 1].iterrows():
-                # create a set to store the unique matches per column
-                unique_matches = set()
-
-                for value in row:
-                    # loop over dictionary or list to compare the values
-                    for element_type, synonyms in comparison_dictionary.items():
-                        for synonym in synonyms:
-                            if str(value) in synonym:
-                                element_type_dictionary.setdefault(value, element_type)
-                                unique_matches.add(element_type)
-
-                # update the match count dictionary with the unique matches per column
-                for element_type in unique_matches:
-                    match_count_dictionary.setdefault(column, {}).setdefault(element_type, 0)
-                    match_count_dictionary[column][element_type] += 1
-
-    return match_count_dictionary, element_type_dictionary
+        # update the match count dictionary with the unique matches of the value
+        for element_type in unique_matches:
+            match_count_dictionary.setdefault(column, {}).setdefault(element_type, 0)
+            match_count_dictionary[column][element_type] += count
 
 
-def find_event_column(log, ratio_dictionary, action_labels, ratio_threshold):
+def find_event_column(log, activity_match_count_dictionary):
     """
     Recognizes the event or activity column of the log.
     Assumption: every UI log has some sort of event or activity column.
 
     :param log: A pandas DataFrame representing the UI log.
-    :param ratio_dictionary: A dictionary mapping column indices to uniqueness-ratio values.
-    :param action_labels: A pandas DataFrame holding action labels.
-    :param ratio_threshold: A float indicating the threshold value for the uniqueness-ratio.
+    :param activity_match_count_dictionary: A dictionary including the action labels and their count per column.
     :return: Modified log with the event column renamed to 'event' and moved to the first position in the log.
     """
     # list including strings that might indicate the event or activity column
@@ -314,10 +784,6 @@ def find_event_column(log, ratio_dictionary, action_labels, ratio_threshold):
 
     # if flag still false (event column not found yet)
     if event_column_found is None:
-        # compare the log values to the action label dataset to see if a column matches some of the labels
-        activity_match_count_dictionary, activity_type_dictionary = find_element_types(log, ratio_threshold,
-                                                                                       ratio_dictionary, action_labels)
-
         # get the indices of the columns that have been recognized as potential activity columns
         keys = activity_match_count_dictionary.keys()
 
@@ -354,93 +820,123 @@ def find_event_column(log, ratio_dictionary, action_labels, ratio_threshold):
     return log
 
 
-def extract_activity(log, event_column_index, action_labels):
+def split_event(parts, action_label_set):
+    """
+    Decides which words of an event are the activity and which are the object type.
+
+    :param parts: A list with the two or three words of the event; missing words are np.NaN.
+    :param action_label_set: A frozenset with the action labels.
+    :return: A tuple of the activity and the main ui object type. Both are empty strings if they cannot be decided.
+    """
+    activity = ''
+    main_obj_type = ''
+
+    # if the event consists of only two parts assume the first word is the activity and the second one the object type
+    if len(parts) == 2:
+        if parts[0] in action_label_set:
+            if is_dictionary_noun(parts[1]):
+                activity = parts[0]
+                main_obj_type = parts[1]
+            # if no object is given
+            elif not parts[1]:
+                activity = parts[0]
+                main_obj_type = parts[1]
+            else:
+                activity = parts[0] + ' ' + parts[1]
+
+        elif parts[1] in action_label_set:
+            if is_dictionary_noun(parts[0]):
+                activity = parts[1]
+                main_obj_type = parts[0]
+            # if no object is given
+            elif not parts[0]:
+                activity = parts[1]
+                main_obj_type = parts[0]
+            else:
+                activity = parts[1] + ' ' + parts[0]
+        # else assume the activity comes first and is followed by the ui obj
+        else:
+            activity = parts[0]
+            main_obj_type = parts[1]
+
+    elif len(parts) == 3:
+        if parts[0] in action_label_set:
+            if is_dictionary_noun(parts[2]):
+                if is_dictionary_noun(parts[1]):
+                    activity = parts[0]
+                    main_obj_type = parts[1] + ' ' + parts[2]
+                else:
+                    activity = parts[0] + ' ' + parts[1]
+                    main_obj_type = parts[2]
+
+        if parts[1] in action_label_set:
+            if is_dictionary_noun(parts[0]):
+                activity = parts[1] + ' ' + parts[2]
+                main_obj_type = parts[0]
+            elif is_dictionary_noun(parts[0]):
+                activity = parts[0] + ' ' + parts[1]
+                main_obj_type = parts[2]
+
+        if parts[2] in action_label_set:
+            if is_dictionary_noun(parts[0]):
+                if is_dictionary_noun(parts[1]):
+                    activity = parts[2]
+                    main_obj_type = parts[0] + ' ' + parts[1]
+                else:
+                    activity = parts[1] + ' ' + parts[2]
+                    main_obj_type = parts[0]
+
+        # else assume the activity comes first and is followed by the ui obj
+        else:
+            activity = parts[0] + ' ' + parts[1]
+            main_obj_type = parts[2]
+
+    return activity, main_obj_type
+
+
+def extract_activity(log, event_column_index, action_labels, number_of_parts=None):
     """
     Splits events into their activities and object types.
 
     :param log: A pandas DataFrame representing the UI log.
     :param event_column_index: Column index of the event column.
     :param action_labels: DataFrame with action labels.
+    :param number_of_parts: Optional maximum number of words per event. If not given, it is determined from the log,
+                                which is not possible if the log is only one chunk of a larger log.
     :return: Modified log with the event column split into an activity and a main ui object type column.
     """
     # rename column
     log.rename({event_column_index: "event"})
 
-    # split strings on whitespace and expand them into separate columns in a new df
-    split_results = log.iloc[:, event_column_index].str.split(' ').apply(pd.Series)
+    # events repeat a lot, so every distinct event is only split once, in the order of their first row; values that
+    # are not strings are not split, like missing values, and share the key None
+    events = [event if isinstance(event, str) else None for event in log.iloc[:, event_column_index].to_numpy(dtype=object)]
+    parts_per_event = {event: event.split(' ') if event is not None else [np.NaN] for event in dict.fromkeys(events)}
+
+    if number_of_parts is None:
+        number_of_parts = max((len(parts) for parts in parts_per_event.values()), default=1)
+
+    # events with less words than the longest one are filled up with np.NaN
+    for event, parts in parts_per_event.items():
+        parts_per_event[event] = (parts + [np.NaN] * number_of_parts)[:number_of_parts]
 
     # if there is only one word included, assume it is the activity
-    if len(split_results.columns) == 1:
-        log.insert(1, 'activity', split_results[0]) #figure our how to address tuple in list/col
+    if number_of_parts == 1:
+        log.insert(1, 'activity', pd.Series([parts_per_event[event][0] for event in events], index=log.index,
+                                             dtype=object))
 
-    elif len(split_results.columns) > 3:
+    elif number_of_parts > 3:
         raise ValueError("An event column should not have more than three words as a value. Please adjust your log.")
 
-    # if the event consists of only two parts assume the first word is the activity and the second one the object type
+    # decide once per distinct event which words are the activity and which are the object type
     else:
-        log.insert(1, 'activity', '')
-        log.insert(2, 'main ui object type', '')
-
-        for index, row in split_results.iterrows():
-            if len(split_results.columns) == 2:
-                if split_results.loc[index, 0] in action_labels['Action labels'].values:
-                    if is_dictionary_noun(split_results.loc[index, 1]):
-                        log.loc[index, 'activity'] = split_results.loc[index, 0]
-                        log.loc[index, 'main ui object type'] = split_results.loc[index, 1]
-                    # if no object is given
-                    elif not split_results.loc[index, 1]:
-                        log.loc[index, 'activity'] = split_results.loc[index, 0]
-                        log.loc[index, 'main ui object type'] = split_results.loc[index, 1]
-                    else:
-                        log.loc[index, 'activity'] = split_results.loc[index, 0] + ' ' + split_results.loc[
-                            index, 1]
-
-                elif split_results.loc[index, 1] in action_labels['Action labels'].values:
-                    if is_dictionary_noun(split_results.loc[index, 0]):
-                        log.loc[index, 'activity'] = split_results.loc[index, 1]
-                        log.loc[index, 'main ui object type'] = split_results.loc[index, 0]
-                    # if no object is given
-                    elif not split_results.loc[index, 0]:
-                        log.loc[index, 'activity'] = split_results.loc[index, 1]
-                        log.loc[index, 'main ui object type'] = split_results.loc[index, 0]
-                    else:
-                        log.loc[index, 'activity'] = split_results.loc[index, 1] + ' ' + split_results.loc[index, 0]
-                # else assume the activity comes first and is followed by the ui obj
-                else:
-                    log.loc[index, 'activity'] = split_results.loc[index, 0]
-                    log.loc[index, 'main ui object type'] = split_results.loc[index, 1]
-
-            elif len(split_results.columns) == 3:
-                if split_results.loc[index, 0] in action_labels['Action labels'].values:
-                    if is_dictionary_noun(split_results.loc[index, 2]):
-                        if is_dictionary_noun(split_results.loc[index, 1]):
-                            log.loc[index, 'activity'] = split_results.loc[index, 0]
-                            log.loc[index, 'main ui object type'] = split_results.loc[index, 1] + ' ' + split_results.loc[index, 2]
-                        else:
-                            log.loc[index, 'activity'] = split_results.loc[index, 0] + ' ' + split_results.loc[index, 1]
-                            log.loc[index, 'main ui object type'] = split_results.loc[index, 2]
-
-                if split_results.loc[index, 1] in action_labels['Action labels'].values:
-                    if is_dictionary_noun(split_results.loc[index, 0]):
-                        log.loc[index, 'activity'] = split_results.loc[index, 1] + ' ' + split_results.loc[index, 2]
-                        log.loc[index, 'main ui object type'] = split_results.loc[index, 0]
-                    elif is_dictionary_noun(split_results.loc[index, 0]):
-                        log.loc[index, 'activity'] = split_results.loc[index, 0] + ' ' + split_results.loc[index, 1]
-                        log.loc[index, 'main ui object type'] = split_results.loc[index, 2]
-
-                if split_results.loc[index, 2] in action_labels['Action labels'].values:
-                    if is_dictionary_noun(split_results.loc[index, 0]):
-                        if is_dictionary_noun(split_results.loc[index, 1]):
-                            log.loc[index, 'activity'] = split_results.loc[index, 2]
-                            log.loc[index, 'main ui object type'] = split_results.loc[index, 0] + ' ' + split_results.loc[index, 1]
-                        else:
-                            log.loc[index, 'activity'] = split_results.loc[index, 1] + ' ' + split_results.loc[index, 2]
-                            log.loc[index, 'main ui object type'] = split_results.loc[index, 0]
+        action_label_set = frozenset(action_labels['Action labels'].dropna())
+        split_per_event = {event: split_event(parts, action_label_set) for event, parts in parts_per_event.items()}
 
-                # else assume the activity comes first and is followed by the ui obj
-                else:
-                    log.loc[index, 'activity'] = split_results.loc[index, 0] + ' ' + split_results.loc[index, 1]
-                    log.loc[index, 'main ui object type'] = split_results.loc[index, 2]
+        log.insert(1, 'activity', pd.Series([split_per_event[event][0] for event in events], index=log.index,
+                                            dtype=object))
+        log.insert(2, 'main ui object type', pd.Series([split_per_event[event][1] for event in events],
+                                                       index=log.index, dtype=object))
 
     # drop the original event_column
     log = log.drop('event', axis=1)
@@ -452,46 +948,6 @@ def extract_activity(log, event_column_index, action_labels):
     return log
 
 
-def get_column_completeness(log, threshold_compl):
-    """
-    Determines the completeness of the log per column and saves columns passing the set threshold in a dictionary.
-    :param log: A pandas DataFrame representing the UI log.
-    :param threshold_compl: A float indicating the threshold value for the completeness-ratio.
-    :return: A dictionary holding the completeness-ratio of the log per column for the columns passing the set threshold.
-    """
-    # dictionary to save columns with a high completeness rate
-    col_compl_dict = {}
-
-    for index, column in enumerate(log.columns):
-        non_nan_values = log[column].count() # number of non-NaN values per column
-        row_count = len(log) # number of rows in the log
-        ratio = non_nan_values / row_count
-
-        # if threshold fulfilled, add column index and the ration to the dictionary
-        if ratio >= threshold_compl:
-            col_compl_dict.setdefault(index, ratio)
-
-    return col_compl_dict
-
-
-def find_constant_columns(log):
-    """
-    Identifies constant columns in the log.
-    Constant columns are columns that have the same value in every row.
-    :param log: A pandas DataFrame representing the UI log.
-    :return: A list of column indices, where the columns are constant.
-    """
-    constant_columns = []
-
-    for column in log.columns:
-        # check if a column has only one unique value
-        if len(log[column].unique()) == 1:
-            col_index = log.columns.get_loc(column)
-            constant_columns.append(col_index)
-
-    return constant_columns
-
-
 def find_user_related_cols(log):
     """
     Finds columns that have 'user' in their title.
@@ -618,31 +1074,82 @@ def rearrange_col_type_dicts(header_obj_types, header_obj_type_from_att_type, co
     return ui_obj_att_cols, column_indices, header_obj_type_from_att_type
 
 
-def check_for_regex(log, regex):
+class RegexScanner:
     """
-    Recognizes values that follow a certain regex structure.
-
-    :param log: A pandas DataFrame representing the UI log.
-    :param regex: A regular expression representing a specific pattern
-    :return: A dictionary storing the number of values per column that match the regex pattern.
+    Counts the values per column that follow one of several regex structures in a single pass over the unique values
+    of each column.
     """
-    # create a dictionary to store the number of values per column that match the regex pattern
-    match_count_dictionary = {}
+    def __init__(self, regex_dictionary=None):
+        """
+        :param regex_dictionary: An optional dictionary mapping names to regular expressions that are registered.
+        """
+        self.patterns = {}  # name -> compiled regular expression
+
+        if regex_dictionary is not None:
+            for name, regex in regex_dictionary.items():
+                self.register(name, regex)
+
+    def register(self, name, regex):
+        """
+        Registers a regular expression, so it is checked by every following scan.
 
-    for column, row in log.items():
-        count = 0 # count variable to count how many values match the regex
+        :param name: A string naming the regular expression in the scan results.
+        :param regex: A regular expression representing a specific pattern.
+        """
+        self.patterns[name] = re.compile(regex)
 
-        for value in row:
-            if re.fullmatch(regex, str(value)):
-                count += 1
+    def count_matches(self, value_counts, names=None):
+        """
+        Counts the values of one column that match the registered regular expressions.
 
-        column_index = log.columns.get_loc(column) # get the columns index
+        :param value_counts: An iterable of the column's unique values and how often they occur.
+        :param names: An optional list with the names of the regular expressions to check. By default, all registered
+                        regular expressions are checked.
+        :return: A dictionary with the number of matching values per name of a regular expression.
+        """
+        if names is None:
+            names = list(self.patterns)
+        counts = dict.fromkeys(names, 0)
 
-        # add values to the dictionary
-        if count != 0:
-            match_count_dictionary.setdefault(column_index, count)
+        for value, count in value_counts:
+            value = str(value)
+            for name in names:
+                if self.patterns[name].fullmatch(value):
+                    counts[name] += count
 
-    return match_count_dictionary
+        return counts
+
+    def scan_profiles(self, profiles):
+        """
+        Checks the values of profiled columns for all registered regular expressions. The match counts are saved in the
+        profiles, so every regular expression is checked only once per profile.
+
+        :param profiles: A list with the ColumnProfile of each column.
+        :return: A dictionary with a match count dictionary per name of a regular expression.
+        """
+        for profile in profiles:
+            names = [name for name in self.patterns if name not in profile.regex_match_counts]
+            if names:
+                profile.regex_match_counts.update(self.count_matches(profile.items(), names))
+
+        return self.get_match_count_dictionaries(profile.regex_match_counts for profile in profiles)
+
+    def get_match_count_dictionaries(self, counts_per_column):
+        """
+        Combines the match counts of the columns into one match count dictionary per regular expression.
+
+        :param counts_per_column: An iterable with a dictionary of the match counts of each column.
+        :return: A dictionary with a match count dictionary per name of a regular expression.
+        """
+        match_count_dictionaries = {name: {} for name in self.patterns}
+
+        for column_index, counts in enumerate(counts_per_column):
+            # add values to the dictionaries
+            for name in self.patterns:
+                if counts[name] != 0:
+                    match_count_dictionaries[name].setdefault(column_index, counts[name])
+
+        return match_count_dictionaries
 
 
 def rename_timestamp_col(log, column_type_dictionary):
@@ -942,98 +1449,232 @@ def get_potential_process_obj_cols(cont_att_cols, url_match_count_dictionary):
     return pot_process_obj_cols
 
 
-def create_new_row_process_obj_df(log, obj_type, log_row_index, obj_inst, process_obj_df, user_cols=None):
+def create_new_row_process_obj_df(log_arrays, obj_type, log_row_index, obj_inst, process_obj_records, user_cols=None):
     """
-    Adds a new row to the input DataFrame and populates it with input values.
-    It also adds additional columns to the df if they don't exist, assigns attribute values to the corresponding columns,
-    and removes the values from the log.
+    Adds a new row to the process object records and populates it with input values.
+    It also adds additional columns to the records if they don't exist, assigns attribute values to the corresponding
+    columns, and removes the values from the log.
 
-    :param log: A pandas DataFrame representing the UI log.
+    :param log_arrays: LogArrays holding the values of the UI log. It is only read if user_cols are given.
     :param obj_type: String with the object type.
     :param log_row_index: Row index of the log.
-    :param obj_inst: String with the object instance.
-    :param process_obj_df: DataFrame including object instances other than the main object instances.
+    :param obj_inst: Integer identifying the object instance.
+    :param process_obj_records: RecordBuffer collecting the rows of the process_obj_df.
     :param user_cols: Optional dictionary with indices of the attribute columns that are user-related and the column titles.
-    :return: Tuple of the modified df, log, and lists of columns in the df that are of type value and context attribute.
+    :return: Tuple of the modified records and LogArrays.
     """
-    # get index of the new row
-    new_row_index = len(process_obj_df)
-
-    process_obj_df.at[new_row_index, 'row index'] = log_row_index
-    process_obj_df.at[new_row_index, 'object instance'] = obj_inst
-    process_obj_df.at[new_row_index, 'object type'] = obj_type
+    record = {'row index': log_row_index, 'object instance': obj_inst, 'object type': obj_type}
 
     if user_cols is not None:
         for log_col_index in user_cols.keys():
-            column_title = log.columns[log_col_index]
-            attribute_value = log.iloc[log_row_index, log_col_index]
-            # if the column title does not exist in the df, add it
-            if column_title not in process_obj_df.columns:
-                process_obj_df[column_title] = None
+            column_title = log_arrays.columns[log_col_index]
+            # add the value to the record; if the column title does not exist in the records, it is added
+            record[column_title] = log_arrays.get_value(log_row_index, log_col_index)
+
+            # mark the value to be removed from the log
+            process_obj_records.remove_from_log(log_row_index, log_col_index)
 
-            # add the value to the df
-            process_obj_df.at[new_row_index, column_title] = attribute_value
+    process_obj_records.append(record)
 
-            # remove the value from the log
-            log.iloc[log_row_index, log_col_index] = np.NaN
+    return process_obj_records, log_arrays
 
-    return process_obj_df, log
 
+# lemmatizer shared by all noun checks of context attribute values if the noun lexicon has not been built
+lemmatizer = nltk.stem.WordNetLemmatizer()
+
+
+@functools.lru_cache(maxsize=65536)
+def is_noun_value(value):
+    """
+    Checks whether a context attribute value is a noun once its words are separated and lemmatized.
+
+    :param value: A string with the value without leading or trailing whitespace.
+    :return: A boolean indicating whether the lemmatized value is a noun.
+    """
+    # regex that recognized camel case
+    camel_underscore_regex = '(?<=[a-z])(?=[A-Z])|(?<![A-Z])(?=[A-Z][a-z])|(?<=[A-Za-z])(?=[0-9]|[_]|[.]|[-])'
+
+    term = [word for word in re.split(camel_underscore_regex, value)]
+    new_value = " ".join(term).lower()
+
+    stem_value = lemmatize_noun(new_value)
+
+    return is_dictionary_noun(stem_value)
+
+
+# file holding the WordNet nouns, so noun checks do not need to load WordNet; created by build_noun_lexicon
+noun_lexicon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources', 'noun_lexicon.pkl')
+
+
+@functools.lru_cache(maxsize=65536)
 def is_dictionary_noun(word):
     """
+    Checks whether a word is a noun according to WordNet.
+
+    If the noun lexicon has been built with build_noun_lexicon, it is used instead of WordNet, so the WordNet corpus
+    does not have to be loaded. The results are memoized, since the same words are checked for many rows.
 
-    :param word:
-    :return:
+    :param word: A string with the word.
+    :return: A boolean indicating whether WordNet knows the word as a noun.
     """
-    synsets = wordnet.synsets(word)
+    lexicon = load_noun_lexicon()
+
+    if lexicon is None:
+        synsets = wordnet.synsets(word)
 
-    return any(synset.pos() in ['n', 'N'] for synset in synsets)
+        return any(synset.pos() in ['n', 'N'] for synset in synsets)
+
+    return len(get_noun_lemmas(word.lower(), lexicon)) > 0
+
+
+@functools.lru_cache(maxsize=65536)
+def lemmatize_noun(word):
+    """
+    Lemmatizes a word as a noun like nltk's WordNetLemmatizer, e.g., 'buttons' becomes 'button'.
+
+    If the noun lexicon has been built with build_noun_lexicon, it is used instead of WordNet, so the WordNet corpus
+    does not have to be loaded.
+
+    :param word: A string with the word.
+    :return: A string with the shortest noun lemma of the word, or the word itself if WordNet does not know it.
+    """
+    lexicon = load_noun_lexicon()
+
+    if lexicon is None:
+        return lemmatizer.lemmatize(word)
+
+    lemmas = get_noun_lemmas(word, lexicon)
+
+    return min(lemmas, key=len) if lemmas else word
+
+
+def get_noun_lemmas(form, lexicon):
+    """
+    Finds the noun lemmas of a word form in the noun lexicon the way WordNet's morphy does.
+
+    Irregular forms are looked up in the exceptions. Regular ones are detached from their endings by applying the
+    substitutions, first once, and then repeatedly until a lemma is found.
+
+    :param form: A string with the word form.
+    :param lexicon: A tuple of the noun lemmas, the irregular noun forms, and the noun substitution rules.
+    :return: A list with the noun lemmas of the word form in the order WordNet finds them.
+    """
+    lemmas, exceptions, substitutions = lexicon
+
+    def apply_substitutions(forms):
+        return [form[:-len(old)] + new for form in forms for old, new in substitutions if form.endswith(old)]
+
+    def get_known_forms(forms):
+        # keep the forms that are noun lemmas, each one once
+        return list(dict.fromkeys(form for form in forms if form in lemmas))
+
+    if form in exceptions:
+        return get_known_forms([form] + exceptions[form])
+
+    forms = apply_substitutions([form])
+    known_forms = get_known_forms([form] + forms)
+    while not known_forms and forms:
+        forms = apply_substitutions(forms)
+        known_forms = get_known_forms(forms)
+
+    return known_forms
+
+
+def build_noun_lexicon():
+    """
+    Extracts the noun lemmas, the irregular noun forms, and the noun substitution rules from WordNet and saves them in
+    'noun_lexicon.pkl' in the 'resources' folder, where load_noun_lexicon reads them, so is_dictionary_noun can check
+    words with set lookups instead of loading WordNet.
+    """
+    lemmas = frozenset(wordnet.all_lemma_names(pos='n'))
+
+    # irregular forms are listed with their lemmas, one form per line
+    exceptions = {}
+    with wordnet.open('noun.exc') as f:
+        for line in f:
+            terms = line.split()
+            exceptions[terms[0]] = terms[1:]
+
+    substitutions = list(wordnet.MORPHOLOGICAL_SUBSTITUTIONS['n'])
+
+    with open(noun_lexicon_path, 'wb') as f:
+        pickle.dump((lemmas, exceptions, substitutions), f, protocol=5)
+
+    # forget the lexicon and the memoized results of a previous lexicon
+    load_noun_lexicon.cache_clear()
+    is_dictionary_noun.cache_clear()
+    lemmatize_noun.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def load_noun_lexicon():
+    """
+    Loads the noun lexicon created by build_noun_lexicon.
+
+    :return: A tuple of the noun lemmas, the irregular noun forms, and the noun substitution rules, or None if the
+                lexicon has not been built.
+    """
+    if not os.path.exists(noun_lexicon_path):
+        return None
+
+    try:
+        with open(noun_lexicon_path, 'rb') as f:
+            return pickle.load(f)
+    # a damaged lexicon is treated like a missing one
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
 
 
 # find process object types in the log; only the context attribute columns are interesting here
-def find_process_objects(log, cont_att_cols, process_obj_df, excluded_words):
+def find_process_objects(log, cont_att_cols, process_obj_records, excluded_words, state=None):
     """
     Recognizes process objects in the log.
 
     :param excluded_words:
     :param log: A pandas DataFrame representing the UI log.
     :param cont_att_cols: List of columns of type context attribute.
-    :param process_obj_df: A pandas DataFrame for the process objects found in the log.
-    :return: A dictionary with row indices as keys and a list of process objects included in that row as values.
+    :param process_obj_records: RecordBuffer collecting the rows of the process_obj_df.
+    :param state: Optional RecognitionState of the previous chunks, if the log is processed in chunks.
+    :return: The RecordBuffer with a row for every process object found in a row of the log.
     """
-    # regex that recognized camel case
-    camel_underscore_regex = '(?<=[a-z])(?=[A-Z])|(?<![A-Z])(?=[A-Z][a-z])|(?<=[A-Za-z])(?=[0-9]|[_]|[.]|[-])'
+    # process objects already found in previous chunks keep their instance
+    process_obj_inst_dict = state.process_obj_value_inst_dict if state is not None else {}
 
-    process_obj_inst_dict = {}
+    # the values are taken from a copy, so removing process objects from the log does not affect the loop
+    cont_att_values = log.iloc[:, cont_att_cols].to_numpy(dtype=object)
 
-    for row_index, row in log.iloc[:, cont_att_cols].iterrows():
+    # classify every distinct value only once; values are compared without leading or trailing whitespace
+    process_obj_values = set()
+    for value in pd.unique(cont_att_values.ravel()):
+        if not pd.isna(value):
+            value = str(value).strip()
+            if value not in excluded_words and is_noun_value(value):
+                process_obj_values.add(value)
+
+    for position, row_index in enumerate(log.index):
         # list for the ui objects
         process_obj_list = []
 
         # loop over column values
-        for col_name, value in row.items():
+        for value in cont_att_values[position]:
 
             if pd.isna(value):
                 break
-            else:
-                value = str(value).strip() # unify the string format first
-                term = [word for word in re.split(camel_underscore_regex, value)]
-                new_value = " ".join(term).lower()
-                str(new_value).strip()
 
-            stem_value = nltk.stem.WordNetLemmatizer().lemmatize(str(new_value))
+            value = str(value).strip() # unify the string format first
 
-            if is_dictionary_noun(stem_value) and value not in excluded_words:
+            if value in process_obj_values:
                 if value not in process_obj_list:
                     process_obj_list.append(value)
-                    process_obj_inst_dict.setdefault(value, f'{value}_{counter.get_next_count(value)}')
+                    process_obj_inst_dict.setdefault(value, counter.get_next_instance(value))
 
         for process_obj in process_obj_list:
             process_obj_inst = process_obj_inst_dict[process_obj]
-            # call function to create a new row in the process_obj_df
-            process_obj_df, log = create_new_row_process_obj_df(log, process_obj, row_index, process_obj_inst, process_obj_df)
+            # call function to create a new row in the process_obj_df; no values are read from the log here
+            process_obj_records, _ = create_new_row_process_obj_df(None, process_obj, row_index, process_obj_inst,
+                                                                   process_obj_records)
 
-    return process_obj_df
+    return process_obj_records
 
 
 def combine_ui_obj_type_dicts(ui_obj_att_cols, att_cols_obj_unclear):
@@ -1124,6 +1765,207 @@ def categorize_other_ui_obj(other_ui_obj_cols, object_hierarchy):
 
 
 # <editor-fold desc="2. Object Recognition">
+class RecognitionState:
+    """
+    Keeps the state of the object recognition that has to be carried over from one chunk of a log to the next one.
+    """
+    def __init__(self):
+        self.object_instances_dict = {}  # ui object instances and their unique identifiers
+        self.process_obj_inst_dict = {}  # user-related process object instances and their unique identifiers
+        self.process_obj_value_inst_dict = {}  # process objects found in the values and their instances
+        self.part_of = None  # higher object instance the last other ui object instance belongs to
+
+        # last seen object instance of each object hierarchy and their row
+        self.last_app_inst = []
+        self.last_web_inst = []
+        self.last_second_obj_inst = []
+        self.last_third_obj_inst = []
+        self.last_fourth_obj_inst = []
+
+        # the columns of the object dfs are kept, so the attribute columns have the same position in every chunk
+        self.other_ui_obj_df_columns = ['row index', 'object instance', 'object type', 'part of']
+        self.other_ui_obj_df_val_att_cols = []
+        self.other_ui_obj_df_cont_att_cols = []
+        self.process_obj_df_columns = ['row index', 'object instance', 'object type']
+
+    def shift_rows(self, row_count):
+        """
+        Moves the rows of the last seen object instances in front of the next chunk, so they are not mistaken for
+        rows of the next chunk, which starts counting at 0 again.
+
+        :param row_count: Number of rows of the chunk that has just been processed.
+        """
+        self.last_app_inst = [self.last_app_inst[0], self.last_app_inst[1] - row_count] if self.last_app_inst else []
+        self.last_web_inst = [self.last_web_inst[0], self.last_web_inst[1] - row_count] if self.last_web_inst else []
+        self.last_second_obj_inst = [self.last_second_obj_inst[0], self.last_second_obj_inst[1] - row_count] \
+            if self.last_second_obj_inst else []
+        self.last_third_obj_inst = [self.last_third_obj_inst[0], self.last_third_obj_inst[1] - row_count] \
+            if self.last_third_obj_inst else []
+        self.last_fourth_obj_inst = [self.last_fourth_obj_inst[0], self.last_fourth_obj_inst[1] - row_count] \
+            if self.last_fourth_obj_inst else []
+
+
+class RecordBuffer:
+    """
+    Collects the rows of an object df column by column, so the df is created once at the end instead of being enlarged
+    row by row.
+    """
+    def __init__(self, columns):
+        """
+        :param columns: A list with the column titles the df starts with.
+        """
+        self.columns = list(columns)
+        self.values = {column: [] for column in self.columns}  # column title -> values of the rows added so far
+        self.row_count = 0
+        self.removed_log_cells = {}  # log column index -> log row indices of the values moved to the records
+
+    def __len__(self):
+        return self.row_count
+
+    def add_column(self, column):
+        """
+        Adds a column if it does not exist yet. The rows added so far get None as value.
+
+        :param column: A string with the column title.
+        """
+        if column not in self.values:
+            self.columns.append(column)
+            self.values[column] = [None] * self.row_count
+
+    def append(self, record):
+        """
+        Adds a row. Columns that do not exist yet are added first, columns missing in the record get np.NaN as value.
+
+        :param record: A dictionary mapping column titles to the values of the row.
+        """
+        for column in record:
+            self.add_column(column)
+
+        for column in self.columns:
+            self.values[column].append(record.get(column, np.NaN))
+
+        self.row_count += 1
+
+    def remove_from_log(self, log_row_index, log_col_index):
+        """
+        Marks a log value as moved to the records. The values are removed from the log all at once by
+        remove_values_from_log.
+
+        :param log_row_index: Row index of the log.
+        :param log_col_index: Column index of the log.
+        """
+        self.removed_log_cells.setdefault(log_col_index, []).append(log_row_index)
+
+    def remove_values_from_log(self, log):
+        """
+        Removes the values marked by remove_from_log from the log.
+
+        :param log: A pandas DataFrame representing the UI log.
+        :return: The modified log.
+        """
+        for log_col_index, log_row_indices in self.removed_log_cells.items():
+            # like LogArrays.set_value, a categorical column is decoded before it is written to, so a column that has
+            # been emptied gets the same dtype from unify_nan_values as an object column
+            column = log.iloc[:, log_col_index]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                log.isetitem(log_col_index, column.astype(object))
+            log.iloc[log_row_indices, log_col_index] = np.NaN
+        self.removed_log_cells = {}
+
+        return log
+
+    def to_dataframe(self):
+        """
+        :return: A pandas DataFrame with the rows added so far.
+        """
+        return pd.DataFrame(self.values, columns=self.columns, dtype=object)
+
+
+class LogArrays:
+    """
+    Holds the values of a log in one NumPy array per column, so the object recognition can read and write single cells
+    without the indexing overhead of pandas. Categorical columns are kept as their integer codes and categories, and a
+    value is only looked up when its cell is read. The written columns are put back into the log at once by
+    write_to_log.
+    """
+    def __init__(self, log):
+        """
+        :param log: A pandas DataFrame representing the UI log with a RangeIndex starting at 0.
+        """
+        self.columns = log.columns
+        self.values = []  # values per column, or codes for categorical columns
+        self.categories = []  # categories per categorical column, None for the other columns
+        for col_index in range(len(self.columns)):
+            column = log.iloc[:, col_index]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                # missing values have the code -1, so the np.NaN object is added as the last category
+                categories = np.empty(len(column.cat.categories) + 1, dtype=object)
+                categories[:-1] = column.cat.categories.to_numpy(dtype=object)
+                categories[-1] = np.NaN
+                self.values.append(column.cat.codes.to_numpy())
+                self.categories.append(categories)
+            else:
+                # the copy keeps the objects of object columns, so missing values are still the np.NaN object
+                self.values.append(column.to_numpy(dtype=object, copy=True))
+                self.categories.append(None)
+        self.availability = get_value_availability(log)  # whether a value is given in a cell
+        self.col_indices = {column: col_index for col_index, column in enumerate(self.columns)}
+        self.written_col_indices = set()  # indices of the columns that have been written to
+
+    def get_value(self, row_index, col_index):
+        """
+        Reads the value of a cell.
+
+        :param row_index: Row index of the log.
+        :param col_index: Column index of the log.
+        :return: The value of the cell; missing values of categorical columns are the np.NaN object.
+        """
+        categories = self.categories[col_index]
+        if categories is None:
+            return self.values[col_index][row_index]
+        return categories[self.values[col_index][row_index]]
+
+    def get_column_values(self, col_index):
+        """
+        Reads all values of a column.
+
+        :param col_index: Column index of the log.
+        :return: A NumPy object array with the values of the column.
+        """
+        categories = self.categories[col_index]
+        if categories is None:
+            return self.values[col_index]
+        return categories.take(self.values[col_index])
+
+    def set_value(self, row_index, column, value):
+        """
+        Writes a value into a cell.
+
+        :param row_index: Row index of the log.
+        :param column: A string with the column title.
+        :param value: The value to write.
+        """
+        col_index = self.col_indices[column]
+        if self.categories[col_index] is not None:
+            # a categorical column that is written to is decoded first, since the value might not be a category
+            self.values[col_index] = self.get_column_values(col_index)
+            self.categories[col_index] = None
+        self.values[col_index][row_index] = value
+        self.written_col_indices.add(col_index)
+
+    def write_to_log(self, log):
+        """
+        Puts the columns that have been written to back into the log.
+
+        :param log: The pandas DataFrame the LogArrays have been created from.
+        :return: The modified log.
+        """
+        for col_index in sorted(self.written_col_indices):
+            log[self.columns[col_index]] = pd.Series(self.values[col_index], index=log.index, dtype=object)
+
+        return log
+
+
 def find_matching_pairs(dictionary):
     """
      Finds matching keys based on their corresponding values in the input dictionary and returns a dictionary
@@ -1193,11 +2035,33 @@ def determine_hierarchy_level(object_type, object_hierarchy):
     return obj_level
 
 
-def check_value_availability(log, dictionary, row_index):
+def get_value_availability(log):
     """
-    Checks if values from the input dictionary are given in the respective cell of the input log.
+    Determines for every cell of the log whether a value is given, like check_value_availability does for single cells.
 
     :param log: A pandas DataFrame representing the UI log.
+    :return: A NumPy boolean array with a row for every row and a column for every column of the log.
+    """
+    availability = np.ones(log.shape, dtype=bool)
+
+    for col_index in range(log.shape[1]):
+        column = log.iloc[:, col_index]
+        # cells are compared with the np.NaN object; the values of columns that do not hold objects are converted to
+        # new objects when a row is read, so they are never np.NaN
+        if column.dtype == object:
+            availability[:, col_index] = [value is not np.NaN for value in column.to_numpy()]
+        # encoded columns are read like object columns, their missing values have the code -1
+        elif isinstance(column.dtype, pd.CategoricalDtype):
+            availability[:, col_index] = column.cat.codes.to_numpy() != -1
+
+    return availability
+
+
+def check_value_availability(log_arrays, dictionary, row_index):
+    """
+    Checks if values from the input dictionary are given in the respective cell of the input log.
+
+    :param log_arrays: LogArrays holding the values of the UI log.
     :param dictionary: A dictionary with object types as keys and column indices as values.
     :param row_index: Row index of the input log.
     :return: A dictionary with object types available in the log as keys and their column indices in the log as values.
@@ -1206,10 +2070,7 @@ def check_value_availability(log, dictionary, row_index):
     available_obj = {}
 
     for obj_type, col_indices in dictionary.items():
-        col_index_list = []
-        for col_index in col_indices:
-            if log.iloc[row_index][col_index] is not np.NaN:
-                col_index_list.append(col_index)
+        col_index_list = [col_index for col_index in col_indices if log_arrays.availability[row_index, col_index]]
 
         if col_index_list:
             available_obj.setdefault(obj_type, col_index_list)
@@ -1217,11 +2078,11 @@ def check_value_availability(log, dictionary, row_index):
     return available_obj
 
 
-def get_attribute_values(log, row_index, combined_att_list, val_att_cols, cont_att_cols):
+def get_attribute_values(log_arrays, row_index, combined_att_list, val_att_cols, cont_att_cols):
     """
     Saves attribute combination needed to identify object instances in a list.
 
-    :param log: A pandas DataFrame representing the UI log.
+    :param log_arrays: LogArrays holding the values of the UI log.
     :param row_index: Row index of the input log.
     :param combined_att_list: List with column indices indicating relevant attribute columns.
     :param val_att_cols: List of columns of type value attribute.
@@ -1239,28 +2100,28 @@ def get_attribute_values(log, row_index, combined_att_list, val_att_cols, cont_a
     # append the values to the lists accordingly
     for col_index in combined_att_list:
 
-        cell_value = log.iloc[row_index, col_index]
+        cell_value = log_arrays.get_value(row_index, col_index)
 
         # for the context attribute columns save the column value in the list
         if col_index in cont_att_cols and not pd.isna(cell_value):
-            att_list.append(log.iloc[row_index, col_index])
+            att_list.append(cell_value)
             att_col_indices_list.append(col_index)
 
         # for the value attribute columns save the column title in the list
         elif col_index in val_att_cols and not pd.isna(cell_value):
-            att_list.append(log.columns[col_index])
+            att_list.append(log_arrays.columns[col_index])
             att_col_indices_list.append(col_index)
 
     return att_list, att_col_indices_list
 
 
-def add_higher_hierarchy_instances(log, object_type, att_list, row_index, obj_level, last_web_inst, last_app_inst, last_second_obj_inst,
+def add_higher_hierarchy_instances(log_arrays, object_type, att_list, row_index, obj_level, last_web_inst, last_app_inst, last_second_obj_inst,
                                    last_third_obj_inst, obj_is_main, part_of=None):
     """
     Adds object instances of higher hierarchy levels to the attribute combination, so the object instance can be determined.
 
     :param object_type: String with the object type.
-    :param log: A pandas DataFrame representing the UI log.
+    :param log_arrays: LogArrays holding the values of the UI log.
     :param att_list: A list with the attribute combination needed to identify object instances.
     :param row_index: Row index of the input log.
     :param obj_level:  A string indicating one of four UI object hierarchy levels ('obj_highest_level',
@@ -1274,7 +2135,7 @@ def add_higher_hierarchy_instances(log, object_type, att_list, row_index, obj_le
                     This parameter is only given for UI object types other than the main UI object type of the row.
     :return: A tuple of a string with the last mentioned next higher object instance (optional),
                 a list with the attribute combination needed to identify object instances, and
-                the modified log with the part_of-column filled.
+                the LogArrays with the part_of-column filled.
     """
     # only add higher levels to the list, if there are already attributes in the list
     if att_list:
@@ -1287,25 +2148,25 @@ def add_higher_hierarchy_instances(log, object_type, att_list, row_index, obj_le
                     # check if last_app_inst exists and if it is in the same row
                     if last_app_inst:
                         if row_index == last_app_inst[1]:
-                            log.loc[row_index, 'related ui object'] = last_app_inst[0]
+                            log_arrays.set_value(row_index, 'related ui object', last_app_inst[0])
 
                 elif object_type == 'application':
                     # check if last_web_inst exists and if it is in the same row
                     if last_web_inst:
                         if row_index == last_web_inst[1]:
-                            log.loc[row_index, 'related ui object'] = last_web_inst[0]
+                            log_arrays.set_value(row_index, 'related ui object', last_web_inst[0])
 
         elif obj_level == 'obj_second_level' or obj_level == 'obj_third_level':
             # if list is not empty, append the object instance included in it
             if last_app_inst:
                 att_list.append(last_app_inst[0])
                 if obj_is_main is True:
-                    log.loc[row_index, 'part of'] = last_app_inst[0]
+                    log_arrays.set_value(row_index, 'part of', last_app_inst[0])
 
                     # check if last_web_inst exists and if it is in the same row
                     if last_web_inst:
                         if row_index == last_web_inst[1]:
-                            log.loc[row_index, 'related ui object'] = last_web_inst[0]
+                            log_arrays.set_value(row_index, 'related ui object', last_web_inst[0])
                 else:
                     part_of = last_app_inst[0]
 
@@ -1314,12 +2175,12 @@ def add_higher_hierarchy_instances(log, object_type, att_list, row_index, obj_le
                 if last_second_obj_inst:
                     att_list.append(last_second_obj_inst[0])
                     if obj_is_main is True:
-                        log.loc[row_index, 'part of'] = last_second_obj_inst[0]
+                        log_arrays.set_value(row_index, 'part of', last_second_obj_inst[0])
 
                         # check if last_web_inst exists and if it is in the same row
                         if last_web_inst:
                             if row_index == last_web_inst[1]:
-                                log.loc[row_index, 'related ui object'] = last_web_inst[0]
+                                log_arrays.set_value(row_index, 'related ui object', last_web_inst[0])
                     else:
                         part_of = last_second_obj_inst[0]
 
@@ -1335,12 +2196,12 @@ def add_higher_hierarchy_instances(log, object_type, att_list, row_index, obj_le
 
                     att_list.append(last_third_obj_inst[0])
                     if obj_is_main:
-                        log.loc[row_index, 'part of'] = last_third_obj_inst[0]
+                        log_arrays.set_value(row_index, 'part of', last_third_obj_inst[0])
 
                         # check if last_web_inst exists and if it is in the same row
                         if last_web_inst:
                             if row_index == last_web_inst[1]:
-                                log.loc[row_index, 'related ui object'] = last_web_inst[0]
+                                log_arrays.set_value(row_index, 'related ui object', last_web_inst[0])
                     else:
                         part_of = last_third_obj_inst[0]
 
@@ -1349,12 +2210,12 @@ def add_higher_hierarchy_instances(log, object_type, att_list, row_index, obj_le
                     if last_web_inst:
                         att_list.append(last_web_inst[0])
                         if obj_is_main:
-                            log.loc[row_index, 'part of'] = last_web_inst[0]
+                            log_arrays.set_value(row_index, 'part of', last_web_inst[0])
 
                             # check if last_app_insts exist and if it is in the same row
                             if last_app_inst:
                                 if row_index == last_app_inst[1]:
-                                    log.loc[row_index, 'related ui object'] = last_app_inst[0]
+                                    log_arrays.set_value(row_index, 'related ui object', last_app_inst[0])
                         else:
                             part_of = last_web_inst[0]
 
@@ -1363,31 +2224,31 @@ def add_higher_hierarchy_instances(log, object_type, att_list, row_index, obj_le
                 if last_web_inst:
                     att_list.append(last_web_inst[0])
                     if obj_is_main:
-                        log.loc[row_index, 'part of'] = last_web_inst[0]
+                        log_arrays.set_value(row_index, 'part of', last_web_inst[0])
 
                         # check if last_app_inst exists and if it is in the same row
                         if last_app_inst:
                             if row_index == last_app_inst[1]:
-                                log.loc[row_index, 'related ui object'] = last_app_inst[0]
+                                log_arrays.set_value(row_index, 'related ui object', last_app_inst[0])
                     else:
                         part_of = last_web_inst[0]
 
                 # if no website is available, then have application as highest level
                 else:
                     if obj_is_main:
-                        log.loc[row_index, 'part of'] = last_app_inst[0]
+                        log_arrays.set_value(row_index, 'part of', last_app_inst[0])
 
                         # check if last_web_inst exists and if it is in the same row
                         if last_web_inst:
                             if row_index == last_web_inst[1]:
-                                log.loc[row_index, 'related ui object'] = last_web_inst[0]
+                                log_arrays.set_value(row_index, 'related ui object', last_web_inst[0])
                     else:
                         part_of = last_app_inst[0]
 
     if obj_is_main is True:
-        return att_list, log
+        return att_list, log_arrays
     else:
-        return part_of, att_list, log
+        return part_of, att_list, log_arrays
 
 
 def  get_relevant_att_cols(local_other_ui_obj_cols, unmatched_att_list, value_term):
@@ -1408,9 +2269,11 @@ def  get_relevant_att_cols(local_other_ui_obj_cols, unmatched_att_list, value_te
         if str(value_term) in obj_val:
             relevant_cols.append(index)
 
-    # remove column indices from the dictionary because they have already been considered
-    for index in relevant_cols:
-        local_other_ui_obj_cols.pop(index, None)
+    # remove column indices from the dictionary because they have already been considered; the dictionary is shared
+    # by all rows, so a changed copy is returned instead of changing it
+    if relevant_cols:
+        local_other_ui_obj_cols = {index: obj_val for index, obj_val in local_other_ui_obj_cols.items()
+                                   if index not in relevant_cols}
 
     # combine the lists relevant to determine the ui object instance
     combined_att_list = unmatched_att_list + relevant_cols
@@ -1436,13 +2299,13 @@ def generate_key(att_list, object_instances_dict, value):
     if len(att_list) > 1:
         att_combi = tuple(att_list)
         if att_combi not in object_instances_dict:
-            object_instances_dict.setdefault(att_combi, f'{value}_{counter.get_next_count(value)}')
+            object_instances_dict.setdefault(att_combi, counter.get_next_instance(value))
         obj_inst = object_instances_dict[att_combi]
 
     elif len(att_list) == 1:
         att_val = att_list[0]
         if att_val not in object_instances_dict and att_val is not np.NaN:
-            object_instances_dict.setdefault(att_val, f'{value}_{counter.get_next_count(value)}')
+            object_instances_dict.setdefault(att_val, counter.get_next_instance(value))
         obj_inst = object_instances_dict[att_val]
 
     # if the att_list is empty, no object instance should be created
@@ -1452,65 +2315,59 @@ def generate_key(att_list, object_instances_dict, value):
     return obj_inst, object_instances_dict
 
 
-def create_new_row_ui_obj_df(log, obj, log_row_index, obj_inst, part_of, other_ui_obj_df, att_col_indices_list, val_att_cols, cont_att_cols, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols):
+def create_new_row_ui_obj_df(log_arrays, obj, log_row_index, obj_inst, part_of, other_ui_obj_records, att_col_indices_list, val_att_cols, cont_att_cols, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols):
     """
-    Adds a new row to the input DataFrame and populates it with input values.
-    It also adds additional columns to the df if they don't exist, assigns attribute values to the corresponding columns,
-    and removes the values from the log.
+    Adds a new row to the other ui object records and populates it with input values.
+    It also adds additional columns to the records if they don't exist, assigns attribute values to the corresponding
+    columns, and marks the values to be removed from the log.
 
-    :param log: A pandas DataFrame representing the UI log.
+    :param log_arrays: LogArrays holding the values of the UI log.
     :param obj: String with the object type.
     :param log_row_index: Row index of the log.
-    :param obj_inst: String with the object instance.
+    :param obj_inst: Integer identifying the object instance.
     :param part_of: String with the object instance the object in question is part of.
-    :param other_ui_obj_df: DataFrame including object instances other than the main object instances.
+    :param other_ui_obj_records: RecordBuffer collecting the rows of the other_ui_obj_df.
     :param att_col_indices_list: List with indices of the attribute columns that are relevant for the object instance.
     :param val_att_cols: List of columns in the log that are of type value attribute.
     :param cont_att_cols: List of columns in the log that are of type context attribute.
     :param other_ui_obj_df_val_att_cols: List of columns in the df that are of type value attribute.
     :param other_ui_obj_df_cont_att_cols: List of columns in the df that are of type context attribute.
-    :return: Tuple of the modified df, log, and lists of columns in the df that are of type value and context attribute.
+    :return: Tuple of the modified records, LogArrays, and lists of columns in the df that are of type value and context attribute.
     """
-    # get index of the new row
-    new_row_index = len(other_ui_obj_df)
-
-    other_ui_obj_df.at[new_row_index, 'row index'] = log_row_index
-    other_ui_obj_df.at[new_row_index, 'object instance'] = obj_inst
-    other_ui_obj_df.at[new_row_index, 'object type'] = obj
-    other_ui_obj_df.at[new_row_index, 'part of'] = part_of
+    record = {'row index': log_row_index, 'object instance': obj_inst, 'object type': obj, 'part of': part_of}
 
     for log_col_index in att_col_indices_list:
-        column_title = log.columns[log_col_index]
-        attribute_value = log.iloc[log_row_index, log_col_index]
-        # if the column title does not exist in the df, add it
-        if column_title not in other_ui_obj_df.columns:
-            other_ui_obj_df[column_title] = None
+        column_title = log_arrays.columns[log_col_index]
 
-        column_index = other_ui_obj_df.columns.get_loc(column_title)
+        # if the column title does not exist in the records, add it; a column title always belongs to the same log
+        # column, so the attribute column type only has to be carried on for new columns
+        if column_title not in other_ui_obj_records.values:
+            other_ui_obj_records.add_column(column_title)
+            column_index = len(other_ui_obj_records.columns) - 1
 
-        # carry on info about the attribute column type
-        if log_col_index in val_att_cols:
-            if column_index not in other_ui_obj_df_val_att_cols:
+            # carry on info about the attribute column type
+            if log_col_index in val_att_cols:
                 other_ui_obj_df_val_att_cols.append(column_index)
-        elif log_col_index in cont_att_cols:
-            if column_index not in other_ui_obj_df_cont_att_cols:
+            elif log_col_index in cont_att_cols:
                 other_ui_obj_df_cont_att_cols.append(column_index)
 
-        # add the value to the df
-        other_ui_obj_df.at[new_row_index, column_title] = attribute_value
+        # add the value to the record
+        record[column_title] = log_arrays.get_value(log_row_index, log_col_index)
 
-        # remove the value from the log
-        log.iloc[log_row_index, log_col_index] = np.NaN
+        # mark the value to be removed from the log
+        other_ui_obj_records.remove_from_log(log_row_index, log_col_index)
 
-    return other_ui_obj_df, log, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols
+    other_ui_obj_records.append(record)
 
+    return other_ui_obj_records, log_arrays, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols
 
-def decide_undecided_obj_cols(log, undecided_obj_cols, value_term, obj_level, local_other_ui_obj_cols_fourth, unmatched_att_list, row_index, val_att_cols):
+
+def decide_undecided_obj_cols(log_arrays, undecided_obj_cols, value_term, obj_level, local_other_ui_obj_cols_fourth, unmatched_att_list, row_index, val_att_cols):
     """
     Chooses how to handle the columns where the object type is not clear yet.
 
     :param val_att_cols: Dictionary with value attribute indices columns.
-    :param log: A pandas DataFrame representing the UI log.
+    :param log_arrays: LogArrays holding the values of the UI log.
     :param undecided_obj_cols: A dictionary with column indices that haven't been assigned one clear object type
                                 but a list of possible ones.
     :param value_term: String with the object type of the current object.
@@ -1522,35 +2379,39 @@ def decide_undecided_obj_cols(log, undecided_obj_cols, value_term, obj_level, lo
     :param row_index: Row index of the log.
     :return: A tuple of the updated unmatched_att_list and the updated local_other_ui_obj_cols_fourth.
     """
+    # the dictionary and the list are shared by all rows, so changed copies are returned instead of changing them
     if obj_level == 'obj_fourth_level':
         # columns of type value attribute have to be assigned to the main obj
-        for col_index in list(local_other_ui_obj_cols_fourth.keys()):
-            if col_index in val_att_cols:
-                unmatched_att_list.append(col_index)
-                local_other_ui_obj_cols_fourth.pop(col_index)
+        val_att_obj_cols = [col_index for col_index in local_other_ui_obj_cols_fourth if col_index in val_att_cols]
+        if val_att_obj_cols:
+            unmatched_att_list = unmatched_att_list + val_att_obj_cols
+            local_other_ui_obj_cols_fourth = {col_index: obj_type for col_index, obj_type in
+                                              local_other_ui_obj_cols_fourth.items() if col_index not in val_att_obj_cols}
 
         for obj_index, obj_types in undecided_obj_cols.items():
             # if the undecided column object possibility matches the main, then add it to the unmatched list,
             #  so it will be added to the main's attributes
             if value_term in obj_types:
                 if obj_index not in unmatched_att_list:
-                    unmatched_att_list.append(obj_index)
+                    unmatched_att_list = unmatched_att_list + [obj_index]
 
             else:
                 # call function to find out which columns have the same object type
                 local_other_ui_obj_cols_fourth_matched = find_matching_pairs(local_other_ui_obj_cols_fourth)
 
                 # check which object type of the highest level is present in this row
-                available_obj = check_value_availability(log, local_other_ui_obj_cols_fourth_matched, row_index)
+                available_obj = check_value_availability(log_arrays, local_other_ui_obj_cols_fourth_matched,
+                                                         row_index)
 
                 # if it doesn't match the main, check if it matches any available other fourth level object type
                 if available_obj in obj_types:
-                    local_other_ui_obj_cols_fourth.setdefault(obj_index, available_obj)
+                    if obj_index not in local_other_ui_obj_cols_fourth:
+                        local_other_ui_obj_cols_fourth = {**local_other_ui_obj_cols_fourth, obj_index: available_obj}
 
                 # if non matches it will be added to the main
                 else:
                     if obj_index not in unmatched_att_list:
-                        unmatched_att_list.append(obj_index)
+                        unmatched_att_list = unmatched_att_list + [obj_index]
 
     else:
         for obj_index, obj_types in undecided_obj_cols.items():
@@ -1558,37 +2419,38 @@ def decide_undecided_obj_cols(log, undecided_obj_cols, value_term, obj_level, lo
             local_other_ui_obj_cols_fourth_matched = find_matching_pairs(local_other_ui_obj_cols_fourth)
 
             # check which object type of the highest level is present in this row
-            available_obj = check_value_availability(log, local_other_ui_obj_cols_fourth_matched, row_index)
+            available_obj = check_value_availability(log_arrays, local_other_ui_obj_cols_fourth_matched,
+                                                     row_index)
 
             # if it doesn't match the main, check if it matches any available other fourth level object type
             for avail_obj in available_obj:
                 if avail_obj in obj_types:
-                    local_other_ui_obj_cols_fourth.setdefault(obj_index, avail_obj)
+                    if obj_index not in local_other_ui_obj_cols_fourth:
+                        local_other_ui_obj_cols_fourth = {**local_other_ui_obj_cols_fourth, obj_index: avail_obj}
 
                 # if non matches it will be added to the main
                 else:
                     if obj_index not in unmatched_att_list:
-                        unmatched_att_list.append(obj_index)
+                        unmatched_att_list = unmatched_att_list + [obj_index]
 
     return unmatched_att_list, local_other_ui_obj_cols_fourth
 
 
-def identify_main_object_instances(log, object_instances_dict, row_index, value, value_term, obj_level,
-                                   local_other_ui_obj_cols, unmatched_att_list, val_att_cols, cont_att_cols,
-                                   last_obj_inst, last_web_inst, last_app_inst, last_second_obj_inst, last_third_obj_inst):
+def identify_main_object_instances(log_arrays, object_instances_dict, row_index, value, value_term, obj_level,
+                                   combined_att_list, val_att_cols, cont_att_cols, last_obj_inst, last_web_inst,
+                                   last_app_inst, last_second_obj_inst, last_third_obj_inst):
     """
     Identifies main object instances.
 
-    :param log: A pandas DataFrame representing the UI log.
+    :param log_arrays: LogArrays holding the values of the UI log.
     :param object_instances_dict: A dictionary to save the attribute combinations as keys and the object instances as values.
     :param row_index: Row index of the log.
     :param value: String with the object type.
     :param value_term: String with the official term for the object type.
     :param obj_level: A string indicating UI object's hierarchy level ('obj_highest_level',
                         'obj_second_level', 'obj_third_level', or 'obj_fourth_level').
-    :param local_other_ui_obj_cols: Dictionary with columns related to object types other than the main UI object type;
-                                        with indices as keys and object types as values.
-    :param unmatched_att_list: List with attribute columns that have not been assigned an object type yet.
+    :param combined_att_list: List with the attribute columns relevant to identify the object instance, as returned by
+                                get_relevant_att_cols.
     :param val_att_cols: List of columns in the log that are of type value attribute.
     :param cont_att_cols: List of columns in the log that are of type context attribute.
     :param last_obj_inst: String holding the last higher level object instance.
@@ -1597,30 +2459,24 @@ def identify_main_object_instances(log, object_instances_dict, row_index, value,
     :param last_second_obj_inst: A string with the object instance of the last seen second level object.
     :param last_third_obj_inst: A string with the object instance of the last seen third level object.
     :return: A tuple consisting of:
-                - the modified log,
+                - the modified LogArrays,
                 - the modified object_instances_dict,
                 - the updated last_obj_inst,
-                - the adjusted last_web_inst,
-                - the modified local_other_ui_obj_cols.
+                - the adjusted last_web_inst.
     """
-
-    # call function to get a list of the relevant attribute columns
-    combined_att_list, local_other_ui_obj_cols = get_relevant_att_cols(local_other_ui_obj_cols, unmatched_att_list,
-                                                                       value_term)
-
     # function that loops over the list to combine all attribute values to identify the object instance
-    att_list, att_col_indices_list = get_attribute_values(log, row_index, combined_att_list, val_att_cols, cont_att_cols)
+    att_list, att_col_indices_list = get_attribute_values(log_arrays, row_index, combined_att_list, val_att_cols, cont_att_cols)
 
     # call function to add value to the 'part of' column
     obj_is_main = True
-    att_list, log = add_higher_hierarchy_instances(log, value_term, att_list, row_index, obj_level, last_web_inst,
-                                                   last_app_inst, last_second_obj_inst, last_third_obj_inst,
-                                                   obj_is_main)
+    att_list, log_arrays = add_higher_hierarchy_instances(log_arrays, value_term, att_list, row_index, obj_level,
+                                                          last_web_inst, last_app_inst, last_second_obj_inst,
+                                                          last_third_obj_inst, obj_is_main)
 
     # call function to form a key from the attribute combination to get the object instance
     obj_inst, object_instances_dict = generate_key(att_list, object_instances_dict, value)
 
-    log.loc[row_index, 'object instance'] = obj_inst
+    log_arrays.set_value(row_index, 'object instance', obj_inst)
 
     # saves instance of last object for this  hierarchy level
     if value_term == 'website':
@@ -1628,23 +2484,42 @@ def identify_main_object_instances(log, object_instances_dict, row_index, value,
     else:
         last_obj_inst = [obj_inst, row_index]
 
-    return log, object_instances_dict, last_obj_inst, last_web_inst, local_other_ui_obj_cols
+    return log_arrays, object_instances_dict, last_obj_inst, last_web_inst
+
+
+def group_other_ui_obj_cols(local_other_ui_obj_cols, object_hierarchy):
+    """
+    Groups the columns of object types other than the main UI object type by their object type.
+
+    :param local_other_ui_obj_cols: Dictionary with columns related to object types other than the main UI object type;
+                                        with indices as keys and object types as values.
+    :param object_hierarchy: A dictionary specifying the typical ui object hierarchy.
+    :return: A list of tuples of an object type, its hierarchy level, and the indices of its columns.
+    """
+    other_ui_obj_groups = []
+
+    # call function to find out which columns have the same object type
+    for obj, indices in find_matching_pairs(local_other_ui_obj_cols).items():
+        # check to which hierarchy level the object type belongs
+        other_ui_obj_groups.append((obj, determine_hierarchy_level(obj, object_hierarchy), indices))
+
+    return other_ui_obj_groups
 
 
-def identify_other_obj_inst(log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                            local_other_ui_obj_cols, val_att_cols, cont_att_cols, last_obj_inst, last_web_inst, last_app_inst,
-                            last_second_obj_inst, last_third_obj_inst, main_not_this_level, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols):
+def identify_other_obj_inst(log_arrays, other_ui_obj_groups, other_ui_obj_records, object_instances_dict, row_index,
+                            value_term, val_att_cols, cont_att_cols, last_obj_inst, last_web_inst, last_app_inst,
+                            last_second_obj_inst, last_third_obj_inst, main_not_this_level, part_of,
+                            other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols):
     """
      Identifies object instances for objects other than the main object.
 
     :param value_term: String with the official object type term.
-    :param log: A pandas DataFrame representing the UI log.
-    :param object_hierarchy: A dictionary specifying the typical ui object hierarchy.
-    :param other_ui_obj_df: DataFrame including object instances other than the main object instances.
+    :param log_arrays: LogArrays holding the values of the UI log.
+    :param other_ui_obj_groups: List with the object types of one hierarchy level other than the main UI object type,
+                                    as returned by group_other_ui_obj_cols.
+    :param other_ui_obj_records: RecordBuffer collecting the rows of the other_ui_obj_df.
     :param object_instances_dict: A dictionary to save the attribute combinations as keys and the object instances as values.
     :param row_index: Row index of the log.
-    :param local_other_ui_obj_cols: Dictionary with columns related to object types other than the main UI object type;
-                                        with indices as keys and object types as values.
     :param val_att_cols: List of columns in the log that are of type value attribute.
     :param cont_att_cols: List of columns in the log that are of type context attribute.
     :param last_obj_inst: String holding the last higher level object instance.
@@ -1657,31 +2532,25 @@ def identify_other_obj_inst(log, object_hierarchy, other_ui_obj_df, object_insta
     :param other_ui_obj_df_val_att_cols: List of columns in the df that are of type value attribute.
     :param other_ui_obj_df_cont_att_cols: List of columns in the df that are of type context attribute.
     :return: A tuple consisting of:
-            - the modified log,
+            - the modified LogArrays,
             - the modified object_instances_dict,
             - the new last_obj_inst,
             - the new last_web_inst,
-            - the modified other_ui_obj_df,
+            - the modified other_ui_obj_records,
             - the updated part_of,
             - the changed other_ui_obj_df_val_att_cols,
             - the changed other_ui_obj_df_cont_att_cols.
     """
-    # call function to find out which columns have the same object type
-    local_other_ui_obj_cols = find_matching_pairs(local_other_ui_obj_cols)
-
-    for obj, indices in local_other_ui_obj_cols.items():
-
-        # check to which hierarchy level the object type belongs
-        obj_level = determine_hierarchy_level(obj, object_hierarchy)
+    for obj, obj_level, indices in other_ui_obj_groups:
 
         # function that loops over the list to combine all attribute values to identify the object instance
-        att_list, att_col_indices_list = get_attribute_values(log, row_index, indices, val_att_cols, cont_att_cols)
+        att_list, att_col_indices_list = get_attribute_values(log_arrays, row_index, indices, val_att_cols, cont_att_cols)
 
         # call function to add value to the 'part of' variable
         obj_is_main = None
-        part_of, att_list, log = add_higher_hierarchy_instances(log, obj, att_list, row_index, obj_level,
-                                                                last_web_inst, last_app_inst, last_second_obj_inst,
-                                                                last_third_obj_inst, obj_is_main, part_of)
+        part_of, att_list, log_arrays = add_higher_hierarchy_instances(log_arrays, obj, att_list, row_index, obj_level,
+                                                                       last_web_inst, last_app_inst, last_second_obj_inst,
+                                                                       last_third_obj_inst, obj_is_main, part_of)
 
         # call function to form a key from the attribute combination to get the object instance
         obj_inst, object_instances_dict = generate_key(att_list, object_instances_dict, obj)
@@ -1689,8 +2558,8 @@ def identify_other_obj_inst(log, object_hierarchy, other_ui_obj_df, object_insta
         # don't add object instances to the df that don't actually exist
         if obj_inst is not None:
             # call function to add a row with new info to the other_ui_obj_df
-            other_ui_obj_df, log, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = create_new_row_ui_obj_df(
-                log, obj, row_index, obj_inst, part_of, other_ui_obj_df, att_col_indices_list, val_att_cols,
+            other_ui_obj_records, log_arrays, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = create_new_row_ui_obj_df(
+                log_arrays, obj, row_index, obj_inst, part_of, other_ui_obj_records, att_col_indices_list, val_att_cols,
                 cont_att_cols, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
 
         # if the main ui object is not on the same level, then set this object instance as last instance of this level
@@ -1707,19 +2576,19 @@ def identify_other_obj_inst(log, object_hierarchy, other_ui_obj_df, object_insta
             if value_term == 'application' and obj != value_term:
                 last_web_inst = [obj_inst, row_index]
 
-    return log, object_instances_dict, last_obj_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols
+    return log_arrays, object_instances_dict, last_obj_inst, last_web_inst, other_ui_obj_records, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols
 
 
-def add_user_objects(log, process_obj_df, user_cols, row_index, process_obj_inst_dict):
+def add_user_objects(log_arrays, process_obj_records, user_cols, row_index, process_obj_inst_dict):
     """
     Manages the user objects found in the log.
 
-    :param log: A pandas DataFrame representing the UI log.
-    :param process_obj_df: A pandas DataFrame for the process object instances and their attributes.
+    :param log_arrays: LogArrays holding the values of the UI log.
+    :param process_obj_records: RecordBuffer collecting the rows of the process_obj_df.
     :param user_cols: Dictionary with indices of the attribute columns that are user-related and the column titles.
     :param row_index: Row index of the log.
     :param process_obj_inst_dict: A Dictionary with process object instances as values and their attribute combinations as keys.
-    :return: A tuple of the modified process_obj_df and the modified log
+    :return: A tuple of the modified process object records and the LogArrays
     """
     obj_type = 'user'
 
@@ -1727,7 +2596,7 @@ def add_user_objects(log, process_obj_df, user_cols, row_index, process_obj_inst
 
     # save relevant attribute values
     for col_index in user_cols.keys():
-        att_value = log.iloc[row_index, col_index]
+        att_value = log_arrays.get_value(row_index, col_index)
         att_list.append(att_value)
 
     # as user always exists; so if there are no attributes
@@ -1736,15 +2605,105 @@ def add_user_objects(log, process_obj_df, user_cols, row_index, process_obj_inst
 
     process_obj_inst, process_obj_inst_dict = generate_key(att_list, process_obj_inst_dict, obj_type)
 
-    process_obj_df, log = create_new_row_process_obj_df(log, obj_type, row_index, process_obj_inst, process_obj_df,
-                                                        user_cols)
+    process_obj_records, log_arrays = create_new_row_process_obj_df(log_arrays, obj_type, row_index, process_obj_inst,
+                                                                    process_obj_records, user_cols)
 
-    return process_obj_df, log
+    return process_obj_records, log_arrays
+
+
+def get_row_shape_cols(other_ui_obj_cols_fourth, undecided_obj_cols):
+    """
+    Determines the columns whose value availability influences how a row is recognized, besides its main UI object
+    type. Only the undecided columns are assigned depending on the values given in a row, and only if there are any.
+
+    :param other_ui_obj_cols_fourth: A dictionary with ui object types of the fourth hierarchy level and their column
+                                        indices.
+    :param undecided_obj_cols: A dictionary with column indices that haven't been assigned one clear object type
+                                but a list of possible ones.
+    :return: A list with column indices.
+    """
+    if not undecided_obj_cols:
+        return []
+
+    return list(other_ui_obj_cols_fourth) + [col_index for col_index in undecided_obj_cols
+                                             if col_index not in other_ui_obj_cols_fourth]
+
+
+def create_row_plan(log_arrays, row_index, value, object_hierarchy, ui_object_synonym, undecided_obj_cols,
+                    other_ui_obj_cols_per_level, val_att_cols, unmatched_att_list):
+    """
+    Determines how the object instances of a row are recognized. The plan only depends on the main UI object type of
+    the row and on the availability of the values in the columns returned by get_row_shape_cols, so it can be reused
+    for all rows that have the same.
+
+    :param log_arrays: LogArrays holding the values of the UI log.
+    :param row_index: Row index of the log.
+    :param value: The value of the 'main ui object type' column in the row.
+    :param object_hierarchy: A dictionary specifying the typical ui object hierarchy.
+    :param ui_object_synonym: A dictionary with pre-defined UI object types and their synonyms.
+    :param undecided_obj_cols: A dictionary with column indices that haven't been assigned one clear object type
+                                but a list of possible ones.
+    :param other_ui_obj_cols_per_level: A list with the dictionaries of ui object types of the highest, second, third,
+                                            and fourth hierarchy level and their column indices.
+    :param val_att_cols: List of columns in the log that are of type value attribute.
+    :param unmatched_att_list: List with attribute columns that have not been assigned an object type yet.
+    :return: A tuple of the main object type, its official term, its hierarchy level, and a list of steps, one for
+                every object type column group to recognize in the order of the hierarchy levels. A step is either a
+                tuple ('main', level index, relevant attribute columns) or a tuple ('other', level index, object type
+                column groups, main_not_this_level).
+    """
+    # if the value is given for this row, use it as the main object type
+    if value is not np.NaN:
+
+        # initialize value_term for the case that the value is not part of the ui_object_synonym
+        value_term = value
+
+        # get standardized name from ui object dictionary
+        for key, value_list in ui_object_synonym.items():
+            if value in value_list or value == key:
+                value_term = key
+                break
+
+    # if the value is not given, use a ui object type from a higher hierarchy level
+    else:
+        value = 'unknown'  # since no main UI object is given
+        value_term = value
+
+    # check to which hierarchy level the object type belongs
+    obj_level = determine_hierarchy_level(value_term, object_hierarchy)
+
+    local_other_ui_obj_cols_per_level = list(other_ui_obj_cols_per_level)
+
+    # call function to figure out what to do with the undecided columns
+    local_unmatched_att_list, local_other_ui_obj_cols_per_level[3] = decide_undecided_obj_cols(
+        log_arrays, undecided_obj_cols, value_term, obj_level, local_other_ui_obj_cols_per_level[3],
+        unmatched_att_list, row_index, val_att_cols)
+
+    steps = []
+    hierarchy_levels = ['obj_highest_level', 'obj_second_level', 'obj_third_level', 'obj_fourth_level']
+    for level_index, level in enumerate(hierarchy_levels):
+
+        # the main object is recognized before the other objects of its level, which then leave out its columns
+        if level == obj_level:
+            combined_att_list, local_other_ui_obj_cols_per_level[level_index] = get_relevant_att_cols(
+                local_other_ui_obj_cols_per_level[level_index], local_unmatched_att_list, value_term)
+            steps.append(('main', level_index, combined_att_list))
+
+            # set variable to None since the main ui object is on this level
+            main_not_this_level = None
+        else:
+            # set variable to true since the main ui object is not on this level
+            main_not_this_level = True
+
+        other_ui_obj_groups = group_other_ui_obj_cols(local_other_ui_obj_cols_per_level[level_index], object_hierarchy)
+        steps.append(('other', level_index, other_ui_obj_groups, main_not_this_level))
+
+    return value, value_term, obj_level, steps
 
 
 def recognize_obj_instances(log, object_hierarchy, ui_object_synonym, undecided_obj_cols, other_ui_obj_cols_highest,
                  other_ui_obj_cols_second, other_ui_obj_cols_third, other_ui_obj_cols_fourth, val_att_cols,
-                 cont_att_cols, user_cols, unmatched_att_list, process_obj_df):
+                 cont_att_cols, user_cols, unmatched_att_list, process_obj_records, state=None):
     """
     Recognizes object instances in a log based on their hierarchy levels and attributes.
 
@@ -1765,309 +2724,124 @@ def recognize_obj_instances(log, object_hierarchy, ui_object_synonym, undecided_
     :param cont_att_cols: List of columns in the log that are of type context attribute.
     :param user_cols: Dictionary with indices of the attribute columns that are user-related and the column titles.
     :param unmatched_att_list: List with attribute columns that have not been assigned an object type yet.
-    :param process_obj_df: A pandas DataFrame for the process object instances and their attributes.
+    :param process_obj_records: RecordBuffer collecting the rows of the process_obj_df.
+    :param state: Optional RecognitionState of the previous chunks, if the log is processed in chunks. It is updated,
+                    so it can be handed over to the next chunk.
     :return: A tuple of the modified versions of the log, the other_ui_obj_df and the process_obj_df.
     """
-    object_instances_dict = {}  # dictionary to save ui object instances and their unique identifiers
-    process_obj_inst_dict = {}  # dictionary to save process object instances and their unique identifiers
+    # a log that is not processed in chunks starts without any known object instances
+    if state is None:
+        state = RecognitionState()
+
+    object_instances_dict = state.object_instances_dict  # dictionary to save ui object instances and their unique identifiers
+    process_obj_inst_dict = state.process_obj_inst_dict  # dictionary to save process object instances and their unique identifiers
 
-    # dataframe to save other ui object instances and type, their row index and the object instance they are part of
-    other_ui_obj_df = pd.DataFrame(columns=['row index', 'object instance', 'object type', 'part of'])
+    # records to save other ui object instances and type, their row index and the object instance they are part of;
+    # the other_ui_obj_df is created from them once all rows are added
+    other_ui_obj_records = RecordBuffer(state.other_ui_obj_df_columns)
 
     # variable to save to which higher instance an object instance belongs and fill last column of the other_ui_obj_df
-    part_of = None
+    part_of = state.part_of
 
     # lists to keep info on attribute column type for other_ui_obj_df
-    other_ui_obj_df_val_att_cols = []
-    other_ui_obj_df_cont_att_cols = []
-
-    # create lists to hold the last seen object instance of each object hierarchy and their row
-    last_app_inst = []  # for applications
-    last_web_inst = []  # for websites
-    last_second_obj_inst = []  # for object types on second level
-    last_third_obj_inst = []  # for object types on third level
-    last_fourth_obj_inst = []  # for object types on fourth level
-
-    # loop over the 'main ui object type' column
-    for row_index, value in log['main ui object type'].items():
-
-        # reset local variables
-        local_other_ui_obj_cols_highest = copy.deepcopy(other_ui_obj_cols_highest)
-        local_other_ui_obj_cols_second = copy.deepcopy(other_ui_obj_cols_second)
-        local_other_ui_obj_cols_third = copy.deepcopy(other_ui_obj_cols_third)
-        local_other_ui_obj_cols_fourth = copy.deepcopy(other_ui_obj_cols_fourth)
-        local_unmatched_att_list = copy.deepcopy(unmatched_att_list)
-
-        # if the value is given for this row, use it as the main object type
-        if value is not np.NaN:
-
-            # initialize value_term for the case that the value is not part of the ui_object_synonym
-            value_term = value
-
-            # get standardized name from ui object dictionary
-            for key, value_list in ui_object_synonym.items():
-                if value in value_list or value == key:
-                    value_term = key
-                    break
+    other_ui_obj_df_val_att_cols = list(state.other_ui_obj_df_val_att_cols)
+    other_ui_obj_df_cont_att_cols = list(state.other_ui_obj_df_cont_att_cols)
+
+    # hold the last seen object instance of each object hierarchy level and their row; on the highest level it is the
+    # one of applications, the last seen website is held separately
+    last_obj_insts = [state.last_app_inst, state.last_second_obj_inst, state.last_third_obj_inst,
+                      state.last_fourth_obj_inst]
+    last_web_inst = state.last_web_inst
+
+    # the rows are processed on NumPy arrays of the log's values; the values are only removed from the log after the
+    # loop, so the availability of the values does not change while the rows are processed
+    log_arrays = LogArrays(log)
+
+    other_ui_obj_cols_per_level = [other_ui_obj_cols_highest, other_ui_obj_cols_second, other_ui_obj_cols_third,
+                                   other_ui_obj_cols_fourth]
+
+    # rows with the same main ui object type and the same values available in the row shape columns are recognized the
+    # same way, so the plan is only created once per row shape
+    row_shape_cols = get_row_shape_cols(other_ui_obj_cols_fourth, undecided_obj_cols)
+    row_plans = {}  # row shape -> plan returned by create_row_plan
+
+    # loop over the 'main ui object type' column; for a categorical column, the row shape holds the code of the value
+    main_obj_col_index = log_arrays.col_indices['main ui object type']
+    for row_index, value_code in enumerate(log_arrays.values[main_obj_col_index]):
+
+        row_shape = (value_code, log_arrays.availability[row_index, row_shape_cols].tobytes())
+        if row_shape not in row_plans:
+            value = log_arrays.get_value(row_index, main_obj_col_index)
+            row_plans[row_shape] = create_row_plan(log_arrays, row_index, value, object_hierarchy, ui_object_synonym,
+                                                   undecided_obj_cols, other_ui_obj_cols_per_level, val_att_cols,
+                                                   unmatched_att_list)
+        value, value_term, obj_level, steps = row_plans[row_shape]
+
+        for step in steps:
+            level_index = step[1]
+
+            if step[0] == 'main':
+                log_arrays, object_instances_dict, last_obj_insts[level_index], last_web_inst = identify_main_object_instances(
+                    log_arrays, object_instances_dict, row_index, value, value_term, obj_level, step[2], val_att_cols,
+                    cont_att_cols, last_obj_insts[level_index], last_web_inst, last_obj_insts[0], last_obj_insts[1],
+                    last_obj_insts[2])
 
-            # check to which hierarchy level the object type belongs
-            obj_level = determine_hierarchy_level(value_term, object_hierarchy)
-
-            # check if the ui object is of the highest hierarchy level
-            if obj_level == 'obj_highest_level':
-
-                # call function to figure out what to do with the undecided columns
-                local_unmatched_att_list, local_other_ui_obj_cols_fourth = decide_undecided_obj_cols(log,
-                                                                                                     undecided_obj_cols,
-                                                                                                     value_term,
-                                                                                                     obj_level,
-                                                                                                     local_other_ui_obj_cols_fourth,
-                                                                                                     local_unmatched_att_list,
-                                                                                                     row_index,
-                                                                                                     val_att_cols)
-
-                # main highest level
-                log, object_instances_dict, last_app_inst, last_web_inst, local_other_ui_obj_cols_highest = identify_main_object_instances(
-                    log, object_instances_dict, row_index, value, value_term, obj_level,
-                    local_other_ui_obj_cols_highest, local_unmatched_att_list, val_att_cols, cont_att_cols,
-                    last_app_inst, last_web_inst, last_app_inst, last_second_obj_inst, last_third_obj_inst)
-
-                # other highest level
-                # set variable to None since the main ui object is on this level
-                main_not_this_level = None
-                log, object_instances_dict, last_app_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                    log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                    local_other_ui_obj_cols_highest, val_att_cols, cont_att_cols, last_app_inst, last_web_inst,
-                    last_app_inst, last_second_obj_inst, last_third_obj_inst, main_not_this_level, part_of,
-                    other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
-
-                # set variable to true since the main ui object is not on this level
-                main_not_this_level = True
-
-                # other second level
-                log, object_instances_dict, last_second_obj_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                    log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                    local_other_ui_obj_cols_second, val_att_cols, cont_att_cols, last_second_obj_inst, last_web_inst,
-                    last_app_inst, last_second_obj_inst, last_third_obj_inst, main_not_this_level, part_of,
-                    other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
-
-                # other third level
-                log, object_instances_dict, last_third_obj_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                    log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                    local_other_ui_obj_cols_third, val_att_cols, cont_att_cols, last_third_obj_inst, last_web_inst,
-                    last_app_inst, last_second_obj_inst, last_third_obj_inst, main_not_this_level, part_of,
-                    other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
-
-                # other fourth level
-                log, object_instances_dict, last_fourth_obj_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                    log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                    local_other_ui_obj_cols_fourth, val_att_cols, cont_att_cols, last_fourth_obj_inst, last_web_inst,
-                    last_app_inst, last_second_obj_inst, last_third_obj_inst, main_not_this_level, part_of,
-                    other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
-
-                # if only highest level objects are in a column, last_app_inst or last_obj_inst won't be added to the related_ui_obj column
-                # add it to column
-                if value_term == 'website' and last_app_inst:
-                    if row_index == last_app_inst[1]:
-                        log.loc[row_index, 'related ui object'] = last_app_inst[0]
-
-                if value_term == 'application' and last_web_inst:
-                    if row_index == last_web_inst[1]:
-                        log.loc[row_index, 'related ui object'] = last_web_inst[0]
-
-            # if it is not on the highest hierarchy level
             else:
+                log_arrays, object_instances_dict, last_obj_insts[level_index], last_web_inst, other_ui_obj_records, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
+                    log_arrays, step[2], other_ui_obj_records, object_instances_dict, row_index, value_term,
+                    val_att_cols, cont_att_cols, last_obj_insts[level_index], last_web_inst, last_obj_insts[0],
+                    last_obj_insts[1], last_obj_insts[2], step[3], part_of, other_ui_obj_df_val_att_cols,
+                    other_ui_obj_df_cont_att_cols)
+
+        # if only highest level objects are in a column, last_app_inst or last_obj_inst won't be added to the related_ui_obj column
+        # add it to column
+        if obj_level == 'obj_highest_level':
+            last_app_inst = last_obj_insts[0]
+            if value_term == 'website' and last_app_inst:
+                if row_index == last_app_inst[1]:
+                    log_arrays.set_value(row_index, 'related ui object', last_app_inst[0])
 
-                # call function to figure out what to do with the undecided columns
-                local_unmatched_att_list, local_other_ui_obj_cols_fourth = decide_undecided_obj_cols(log,
-                                                                                                     undecided_obj_cols,
-                                                                                                     value_term,
-                                                                                                     obj_level,
-                                                                                                     local_other_ui_obj_cols_fourth,
-                                                                                                     local_unmatched_att_list,
-                                                                                                     row_index,
-                                                                                                     val_att_cols)
-
-                # set variable to true since the main ui object is not on this level
-                main_not_this_level = True
-
-                # other highest level
-                log, object_instances_dict, last_app_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                    log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                    local_other_ui_obj_cols_highest, val_att_cols, cont_att_cols, last_app_inst, last_web_inst,
-                    last_app_inst, last_second_obj_inst, last_third_obj_inst, main_not_this_level, part_of,
-                    other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
-
-                # main second level
-                if obj_level == 'obj_second_level':
-                    log, object_instances_dict, last_second_obj_inst, last_web_inst, local_other_ui_obj_cols_second = identify_main_object_instances(
-                        log, object_instances_dict, row_index, value, value_term, obj_level,
-                        local_other_ui_obj_cols_second, local_unmatched_att_list, val_att_cols, cont_att_cols,
-                        last_second_obj_inst, last_web_inst, last_app_inst, last_second_obj_inst, last_third_obj_inst)
-
-                    # other second level
-                    # set variable to None since the main ui object is on this level
-                    main_not_this_level = None
-                    log, bject_instances_dict, last_second_obj_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                        log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                        local_other_ui_obj_cols_second, val_att_cols, cont_att_cols, last_second_obj_inst,
-                        last_web_inst, last_app_inst, last_second_obj_inst, last_third_obj_inst, main_not_this_level,
-                        part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
-
-                    # set variable to true since the main ui object is not on this level
-                    main_not_this_level = True
-
-                    # other third level
-                    log, object_instances_dict, last_third_obj_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                        log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                        local_other_ui_obj_cols_third, val_att_cols, cont_att_cols, last_third_obj_inst, last_web_inst,
-                        last_app_inst, last_second_obj_inst, last_third_obj_inst, main_not_this_level, part_of,
-                        other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
-
-                    # other fourth level
-                    log, object_instances_dict, last_fourth_obj_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                        log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                        local_other_ui_obj_cols_fourth, val_att_cols, cont_att_cols, last_fourth_obj_inst,
-                        last_web_inst, last_app_inst, last_second_obj_inst, last_third_obj_inst, main_not_this_level,
-                        part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
-
-                else:
-                    # set variable to true since the main ui object is not on this level
-                    main_not_this_level = True
-
-                    # other second level
-                    log, object_instances_dict, last_second_obj_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                        log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                        local_other_ui_obj_cols_second, val_att_cols, cont_att_cols, last_second_obj_inst,
-                        last_web_inst, last_app_inst, last_second_obj_inst, last_third_obj_inst, main_not_this_level,
-                        part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
-
-                    # main third level
-                    if obj_level == 'obj_third_level':
-                        log, object_instances_dict, last_third_obj_inst, last_web_inst, local_other_ui_obj_cols_third = identify_main_object_instances(
-                            log, object_instances_dict, row_index, value, value_term, obj_level,
-                            local_other_ui_obj_cols_third, local_unmatched_att_list, val_att_cols, cont_att_cols,
-                            last_third_obj_inst, last_web_inst, last_app_inst, last_second_obj_inst,
-                            last_third_obj_inst)
-
-                        # other third level
-                        # set variable to None since the main ui object is on this level
-                        main_not_this_level = None
-                        log, object_instances_dict, last_third_obj_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                            log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                            local_other_ui_obj_cols_third, val_att_cols, cont_att_cols, last_third_obj_inst,
-                            last_web_inst, last_app_inst, last_second_obj_inst, last_third_obj_inst,
-                            main_not_this_level, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
-
-                        # other fourth level
-                        # set variable to true since the main ui object is not on this level
-                        main_not_this_level = True
-                        log, object_instances_dict, last_fourth_obj_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                            log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                            local_other_ui_obj_cols_fourth, val_att_cols, cont_att_cols, last_fourth_obj_inst,
-                            last_web_inst, last_app_inst, last_second_obj_inst, last_third_obj_inst,
-                            main_not_this_level, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
-
-                    else:
-                        # set variable to true since the main ui object is not on this level
-                        main_not_this_level = True
-
-                        # other third level
-                        log, object_instances_dict, last_third_obj_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                            log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                            local_other_ui_obj_cols_third, val_att_cols, cont_att_cols, last_third_obj_inst,
-                            last_web_inst, last_app_inst, last_second_obj_inst, last_third_obj_inst,
-                            main_not_this_level, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
-
-                        # main fourth level
-                        log, object_instances_dict, last_fourth_obj_inst, last_web_inst, local_other_ui_obj_cols_fourth = identify_main_object_instances(
-                            log, object_instances_dict, row_index, value, value_term, obj_level,
-                            local_other_ui_obj_cols_fourth, local_unmatched_att_list, val_att_cols, cont_att_cols,
-                            last_fourth_obj_inst, last_web_inst, last_app_inst, last_second_obj_inst,
-                            last_third_obj_inst)
-
-                        # other fourth level
-                        # set variable to None since the main ui object is on this level
-                        main_not_this_level = None
-                        log, object_instances_dict, last_fourth_obj_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                            log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                            local_other_ui_obj_cols_fourth, val_att_cols, cont_att_cols, last_fourth_obj_inst,
-                            last_web_inst, last_app_inst, last_second_obj_inst, last_third_obj_inst,
-                            main_not_this_level, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
-
-        # if the value is not given, use a ui object type from a higher hierarchy level
-        else:
-
-            value = 'unknown'  # since no main UI object is given
-            value_term = value
-
-            # check to which hierarchy level the object type belongs
-            obj_level = determine_hierarchy_level(value_term, object_hierarchy)
-
-            # call function to figure out what to do with the undecided columns
-            local_unmatched_att_list, local_other_ui_obj_cols_fourth = decide_undecided_obj_cols(log,
-                                                                                                 undecided_obj_cols,
-                                                                                                 value_term, obj_level,
-                                                                                                 local_other_ui_obj_cols_fourth,
-                                                                                                 local_unmatched_att_list,
-                                                                                                 row_index,
-                                                                                                 val_att_cols)
-
-            # set variable to true since the main ui object is not on this level
-            main_not_this_level = True
-
-            # other highest level
-            log, object_instances_dict, last_app_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                local_other_ui_obj_cols_highest, val_att_cols, cont_att_cols, last_app_inst, last_web_inst,
-                last_app_inst, last_second_obj_inst, last_third_obj_inst, main_not_this_level, part_of,
-                other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
-
-            # other second level
-            log, object_instances_dict, last_second_obj_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                local_other_ui_obj_cols_second, val_att_cols, cont_att_cols, last_second_obj_inst, last_web_inst,
-                last_app_inst, last_second_obj_inst, last_third_obj_inst, main_not_this_level, part_of,
-                other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
-
-            # other third level
-            log, object_instances_dict, last_third_obj_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                local_other_ui_obj_cols_third, val_att_cols, cont_att_cols, last_third_obj_inst, last_web_inst,
-                last_app_inst, last_second_obj_inst, last_third_obj_inst, main_not_this_level, part_of,
-                other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
-
-            # main fourth level
-            log, object_instances_dict, last_fourth_obj_inst, last_web_inst, local_other_ui_obj_cols_fourth = identify_main_object_instances(
-                log, object_instances_dict, row_index, value, value_term, obj_level, local_other_ui_obj_cols_fourth,
-                local_unmatched_att_list, val_att_cols, cont_att_cols, last_fourth_obj_inst, last_web_inst,
-                last_app_inst, last_second_obj_inst, last_third_obj_inst)
-
-            # other fourth level
-            # set variable to None since the main ui object is on this level
-            main_not_this_level = None
-            log, object_instances_dict, last_fourth_obj_inst, last_web_inst, other_ui_obj_df, part_of, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = identify_other_obj_inst(
-                log, object_hierarchy, other_ui_obj_df, object_instances_dict, row_index, value_term,
-                local_other_ui_obj_cols_fourth, val_att_cols, cont_att_cols, last_fourth_obj_inst, last_web_inst,
-                last_app_inst, last_second_obj_inst, last_third_obj_inst, main_not_this_level, part_of,
-                other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols)
+            if value_term == 'application' and last_web_inst:
+                if row_index == last_web_inst[1]:
+                    log_arrays.set_value(row_index, 'related ui object', last_web_inst[0])
 
         # generate process object instances for the user-related objects
-        process_obj_df, log = add_user_objects(log, process_obj_df, user_cols, row_index,
-                                                            process_obj_inst_dict)
+        process_obj_records, log_arrays = add_user_objects(log_arrays, process_obj_records, user_cols, row_index,
+                                                           process_obj_inst_dict)
+
+    # save the state, so the next chunk continues where this one stopped
+    state.object_instances_dict = object_instances_dict
+    state.process_obj_inst_dict = process_obj_inst_dict
+    state.part_of = part_of
+    state.last_app_inst, state.last_second_obj_inst, state.last_third_obj_inst, state.last_fourth_obj_inst = last_obj_insts
+    state.last_web_inst = last_web_inst
+    state.other_ui_obj_df_columns = list(other_ui_obj_records.columns)
+    state.other_ui_obj_df_val_att_cols = other_ui_obj_df_val_att_cols
+    state.other_ui_obj_df_cont_att_cols = other_ui_obj_df_cont_att_cols
+    state.process_obj_df_columns = list(process_obj_records.columns)
+
+    # write the object instances into the log and remove the values that have been moved to the object dfs from it
+    log = log_arrays.write_to_log(log)
+    log = other_ui_obj_records.remove_values_from_log(log)
+    log = process_obj_records.remove_values_from_log(log)
+
+    # create the object dfs from the collected rows
+    other_ui_obj_df = other_ui_obj_records.to_dataframe()
+    process_obj_df = process_obj_records.to_dataframe()
 
     return log, other_ui_obj_df, process_obj_df, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols
 # </editor-fold>
 
 
 # <editor-fold desc="3. Element Linkage">
-def create_event_dict(log, val_att_cols, process_obj_df):
+def create_event_dict(log, val_att_cols, process_obj_df, first_event_number=1):
     """
     Creates a json file including the event instances of the log.
 
     :param log: A pandas DataFrame representing the UI log.
     :param val_att_cols: List of columns in the log that are of type value attribute.
     :param process_obj_df: A pandas DataFrame for the process object instances that is already in a json friendly format.
+    :param first_event_number: Number of the log's first event, which is larger than 1 if the log is a later chunk.
     :return: A dictionary for the event instances that is already in a json friendly format.
     """
     event_df = pd.DataFrame()  # df for event related data
@@ -2079,7 +2853,7 @@ def create_event_dict(log, val_att_cols, process_obj_df):
     process_obj_dict = process_obj_df.groupby('row index')['object instance'].apply(list).to_dict()
 
     # assign ids to events
-    for x in range(1, len(log) + 1):
+    for x in range(first_event_number, first_event_number + len(log)):
         event_instances.append(f'event_{x}')
 
     event_df['event id'] = event_instances  # add id column to event_df
@@ -2102,6 +2876,10 @@ def create_event_dict(log, val_att_cols, process_obj_df):
         if 'related ui object' in col:
             event_df[col] = log[col]
 
+    # a log without a timestamp column is treated like a log whose timestamps are all missing
+    if 'timestamp' not in event_df.columns:
+        event_df['timestamp'] = np.NaN
+
     # convert timestamp to string, so json can parse it
     event_df['timestamp'] = event_df['timestamp'].astype(str)
 
@@ -2109,27 +2887,28 @@ def create_event_dict(log, val_att_cols, process_obj_df):
         val_att_dict = {}  # dictionary to save the value attribute value and the object the attribute belongs to
         process_obj_list = []
         related_ui_obj_list = []
+        main_obj_inst = counter.get_instance_name(row['object instance'])  # name of the main object instance
         for col_index in event_val_att_cols:
             att_val = event_df.iloc[row_index, col_index] # value attribute value
             att_type = event_df.columns[col_index] # value attribute type
             if att_val is not np.NaN:
-                val_att_dict[f"{row['object instance']}.{att_type}"] = str(att_val)
+                val_att_dict[f"{main_obj_inst}.{att_type}"] = str(att_val)
 
         # loop over process objects and add the ones with matching saved index to the list
         if row_index in process_obj_dict:
             for process_obj in process_obj_dict[row_index]:
                 if not pd.isna(process_obj):
-                    process_obj_list.append(str(process_obj))
+                    process_obj_list.append(counter.get_instance_name(process_obj))
 
         related_ui_obj = row["related ui object"]
         if not pd.isna(related_ui_obj):
-            related_ui_obj_list.append(str(related_ui_obj))
+            related_ui_obj_list.append(counter.get_instance_name(related_ui_obj))
 
         # add data to the dictionary
         events_dict[row["event id"]] = {
             "activity": str(row["activity"]),
             "timestamp": str(row["timestamp"]),
-            "main object": str(row["object instance"]),
+            "main object": str(main_obj_inst),
             "vmap": val_att_dict,
             "umap": related_ui_obj_list,
             "pmap": process_obj_list
@@ -2153,11 +2932,14 @@ def create_main_ui_obj_dict(log, cont_att_cols, val_att_cols):
     # drop related ui object column because it is not relevant for the ui object
     object_df.drop('related ui object', axis=1, inplace=True)
 
-    # drop duplicate object instances and keep only the once that occur latest in time
-    object_df = object_df.sort_values('timestamp').drop_duplicates(['object instance'], keep='last').sort_index()
+    # drop duplicate object instances and keep only the once that occur latest in time; without a timestamp column, the
+    # row order decides which row is the latest
+    if 'timestamp' in object_df.columns:
+        object_df = object_df.sort_values('timestamp')
+    object_df = object_df.drop_duplicates(['object instance'], keep='last').sort_index()
 
     # drop the timestamp column
-    object_df.drop(['timestamp'], axis=1, inplace=True)
+    object_df.drop(['timestamp'], axis=1, inplace=True, errors='ignore')
 
     # reset indices, so they start with zero again and don't have gaps
     object_df.reset_index(drop=True, inplace=True)
@@ -2182,13 +2964,13 @@ def create_main_ui_obj_dict(log, cont_att_cols, val_att_cols):
                 val_att_dict[val_att_type] = str(val_att_val)
 
         if not pd.isna(row["part of"]):
-            part_of.append(str(row["part of"]))
+            part_of.append(counter.get_instance_name(row["part of"]))
 
         obj_type = row["main ui object type"]
         if pd.isna(obj_type):
             obj_type = 'unknown'
 
-        ui_objects_dict[row["object instance"]] = {
+        ui_objects_dict[counter.get_instance_name(row["object instance"])] = {
             "type": str(obj_type),
             "cmap": cont_att_dict,
             "vmap": val_att_dict,
@@ -2226,9 +3008,9 @@ def create_ui_obj_dict(ui_objects_dict, other_ui_obj_df, other_ui_obj_df_cont_at
                 val_att_dict[val_att_type] = str(val_att_val)
 
         if not pd.isna(row["part of"]):
-            part_of.append(str(row["part of"]))
+            part_of.append(counter.get_instance_name(row["part of"]))
 
-        ui_objects_dict[row["object instance"]] = {
+        ui_objects_dict[counter.get_instance_name(row["object instance"])] = {
             "type": str(row["object type"]),
             "cmap": cont_att_dict,
             "vmap": val_att_dict,
@@ -2260,7 +3042,7 @@ def create_process_obj_dict(process_obj_df):
             if not pd.isna(att_val):
                 att_dict[att_type] = str(att_val)
 
-        process_obj_dict[row["object instance"]] = {
+        process_obj_dict[counter.get_instance_name(row["object instance"])] = {
             "type": str(row["object type"]),
             "amap": att_dict,
         }
@@ -2268,27 +3050,161 @@ def create_process_obj_dict(process_obj_df):
     return process_obj_dict
 
 
-def merge_dicts_and_create_json(events_dict, ui_obj_dict, process_obj_dict):
+def merge_dicts(events_dict, ui_obj_dict, process_obj_dict):
     """
-    Merges the dictionaries and creates a json file to write the output dictionary to.
+    Merges the dictionaries into one object-centric event data dictionary.
 
     :param events_dict: A dictionary for the event instances that is already in a json friendly format.
     :param ui_obj_dict: A dictionary for the UI object instances that is already in a json friendly format.
     :param process_obj_dict: A dictionary for the process object instances that is already in a json friendly format.
+    :return: A dictionary combining the events, UI objects, and process objects.
     """
     oc_dict = {} # object-centric event data dictionary that combines all other element type dictionaries
     oc_dict.setdefault('events', events_dict) # add event dictionary
     oc_dict.setdefault('ui_objects', ui_obj_dict) # add UI object dictionary
     oc_dict.setdefault('process_objects', process_obj_dict) # add process object dictionary
 
-    # specify the subfolder name
-    subfolder = 'output automated transformation'
+    return oc_dict
+
 
-    # specify file path for the JSON file in the subfolder
-    json_file_path = os.path.join(subfolder, 'oc_log.json')
+class JsonWriter:
+    """
+    Writes the object-centric event data to a json file element by element, so the element type dictionaries do not
+    have to be complete before writing starts. The file is the same as the one json.dump writes for the merged
+    dictionary.
 
-    # write the dictionary to the JSON file
-    with open(json_file_path, 'w') as f:
-        json.dump(oc_dict, f, indent=4)
+    The elements are written to a temporary file next to the json file, which only replaces the json file once the
+    writer is closed without an error, so a failed transformation never leaves a truncated json file behind.
+    """
+    def __init__(self, json_file_path=None, compact=False):
+        """
+        :param json_file_path: Optional path of the json file. By default, 'oc_log.json' in the
+                                'output automated transformation' folder is used.
+        :param compact: A boolean indicating whether the json is written without indentation and whitespace.
+        """
+        if json_file_path is None:
+            # specify file path for the JSON file in the subfolder
+            json_file_path = os.path.join('output automated transformation', 'oc_log.json')
+
+        self.json_file_path = json_file_path
+        self.temp_file_path = f'{json_file_path}.{os.getpid()}.tmp'
+        self.file = open(self.temp_file_path, 'w')
+        self.compact = compact
+        self.section_count = 0  # number of element type dictionaries started so far
+        self.item_count = 0  # number of elements written to the current element type dictionary
+        self.file.write('{')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # keep the previous json file if the transformation failed
+        if exc_type is not None:
+            self.discard()
+        else:
+            self.close()
+
+    def start_section(self, name):
+        """
+        Starts a new element type dictionary, e.g., 'events'.
+
+        :param name: A string with the key of the element type dictionary.
+        """
+        if self.section_count > 0:
+            self.file.write(',')
+        if not self.compact:
+            self.file.write('\n    ')
+        self.file.write(json.dumps(name) + (':' if self.compact else ': ') + '{')
+        self.section_count += 1
+        self.item_count = 0
+
+    def write_items(self, dictionary):
+        """
+        Writes elements to the current element type dictionary.
+
+        :param dictionary: A dictionary with elements that is already in a json friendly format.
+        """
+        for key, value in dictionary.items():
+            if self.item_count > 0:
+                self.file.write(',')
+            if self.compact:
+                self.file.write(json.dumps({key: value}, separators=(',', ':'))[1:-1])
+            else:
+                # indent the element like json.dump indents it two levels deep
+                self.file.write('\n        ' + json.dumps({key: value}, indent=4)[6:-2].replace('\n', '\n    '))
+            self.item_count += 1
+
+    def end_section(self):
+        """
+        Ends the current element type dictionary.
+        """
+        if self.item_count > 0 and not self.compact:
+            self.file.write('\n    ')
+        self.file.write('}')
+
+    def write_section(self, name, dictionary):
+        """
+        Writes a complete element type dictionary.
+
+        :param name: A string with the key of the element type dictionary.
+        :param dictionary: A dictionary with elements that is already in a json friendly format.
+        """
+        self.start_section(name)
+        self.write_items(dictionary)
+        self.end_section()
+
+    def close(self):
+        """
+        Ends the object-centric event data dictionary, closes the file, and replaces the json file with it.
+        """
+        if self.file.closed:
+            return
+        if self.section_count > 0 and not self.compact:
+            self.file.write('\n')
+        self.file.write('}')
+        self.file.close()
+        os.replace(self.temp_file_path, self.json_file_path)
+
+    def discard(self):
+        """
+        Closes and deletes the temporary file without touching the json file.
+        """
+        if self.file.closed:
+            return
+        self.file.close()
+        os.remove(self.temp_file_path)
+
+
+def create_json(oc_dict, json_file_path=None, compact=False):
+    """
+    Writes the object-centric event data dictionary to a json file.
+
+    :param oc_dict: A dictionary combining the events, UI objects, and process objects.
+    :param json_file_path: Optional path of the json file. By default, 'oc_log.json' in the
+                            'output automated transformation' folder is used.
+    :param compact: A boolean indicating whether the json is written without indentation and whitespace.
+    """
+    # write the dictionary to the JSON file one element after the other
+    with JsonWriter(json_file_path, compact) as writer:
+        for name, dictionary in oc_dict.items():
+            writer.write_section(name, dictionary)
+
+
+def merge_dicts_and_create_json(events_dict, ui_obj_dict, process_obj_dict, json_file_path=None, compact=False):
+    """
+    Merges the dictionaries and creates a json file to write the output dictionary to.
+
+    :param events_dict: A dictionary for the event instances that is already in a json friendly format.
+    :param ui_obj_dict: A dictionary for the UI object instances that is already in a json friendly format.
+    :param process_obj_dict: A dictionary for the process object instances that is already in a json friendly format.
+    :param json_file_path: Optional path of the json file. By default, 'oc_log.json' in the
+                            'output automated transformation' folder is used.
+    :param compact: A boolean indicating whether the json is written without indentation and whitespace.
+    """
+    # the dictionaries are written one after the other instead of being merged first
+    with JsonWriter(json_file_path, compact) as writer:
+        writer.write_section('events', events_dict)
+        writer.write_section('ui_objects', ui_obj_dict)
+        writer.write_section('process_objects', process_obj_dict)
 # </editor-fold>
 
@@ -8,61 +8,12 @@ from functions import *
 import sys
 import os
 
-# retrieve command-line arguments
-args = sys.argv[1:]
-
-# if only the file path is handed over, use default parameters
-if len(args) == 1:
-    # check if the argument is a file path with valid extensions
-    file_path = args[0]
-    # check if the file format is correct
-    if not file_path.endswith('.xls') and not file_path.endswith('.xlsx') and not file_path.endswith('.csv'):
-        raise ValueError("Invalid file path provided. Please choose a file of type csv, xls, or xlsx instead.")
-
-    # use default parameter values
-    threshold_ui_obj = 0.2  # for ui object columns
-    threshold_act = 0.2  # for activity columns
-    threshold_cont_att = 0.5  # for context attribute columns
-    threshold_val_att = threshold_cont_att  # for value attribute columns
-    threshold_timestamp = 1  # for timestamp column
-    threshold_compl = 0.9  # determines how complete a column should be
-
-# if parameters are handed over, assign them to the ration thresholds determining the ratio of unique values a column should hold
-elif len(args) == 6:
-    file_path = args[0]
-    threshold_ui_obj = float(args[1]) # for ui object columns
-    threshold_act = float(args[2]) # for activity columns
-    threshold_cont_att = float(args[3]) # for context attribute columns
-    threshold_val_att = threshold_cont_att # for value attribute columns
-    threshold_timestamp = float(args[4]) # for timestamp column
-    threshold_compl = float(args[5]) # determines how complete a column should be
-
-else:
-    print("Usage: python main.py [<file_path> <threshold_ui_object> <threshold_activity> <threshold_attribute> <threshold_timestamp> <threshold_col_completeness>]")
-    sys.exit(1)
-
-# handle specific file paths "login_ui_log.xlsx" or "student_record.xlsx"
-if file_path == "login_ui_log.xlsx" or file_path == "student_record.xlsx":
-    file_path = os.path.join(os.path.dirname(__file__), "input datasets", file_path)
-
-# check if the file format is correct
-if file_path.endswith('.xls') or file_path.endswith('.xlsx'):
-    log = pd.read_excel(file_path, dtype=str)
-elif file_path.endswith('.csv'):
-    log = pd.read_csv(file_path, dtype=str)
-else:
-    raise ValueError("Unsupported file format. Please choose a file of type csv, xls, or xlsx instead.")
-
-# log = pd.read_excel(r'C:\Users\Besitzer\Documents\Master\Thesis\Code\input datasets\login_ui_log.xlsx',  dtype=str)
-#
-# log = pd.read_excel(r'C:\Users\Besitzer\Documents\Master\Thesis\Code\input datasets\student_record.xlsx',  dtype=str)
-#
-# threshold_ui_obj = 0.2  # for ui object columns
-# threshold_act = 0.2  # for activity columns
-# threshold_cont_att = 0.5  # for context attribute columns
-# threshold_val_att = threshold_cont_att  # for value attribute columns
-# threshold_timestamp = 1  # for timestamp column
-# threshold_compl = 0.9  # determines how complete a column should be
+# pyarrow is only needed to import parquet and arrow files
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
 
 # import action label list as DataFrame taken from https://carbondesignsystem.com/guidelines/content/action-labels/ and
 # supplemented with own ideas
@@ -128,6 +79,16 @@ obj_fourth_level = ['field', 'button', 'image']
 
 # words not to be tagged as process objects even though the classifier classifies some of them as nouns
 excluded_words = ['chrome', 'firefox', 'safari', 'microsoft edge', 'opera', 'excel', 'power point']
+
+# object columns whose ratio of distinct values to rows is below this ratio are stored as integer codes
+max_categorical_uniqueness_ratio = 0.5
+
+# columns above max_categorical_uniqueness_ratio with more distinct values than this only keep a sample of this many
+# distinct values in their column profile
+max_profiled_values = 10000
+
+# number of events that are created at once before they are written to the json file
+event_batch_size = 10000
 # </editor-fold>
 
 
@@ -136,161 +97,926 @@ excluded_words = ['chrome', 'firefox', 'safari', 'microsoft edge', 'opera', 'exc
 email_regex = '[^@]+@[^@]+\.[^@]+'
 url_regex = '(https?:\/\/(?:www\.|(?!www))[a-zA-Z0-9][a-zA-Z0-9-]+[a-zA-Z0-9]\.[^\s]{2,}|www\.[a-zA-Z0-9][a-zA-Z0-9-]+[a-zA-Z0-9]\.[^\s]{2,}|https?:\/\/(?:www\.|(?!www))[a-zA-Z0-9]+\.[^\s]{2,}|www\.[a-zA-Z0-9]+\.[^\s]{2,})'
 timestamp_regex = '\d{4}[-.\/ ]\d{1,2}[-.\/ ]\d{1,2} \d{2}:\d{2}(:\d{2})?([-,* ]\d{3,4})?|(\d{1,2}[-.\/ ])?\d{1,2}[-.\/ ]\d{2,4} \d{2}:\d{2}(:\d{2})?([-,* ]\d{3,4})?|\d{4}[-.\/ ]\w{3}[-.\/ ]\d{1,2} \d{2}:\d{2}(:\d{2})?([-,* ]\d{3,4})?|\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z'
-# </editor-fold>
-
-
-# <editor-fold desc="Preprocessing">
-# call function to delete case separation since it is not needed for this transformation
-log = delete_cases(log)
 
-# call function to remove empty columns
-log = delete_empty_columns_and_rows(log)
-
-# call function to remove duplicate columns from the log
-log = remove_duplicate_columns(log)
-
-# call function to unify the string formats e.g., by eliminating camel case
-log = unify_string_format(log)
-
-# call function to split column names written in camel case into separate words
-log = split_title_camel_case(log)
-
-# call function to replace 'nan' strings and empty strings with np.NaN
-log = unify_nan_values(log)
+# scanner checking the columns for all regular expressions at once; further patterns can be added with register
+regex_scanner = RegexScanner({'mail': email_regex, 'url': url_regex, 'timestamp': timestamp_regex})
 # </editor-fold>
 
 
-# <editor-fold desc="1. Column Type Classification">
-# call function to calculate the ratio of unique values/total values per column
-uniqueness_ratio_dictionary = get_unique_value_ratio(log)
-
-# call function to identify the event column of the ui log and move it to the first position 
-log = find_event_column(log, uniqueness_ratio_dictionary, action_labels, threshold_act)
-
-# call function to separate the activities from the object types in the events
-log = extract_activity(log, 0, action_labels)
-
-# updated the uniqueness-ration dictionary since the columns changed
-uniqueness_ratio_dictionary = get_unique_value_ratio(log)
-
-# call function to calculate the completeness-ratio per column
-col_compl_dict = get_column_completeness(log, threshold_compl)
-
-# initialize list with all column indices
-column_indices = list(range(len(log.columns)))
-
-# call function to find columns that are constant (have the same value for all rows)
-const_cols = find_constant_columns(log)
+# <editor-fold desc="Pipeline">
+def get_log_path(file_path):
+    """
+    Resolves the path of a UI log.
 
-# call function to find columns that belong to the user rather than to any ui object
-user_cols = find_user_related_cols(log)
+    :param file_path: Path to the UI log. The example logs 'login_ui_log.xlsx' and 'student_record.xlsx' can be
+                        given by their file name only.
+    :return: A string with the path to the UI log.
+    """
+    # handle specific file paths "login_ui_log.xlsx" or "student_record.xlsx"
+    if file_path == "login_ui_log.xlsx" or file_path == "student_record.xlsx":
+        file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "input datasets", file_path)
 
-# call function to identify element types in the log's column headers
-header_obj_types = find_element_types_in_headers(log, ui_object_synonym) # find object types
-header_att_types = find_element_types_in_headers(log, attribute_synonym) # find attribute types
+    return file_path
 
-# categorize columns from dictionary as attribute columns
-column_type_dictionary = categorize_col_as_att(header_att_types)
-column_type_dictionary = categorize_col_as_att(user_cols, column_type_dictionary) # mark user columns as attribute columns
 
-# call function to save the column indices and the object type according to the matched attribute type in a dictionary
-header_obj_type_from_att_type = get_obj_type_based_on_att(header_att_types, att_to_obj_dict)
+def load_log(file_path):
+    """
+    Imports a UI log from a csv, xls, xlsx, parquet, arrow, or feather file.
 
-# call function to re-arrange the dictionaries including info on the column type
-ui_obj_att_cols, column_indices, att_cols_obj_unclear = rearrange_col_type_dicts(header_obj_types,
-                                                                                          header_obj_type_from_att_type,
-                                                                                          column_indices)
+    :param file_path: Path to the UI log. The example logs 'login_ui_log.xlsx' and 'student_record.xlsx' can be
+                        given by their file name only.
+    :return: A pandas DataFrame representing the UI log with all values read as strings.
+    """
+    file_path = get_log_path(file_path)
 
-# find ui object types and columns including them
-ui_object_match_count_dictionary, ui_object_type_dictionary = find_element_types(log, threshold_ui_obj,
-                                                                                 uniqueness_ratio_dictionary, ui_object_synonym)
-# find attribute types and columns including them
-attribute_match_count_dictionary, attribute_type_dictionary = find_element_types(log, threshold_cont_att,
-                                                                                 uniqueness_ratio_dictionary, attribute_synonym)
-
-# call function to check for regex
-mail_match_count_dictionary = check_for_regex(log, email_regex) # check for mail addresses
-url_match_count_dictionary = check_for_regex(log, url_regex) # check for urls
-timestamp_match_count_dictionary = check_for_regex(log, timestamp_regex) # check for timestamps
+    # check if the file format is correct
+    if file_path.endswith('.xls') or file_path.endswith('.xlsx'):
+        log = pd.read_excel(file_path, dtype=str)
+    elif file_path.endswith('.csv'):
+        log = pd.read_csv(file_path, dtype=str)
+    elif file_path.endswith('.parquet') or file_path.endswith('.arrow') or file_path.endswith('.feather'):
+        log = load_columnar_log(file_path)
+    else:
+        raise ValueError("Unsupported file format. Please choose a file of type csv, xls, xlsx, parquet, arrow, or "
+                         "feather instead.")
+
+    return log
+
+
+def load_columnar_log(file_path):
+    """
+    Imports a UI log from a Parquet file or an Arrow IPC (Feather) file.
+
+    Columns without any value are removed by the preprocessing anyway, so they are not read at all. Since every
+    column is read dictionary-encoded, each distinct value is converted to a Python string only once.
+
+    :param file_path: Path to the parquet, arrow, or feather file.
+    :return: A pandas DataFrame representing the UI log with all values as strings and np.NaN for missing values,
+                like load_log returns it for a csv file.
+    """
+    if pa is None:
+        raise ImportError("Reading parquet and arrow files requires pyarrow. Please install it with 'pip install "
+                          "pyarrow'.")
+
+    if file_path.endswith('.parquet'):
+        parquet_file = pq.ParquetFile(file_path)
+        metadata = parquet_file.metadata
+        schema = parquet_file.schema_arrow
+
+        # the column statistics tell which columns are empty without reading them
+        columns = []
+        for index, column in enumerate(schema.names):
+            statistics = [metadata.row_group(row_group).column(index).statistics
+                          for row_group in range(metadata.num_row_groups)]
+            null_counts = [s.null_count if s is not None and s.has_null_count else None for s in statistics]
+            # columns of the null type have no statistics, but they are empty by definition
+            if pa.types.is_null(schema.field(column).type):
+                null_counts = [metadata.num_rows]
+            # the first column is always read, since delete_cases checks it for the case id
+            if index == 0 or None in null_counts or sum(null_counts) < metadata.num_rows:
+                columns.append(column)
+
+        string_columns = [column for column in columns if pa.types.is_string(schema.field(column).type)]
+        table = pq.read_table(file_path, columns=columns, read_dictionary=string_columns)
+
+    else:
+        # memory-map the file, so the columns are only read when they are converted
+        with pa.memory_map(file_path) as source:
+            table = pa.ipc.open_file(source).read_all()
+        columns = [column for index, column in enumerate(table.column_names)
+                   if index == 0 or table.column(column).null_count < len(table)]
+        table = table.select(columns)
+
+    log = pd.DataFrame({index: get_string_values(table.column(index)) for index in range(table.num_columns)})
+    log.columns = table.column_names
+
+    return log
+
+
+def get_string_values(column):
+    """
+    Converts a column of an Arrow table to strings.
+
+    :param column: A pyarrow ChunkedArray.
+    :return: A NumPy object array holding the values as strings and np.NaN for missing values.
+    """
+    if pa.types.is_null(column.type):
+        column = column.cast(pa.string())
+    if not pa.types.is_dictionary(column.type):
+        column = column.dictionary_encode()
+
+    values = []
+    for chunk in column.chunks:
+        # look up the strings of the dictionary; missing values point to np.NaN at the end of the lookup array
+        lookup = np.empty(len(chunk.dictionary) + 1, dtype=object)
+        lookup[:-1] = get_dictionary_strings(chunk.dictionary)
+        lookup[-1] = np.NaN
+        values.append(lookup[chunk.indices.fill_null(-1).to_numpy(zero_copy_only=False)])
+
+    if not values:
+        return np.empty(0, dtype=object)
+
+    return np.concatenate(values)
+
+
+def get_dictionary_strings(dictionary):
+    """
+    Converts the distinct values of an Arrow column to the strings a csv or xlsx file would hold for them.
+
+    Timestamps are written in ISO 8601 in UTC with milliseconds, e.g., '2019-10-21T00:10:09.640Z', so timestamp_regex
+    recognizes them. Floats that are whole numbers are written without decimals, like read_excel reads whole numbers.
+    All other values are converted like pandas converts them with astype(str), e.g., 'True' for booleans.
+
+    :param dictionary: A pyarrow Array with the distinct values of a column.
+    :return: A NumPy object array with the values as strings.
+    """
+    if pa.types.is_string(dictionary.type) or pa.types.is_large_string(dictionary.type):
+        return dictionary.to_numpy(zero_copy_only=False)
+
+    series = dictionary.to_pandas()
+    if pa.types.is_timestamp(dictionary.type):
+        if series.dt.tz is not None:
+            series = series.dt.tz_convert('UTC').dt.tz_localize(None)
+        strings = series.dt.strftime('%Y-%m-%dT%H:%M:%S.%f').str[:-3] + 'Z'
+    elif pa.types.is_floating(dictionary.type):
+        strings = series.map(lambda value: str(int(value)) if value.is_integer() else str(value))
+    else:
+        strings = series.astype(str)
+
+    return strings.to_numpy(dtype=object)
+
+
+def load_preprocessed_log(file_path, use_cache=True):
+    """
+    Imports and preprocesses a UI log.
+
+    The preprocessed log is cached under the hash of the file and the code version, so a later run on the same file
+    skips importing and preprocessing.
+
+    :param file_path: Path to the UI log. The example logs 'login_ui_log.xlsx' and 'student_record.xlsx' can be
+                        given by their file name only.
+    :param use_cache: Boolean indicating whether cached results may be used and stored.
+    :return: A tuple of a pandas DataFrame representing the preprocessed UI log and the cache key of the log, which is
+                None if the cache is not used.
+    """
+    if not use_cache:
+        return preprocess_log(load_log(file_path)), None
+
+    cache_key = get_cache_key(get_file_hash(get_log_path(file_path)), get_code_version())
+
+    log = load_from_cache(get_cache_key(cache_key, 'preprocess_log'))
+    if log is None:
+        log = preprocess_log(load_log(file_path))
+        save_to_cache(get_cache_key(cache_key, 'preprocess_log'), log)
+
+    return log, cache_key
+
+
+def preprocess_log(log):
+    """
+    Applies the preprocessing steps that do not depend on any threshold to the log.
+
+    :param log: A pandas DataFrame representing the UI log.
+    :return: A preprocessed copy of the log.
+    """
+    # work on a copy, so the log handed over stays untouched
+    log = log.copy()
+
+    # call function to delete case separation since it is not needed for this transformation
+    log = delete_cases(log)
+
+    # call function to remove empty columns
+    log = delete_empty_columns_and_rows(log)
+
+    # call function to remove duplicate columns from the log
+    log = remove_duplicate_columns(log)
+
+    # call function to unify the string formats e.g., by eliminating camel case
+    log = unify_string_format(log)
+
+    # call function to split column names written in camel case into separate words
+    log = split_title_camel_case(log)
+
+    # call function to replace 'nan' strings and empty strings with np.NaN
+    log = unify_nan_values(log)
+
+    return log
+
+
+def classify_columns(log, threshold_ui_obj=0.2, threshold_act=0.2, threshold_cont_att=0.5, threshold_timestamp=1,
+                     threshold_compl=0.9, cache_key=None):
+    """
+    Assigns a column type to every column of a preprocessed log.
+
+    :param log: A pandas DataFrame representing the preprocessed UI log.
+    :param threshold_ui_obj: A float indicating the uniqueness-ratio threshold for ui object columns.
+    :param threshold_act: A float indicating the uniqueness-ratio threshold for activity columns.
+    :param threshold_cont_att: A float indicating the uniqueness-ratio threshold that separates context attribute
+                                columns from value attribute columns.
+    :param threshold_timestamp: A float indicating the uniqueness-ratio threshold for the timestamp column.
+    :param threshold_compl: A float indicating how complete the main ui object type column should be.
+    :param cache_key: Optional cache key of the log returned by load_preprocessed_log. If given, the result of
+                        extract_activity is cached per event column.
+    :return: A tuple consisting of:
+                - the classified copy of the log,
+                - a dictionary saving the column type of each column,
+                - a dictionary mapping values to their ui object types,
+                - a dictionary mapping values to their attribute types,
+                - a dictionary with the user-related columns,
+                - a dictionary including object type related columns,
+                - a dictionary with the column indices and lists of potential object types,
+                - a dictionary including the number of urls recognized and their column.
+    """
+    # work on a copy, since columns are moved and renamed, so the preprocessed log can be classified repeatedly
+    log = log.copy()
+
+    # call function to profile every column once; all following steps read the column statistics from the profiles
+    profiles = get_column_profiles(log, max_categorical_uniqueness_ratio, max_profiled_values)
+
+    # call function to calculate the ratio of unique values/total values per column
+    uniqueness_ratio_dictionary = get_unique_value_ratio_from_profiles(profiles)
+
+    # profiles of the columns by name; extract_activity only adds columns, so the other columns keep their profiles
+    known_profiles = dict(zip(log.columns, profiles)) if log.columns.is_unique else {}
+    row_count = len(log)
+
+    # call function to identify the event column of the ui log and move it to the first position 
+    activity_match_count_dictionary, activity_type_dictionary = find_element_types_from_profiles(
+        profiles, threshold_act, uniqueness_ratio_dictionary, action_labels)
+    log = find_event_column(log, activity_match_count_dictionary)
+
+    # call function to separate the activities from the object types in the events; once the event column is fixed,
+    # the result does not depend on any threshold anymore
+    if cache_key is None:
+        log = extract_activity(log, 0, action_labels)
+    else:
+        activity_cache_key = get_cache_key(cache_key, 'extract_activity', tuple(log.columns))
+        activity_log = load_from_cache(activity_cache_key)
+        if activity_log is None:
+            activity_log = extract_activity(log, 0, action_labels)
+            save_to_cache(activity_cache_key, activity_log)
+        log = activity_log
+
+    # only profile the new columns; if rows were removed, all columns have to be profiled again
+    for column in ('activity', 'main ui object type'):
+        known_profiles.pop(column, None)
+    if len(log) != row_count:
+        known_profiles = None
+    profiles = get_column_profiles(log, max_categorical_uniqueness_ratio, max_profiled_values, known_profiles)
+
+    # call function to store the columns with few distinct values as integer codes
+    log = encode_low_cardinality_columns(log, profiles, max_categorical_uniqueness_ratio)
+
+    # updated the uniqueness-ration dictionary since the columns changed
+    uniqueness_ratio_dictionary = get_unique_value_ratio_from_profiles(profiles)
+
+    # call function to calculate the completeness-ratio per column
+    col_compl_dict = get_column_completeness_from_profiles(profiles, len(log), threshold_compl)
+
+    # call function to find columns that are constant (have the same value for all rows)
+    const_cols = find_constant_columns_from_profiles(profiles)
+
+    # find ui object types and columns including them
+    ui_object_match_count_dictionary, ui_object_type_dictionary = find_element_types_from_profiles(
+        profiles, threshold_ui_obj, uniqueness_ratio_dictionary, ui_object_synonym)
+    # find attribute types and columns including them
+    attribute_match_count_dictionary, attribute_type_dictionary = find_element_types_from_profiles(
+        profiles, threshold_cont_att, uniqueness_ratio_dictionary, attribute_synonym)
+
+    # check for mail addresses, urls, and timestamps in one pass
+    regex_match_count_dictionaries = regex_scanner.scan_profiles(profiles)
+    mail_match_count_dictionary = regex_match_count_dictionaries['mail']
+    url_match_count_dictionary = regex_match_count_dictionaries['url']
+    timestamp_match_count_dictionary = regex_match_count_dictionaries['timestamp']
+
+    # call function to categorize the log columns
+    log, column_type_dictionary, user_cols, ui_obj_att_cols, att_cols_obj_unclear = assign_column_types(
+        log, uniqueness_ratio_dictionary, col_compl_dict, ui_object_match_count_dictionary, mail_match_count_dictionary,
+        url_match_count_dictionary, timestamp_match_count_dictionary, threshold_cont_att, threshold_timestamp)
+
+    return (log, column_type_dictionary, ui_object_type_dictionary, attribute_type_dictionary, user_cols,
+            ui_obj_att_cols, att_cols_obj_unclear, url_match_count_dictionary)
+
+
+def assign_column_types(log, uniqueness_ratio_dictionary, col_compl_dict, ui_object_match_count_dictionary,
+                        mail_match_count_dictionary, url_match_count_dictionary, timestamp_match_count_dictionary,
+                        threshold_cont_att, threshold_timestamp):
+    """
+    Assigns a column type to every column based on the column titles and the statistics of the column values.
+
+    Apart from the interactive questions, only the log's column titles are used, so the log may also be a stand-in
+    that holds the column titles of a log that is read in chunks.
+
+    :param log: A pandas DataFrame representing the UI log after the activities have been extracted.
+    :param uniqueness_ratio_dictionary: A dictionary holding the uniqueness-ratio for each column.
+    :param col_compl_dict: A dictionary holding the completeness-ratio of the columns passing the threshold.
+    :param ui_object_match_count_dictionary: A dictionary including ui object types and their count per column.
+    :param mail_match_count_dictionary: A dictionary including the number of mails recognized and their column.
+    :param url_match_count_dictionary: A dictionary including the number of urls recognized and their column.
+    :param timestamp_match_count_dictionary: A dictionary including the number of timestamps recognized and their column.
+    :param threshold_cont_att: A float indicating the uniqueness-ratio threshold that separates context attribute
+                                columns from value attribute columns.
+    :param threshold_timestamp: A float indicating the uniqueness-ratio threshold for the timestamp column.
+    :return: A tuple consisting of:
+                - the log with the main ui object type column and the timestamp column renamed and moved,
+                - a dictionary saving the column type of each column,
+                - a dictionary with the user-related columns,
+                - a dictionary including object type related columns,
+                - a dictionary with the column indices and lists of potential object types.
+    """
+    threshold_val_att = threshold_cont_att  # for value attribute columns
 
-# call function to categorize the log columns
-log, column_type_dictionary = get_column_types(log, column_type_dictionary, column_indices, col_compl_dict, uniqueness_ratio_dictionary,
-                                          threshold_timestamp, threshold_cont_att, threshold_val_att,
-                                          ui_object_match_count_dictionary, timestamp_match_count_dictionary,
-                                          url_match_count_dictionary, mail_match_count_dictionary)
+    # initialize list with all column indices
+    column_indices = list(range(len(log.columns)))
+
+    # call function to find columns that belong to the user rather than to any ui object
+    user_cols = find_user_related_cols(log)
+
+    # call function to identify element types in the log's column headers
+    header_obj_types = find_element_types_in_headers(log, ui_object_synonym) # find object types
+    header_att_types = find_element_types_in_headers(log, attribute_synonym) # find attribute types
+
+    # categorize columns from dictionary as attribute columns
+    column_type_dictionary = categorize_col_as_att(header_att_types)
+    column_type_dictionary = categorize_col_as_att(user_cols, column_type_dictionary) # mark user columns as attribute columns
+
+    # call function to save the column indices and the object type according to the matched attribute type in a dictionary
+    header_obj_type_from_att_type = get_obj_type_based_on_att(header_att_types, att_to_obj_dict)
+
+    # call function to re-arrange the dictionaries including info on the column type
+    ui_obj_att_cols, column_indices, att_cols_obj_unclear = rearrange_col_type_dicts(header_obj_types,
+                                                                                              header_obj_type_from_att_type,
+                                                                                              column_indices)
+
+    # call function to categorize the log columns
+    log, column_type_dictionary = get_column_types(log, column_type_dictionary, column_indices, col_compl_dict, uniqueness_ratio_dictionary,
+                                              threshold_timestamp, threshold_cont_att, threshold_val_att,
+                                              ui_object_match_count_dictionary, timestamp_match_count_dictionary,
+                                              url_match_count_dictionary, mail_match_count_dictionary)
+
+    return log, column_type_dictionary, user_cols, ui_obj_att_cols, att_cols_obj_unclear
+
+
+def get_classification_fingerprint(log, column_type_dictionary):
+    """
+    Builds a hashable fingerprint of a column classification.
+
+    Object recognition and element linkage only depend on the classified log's columns and their types, so two
+    threshold combinations with the same fingerprint lead to the same object-centric event data.
+
+    :param log: A pandas DataFrame representing the classified UI log.
+    :param column_type_dictionary: A dictionary saving the column type of each column.
+    :return: A tuple of the column titles and the column types.
+    """
+    return tuple(log.columns), tuple(column_type_dictionary.items())
+
+
+def recognize_and_link_objects(log, column_type_dictionary, ui_object_type_dictionary, attribute_type_dictionary,
+                               user_cols, ui_obj_att_cols, att_cols_obj_unclear, url_match_count_dictionary, writer=None):
+    """
+    Recognizes the object instances of a classified log and links them to the events.
+
+    The parameters are the elements of the tuple returned by classify_columns, except the optional writer. The log is
+    modified in place.
+
+    :param log: A pandas DataFrame representing the classified UI log.
+    :param column_type_dictionary: A dictionary saving the column type of each column.
+    :param ui_object_type_dictionary: A dictionary mapping values to their ui object types.
+    :param attribute_type_dictionary: A dictionary mapping values to their attribute types.
+    :param user_cols: A dictionary with the user-related columns.
+    :param ui_obj_att_cols: A dictionary including object type related columns.
+    :param att_cols_obj_unclear: A dictionary with the column indices and lists of potential object types.
+    :param url_match_count_dictionary: A dictionary including the number of urls recognized and their column.
+    :param writer: Optional JsonWriter the object-centric event data is written to instead of being returned.
+    :return: A dictionary with the events, ui objects, and process objects in a json friendly format, or None if a
+                writer is given.
+    """
+    # call function to get unique values per column
+    unique_dictionary = get_unique_values_per_col(log)
+
+    # make sure all ui object types are recorded in the ui object type dictionary
+    ui_object_type_dictionary = complete_element_type_dictionary(column_type_dictionary, unique_dictionary,
+                                                              ui_object_type_dictionary, 'ui object type')
+    # make sure all attribute types are recorded in the attribute type dictionary
+    attribute_type_dictionary = complete_element_type_dictionary(column_type_dictionary, unique_dictionary,
+                                                              attribute_type_dictionary, 'attribute')
+
+    # call function to recognize the object instances and create the object-centric event data in one chunk
+    oc_dict = recognize_and_link_chunks([log], column_type_dictionary, user_cols, ui_obj_att_cols, att_cols_obj_unclear,
+                                        url_match_count_dictionary, writer)
+
+    return oc_dict
+
+
+def recognize_and_link_chunks(chunks, column_type_dictionary, user_cols, ui_obj_att_cols, att_cols_obj_unclear,
+                              url_match_count_dictionary, writer=None):
+    """
+    Recognizes the object instances of a classified log that is handed over in consecutive chunks and links them to the
+    events.
+
+    The chunks are processed one after the other; the object instances recognized so far and the last seen instance
+    of each hierarchy level are carried over from one chunk to the next one. The chunks are modified in place. If a
+    writer is given, the events of each chunk are written as soon as the chunk is processed, so only the ui objects
+    and process objects are kept until the end.
+
+    :param chunks: An iterable of pandas DataFrames with the same columns, each holding consecutive rows of the
+                    classified UI log with a row index starting at 0.
+    :param column_type_dictionary: A dictionary saving the column type of each column.
+    :param user_cols: A dictionary with the user-related columns.
+    :param ui_obj_att_cols: A dictionary including object type related columns.
+    :param att_cols_obj_unclear: A dictionary with the column indices and lists of potential object types.
+    :param url_match_count_dictionary: A dictionary including the number of urls recognized and their column.
+    :param writer: Optional JsonWriter the object-centric event data is written to instead of being returned.
+    :return: A dictionary with the events, ui objects, and process objects in a json friendly format, or None if a
+                writer is given.
+    """
+    # restart the numbering of the object instances, so every transformation starts counting at 1
+    counter.reset()
+
+    # call save_col_index_of_col_types function
+    selected_cols, cont_att_cols, val_att_cols, obj_type_cols, main_obj_type_cols = save_col_index_of_col_types(
+        column_type_dictionary, user_cols)
+
+    # call function to get a list with columns that potentially include process objects types in some rows
+    pot_process_obj_cols = get_potential_process_obj_cols(cont_att_cols, url_match_count_dictionary)
+
+    # call function to combine the ui object type dictionaries in one dictionary
+    other_ui_obj_cols = combine_ui_obj_type_dicts(ui_obj_att_cols, att_cols_obj_unclear)
+
+    # call function to get columns including attribute types that are not associated with an object type yet
+    unmatched_att_list = get_unmatched_att_cols(cont_att_cols, val_att_cols, ui_obj_att_cols, att_cols_obj_unclear,
+                                                user_cols)
+
+    # call function to get dictionaries to save other ui object types and their column indices according to their
+    # hierarchy level
+    other_ui_obj_cols_highest, other_ui_obj_cols_second, other_ui_obj_cols_third, other_ui_obj_cols_fourth, undecided_obj_cols = categorize_other_ui_obj(
+        other_ui_obj_cols, object_hierarchy)
+
+    state = RecognitionState()  # object recognition state that is carried over from one chunk to the next one
+    event_dict = {}
+    other_ui_obj_dict = {}  # ui objects other than the main ui objects
+    process_obj_dict = {}
+    main_ui_obj_log = None  # latest row of every main ui object instance seen so far
+    row_count = 0  # number of rows in the previous chunks
+
+    if writer is not None:
+        writer.start_section('events')
+
+    for log in chunks:
+        log['object instance'] = None # add column for object instances
+        log['part of'] = None # add column to indicate next higher object hierarchy level
+        log['related ui object'] = None # add column for the ui objects that are also related to the event but not to the main ui object
+
+        # records to save process objects; the process_obj_df is created from them once all rows are added
+        process_obj_records = RecordBuffer(state.process_obj_df_columns)
+
+        # call function to find process objects in the log
+        process_obj_records = find_process_objects(log, pot_process_obj_cols, process_obj_records, excluded_words, state)
+
+        log, other_ui_obj_df, process_obj_df, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = recognize_obj_instances(
+            log, object_hierarchy, ui_object_synonym, undecided_obj_cols, other_ui_obj_cols_highest, other_ui_obj_cols_second,
+            other_ui_obj_cols_third, other_ui_obj_cols_fourth, val_att_cols, cont_att_cols, user_cols, unmatched_att_list,
+            process_obj_records, state)
+
+        # unify nan values
+        log = unify_nan_values(log)
+        other_ui_obj_df = unify_nan_values(other_ui_obj_df)
+        process_obj_df = unify_nan_values(process_obj_df)
+
+        # call function to create the event json file
+        if writer is not None:
+            # write the events in batches, so the events of the whole chunk are never kept in memory at once
+            for start in range(0, len(log), event_batch_size):
+                stop = start + event_batch_size
+                batch_process_obj_df = process_obj_df[(process_obj_df['row index'] >= start) &
+                                                      (process_obj_df['row index'] < stop)].copy()
+                batch_process_obj_df['row index'] -= start
+                writer.write_items(create_event_dict(log.iloc[start:stop].reset_index(drop=True), val_att_cols,
+                                                     batch_process_obj_df, row_count + start + 1))
+        else:
+            event_dict.update(create_event_dict(log, val_att_cols, process_obj_df, row_count + 1))
+
+        # call function to create the ui object json file
+        other_ui_obj_dict = create_ui_obj_dict(other_ui_obj_dict, other_ui_obj_df, other_ui_obj_df_cont_att_cols,
+                                               other_ui_obj_df_val_att_cols)
+
+        # call function to create the process object json file
+        process_obj_dict.update(create_process_obj_dict(process_obj_df))
+
+        # only the latest row of a main ui object instance is needed, so only these rows are kept from chunk to chunk
+        log.index = log.index + row_count
+        if main_ui_obj_log is None:
+            main_ui_obj_log = log
+        else:
+            main_ui_obj_log = pd.concat([main_ui_obj_log, log])
+            # without a timestamp column, the row order decides which row of an instance is the latest
+            if 'timestamp' in main_ui_obj_log.columns:
+                main_ui_obj_log = main_ui_obj_log.sort_values('timestamp', kind='stable')
+            main_ui_obj_log = main_ui_obj_log.drop_duplicates(['object instance'], keep='last').sort_index()
+
+        state.shift_rows(len(log))
+        row_count += len(log)
+
+    # call function to create a df suitable to convert to json for the main ui objects
+    ui_obj_dict = create_main_ui_obj_dict(main_ui_obj_log, cont_att_cols, val_att_cols)
+
+    # add the other ui objects; like in create_ui_obj_dict, they replace main ui objects with the same instance
+    ui_obj_dict.update(other_ui_obj_dict)
+
+    if writer is not None:
+        writer.end_section()
+        writer.write_section('ui_objects', ui_obj_dict)
+        writer.write_section('process_objects', process_obj_dict)
+        return None
+
+    # call function to merge all dictionaries into the final object-centric event data dictionary
+    oc_dict = merge_dicts(event_dict, ui_obj_dict, process_obj_dict)
+
+    return oc_dict
+
+
+def transform(log, threshold_ui_obj=0.2, threshold_act=0.2, threshold_cont_att=0.5, threshold_timestamp=1,
+              threshold_compl=0.9):
+    """
+    Transforms a UI log into object-centric event data.
+
+    The transformation runs entirely in memory and leaves the input log untouched, so a log that has been loaded once
+    can be transformed repeatedly with different thresholds.
+
+    :param log: A pandas DataFrame representing the UI log.
+    :param threshold_ui_obj: A float indicating the uniqueness-ratio threshold for ui object columns.
+    :param threshold_act: A float indicating the uniqueness-ratio threshold for activity columns.
+    :param threshold_cont_att: A float indicating the uniqueness-ratio threshold that separates context attribute
+                                columns from value attribute columns.
+    :param threshold_timestamp: A float indicating the uniqueness-ratio threshold for the timestamp column.
+    :param threshold_compl: A float indicating how complete the main ui object type column should be.
+    :return: A dictionary with the events, ui objects, and process objects in a json friendly format.
+    """
+    # call function to preprocess the log
+    log = preprocess_log(log)
+
+    # call function to assign a type to each column
+    classification = classify_columns(log, threshold_ui_obj, threshold_act, threshold_cont_att, threshold_timestamp,
+                                      threshold_compl)
+
+    # call function to recognize the object instances and create the object-centric event data
+    oc_dict = recognize_and_link_objects(*classification)
+
+    return oc_dict
 # </editor-fold>
 
 
-# <editor-fold desc="2. Object Recognition">
-# call function to get unique values per column
-unique_dictionary = get_unique_values_per_col(log)
-
-# make sure all ui object types are recorded in the ui object type dictionary
-ui_object_type_dictionary = complete_element_type_dictionary(column_type_dictionary, unique_dictionary,
-                                                          ui_object_type_dictionary, 'ui object type')
-# make sure all attribute types are recorded in the attribute type dictionary
-attribute_type_dictionary = complete_element_type_dictionary(column_type_dictionary, unique_dictionary,
-                                                          attribute_type_dictionary, 'attribute')
-
-# call save_col_index_of_col_types function 
-selected_cols, cont_att_cols, val_att_cols, obj_type_cols, main_obj_type_cols = save_col_index_of_col_types(
-    column_type_dictionary, user_cols)
-
-log['object instance'] = None # add column for object instances
-log['part of'] = None # add column to indicate next higher object hierarchy level
-log['related ui object'] = None # add column for the ui objects that are also related to the event but not to the main ui object
-
-# add object instance column to the selected_cols list to loop over this column too in the following
-selected_cols.append(log.columns.get_loc('object instance'))
-
-# call function to get a list with columns that potentially include process objects types in some rows
-pot_process_obj_cols = get_potential_process_obj_cols(cont_att_cols, url_match_count_dictionary)
-
-# df to save process objects
-process_obj_df = pd.DataFrame(columns=['row index', 'object instance', 'object type'])
-
-# call function to find process objects in the log
-process_obj_df = find_process_objects(log, pot_process_obj_cols, process_obj_df, excluded_words)
-#process_obj_df = find_process_objects_new(log, cont_att_cols, process_obj_df)
-
-# call function to combine the ui object type dictionaries in one dictionary
-other_ui_obj_cols = combine_ui_obj_type_dicts(ui_obj_att_cols, att_cols_obj_unclear)
-
-# call function to get columns including attribute types that are not associated with an object type yet
-unmatched_att_list = get_unmatched_att_cols(cont_att_cols, val_att_cols, ui_obj_att_cols, att_cols_obj_unclear,
-                                            user_cols)
-
-# call function to get dictionaries to save other ui object types and their column indices according to their
-# hierarchy level
-other_ui_obj_cols_highest, other_ui_obj_cols_second, other_ui_obj_cols_third, other_ui_obj_cols_fourth, undecided_obj_cols = categorize_other_ui_obj(
-    other_ui_obj_cols, object_hierarchy)
-
-log, other_ui_obj_df, process_obj_df, other_ui_obj_df_val_att_cols, other_ui_obj_df_cont_att_cols = recognize_obj_instances(
-    log, object_hierarchy, ui_object_synonym, undecided_obj_cols, other_ui_obj_cols_highest, other_ui_obj_cols_second,
-    other_ui_obj_cols_third, other_ui_obj_cols_fourth, val_att_cols, cont_att_cols, user_cols, unmatched_att_list,
-    process_obj_df)
+# <editor-fold desc="Chunked Pipeline">
+def have_same_csv_values(file_path, chunksize, position, other_position):
+    """
+    Reads two columns of a csv UI log chunk by chunk and checks if they have the same value in every row, like
+    remove_duplicate_columns does for a log in memory.
+
+    :param file_path: Path to the csv file of the UI log.
+    :param chunksize: Number of rows that are read at once.
+    :param position: Position of the first column in the csv file.
+    :param other_position: Position of the other column in the csv file.
+    :return: A boolean indicating whether the values are the same.
+    """
+    # empty rows are not removed here, but both columns are missing in them, which counts as the same value
+    for chunk in pd.read_csv(file_path, dtype=str, chunksize=chunksize, usecols=[position, other_position]):
+        if not have_same_values(chunk.iloc[:, 0], chunk.iloc[:, 1]):
+            return False
+
+    return True
+
+
+def profile_csv_in_chunks(file_path, chunksize):
+    """
+    Reads a csv UI log chunk by chunk and profiles the preprocessed values of every column.
+
+    The preprocessing steps that work row by row are applied to each chunk. Empty and duplicate columns can only be
+    recognized once the whole log has been read, so they are determined from the column profiles afterwards.
+
+    :param file_path: Path to the csv file of the UI log.
+    :param chunksize: Number of rows that are read at once.
+    :return: A tuple consisting of:
+                - a list with the titles of the csv columns that are kept,
+                - a list with the preprocessed titles of these columns,
+                - a list with the ColumnProfile of each of these columns,
+                - the number of rows of the preprocessed log.
+    """
+    csv_columns = None
+    csv_positions = []  # position of every column in the csv file
+    non_nan_counts = []  # number of non-NaN values per column to find empty columns
+    column_hashes = []  # hash over the original values per column to find duplicate columns
+    profiles = []
+    row_count = 0
+
+    for chunk in pd.read_csv(file_path, dtype=str, chunksize=chunksize):
+        file_columns = list(chunk.columns)
+
+        # call function to delete case separation since it is not needed for this transformation
+        chunk = delete_cases(chunk)
+
+        # remove empty rows
+        chunk = chunk.dropna(how='all', axis=0)
+
+        if csv_columns is None:
+            csv_columns = list(chunk.columns)
+            csv_positions = [file_columns.index(column) for column in csv_columns]
+            non_nan_counts = [0] * len(csv_columns)
+            column_hashes = [hashlib.sha256() for column in csv_columns]
+            profiles = [ColumnProfile(max_categorical_uniqueness_ratio, max_profiled_values) for column in csv_columns]
+
+        # duplicate columns are compared before the string format is unified, like in preprocess_log
+        for index, column in enumerate(csv_columns):
+            non_nan_counts[index] += int(chunk[column].count())
+            column_hashes[index].update(pd.util.hash_pandas_object(chunk[column], index=False).to_numpy().tobytes())
+
+        # call functions to unify the string formats and the nan values
+        chunk = unify_string_format(chunk)
+        chunk = unify_nan_values(chunk)
+
+        for index, column in enumerate(csv_columns):
+            profiles[index].update(chunk[column])
+        row_count += len(chunk)
+
+    if csv_columns is None:
+        raise ValueError("The log does not contain any rows.")
+
+    # keep the first of several columns with the same values and remove empty columns; like in
+    # remove_duplicate_columns, columns with the same hash are only removed once their values are confirmed to be equal
+    kept_indices = []
+    kept_indices_per_hash = {}  # hash -> indices of the kept columns with this hash
+    for index in range(len(csv_columns)):
+        if non_nan_counts[index] == 0:
+            continue
+        same_hash_indices = kept_indices_per_hash.setdefault(column_hashes[index].digest(), [])
+        if any(have_same_csv_values(file_path, chunksize, csv_positions[kept_index], csv_positions[index])
+               for kept_index in same_hash_indices):
+            continue
+        same_hash_indices.append(index)
+        kept_indices.append(index)
+
+    csv_columns = [csv_columns[index] for index in kept_indices]
+    profiles = [profiles[index] for index in kept_indices]
+
+    # call function to split column names written in camel case into separate words
+    column_titles = list(split_title_camel_case(pd.DataFrame(columns=csv_columns)).columns)
+
+    return csv_columns, column_titles, profiles, row_count
+
+
+def classify_column_profiles(column_titles, profiles, row_count, threshold_ui_obj=0.2, threshold_act=0.2,
+                             threshold_cont_att=0.5, threshold_timestamp=1, threshold_compl=0.9):
+    """
+    Assigns a column type to every column of a log that is read in chunks, like classify_columns does for a log in
+    memory.
+
+    The steps that move and rename columns are applied to a log with a single row that holds the preprocessed title of
+    every column, so the row shows where each classified column comes from.
+
+    :param column_titles: A list with the preprocessed column titles.
+    :param profiles: A list with the ColumnProfile of each column.
+    :param row_count: Number of rows of the preprocessed log.
+    :param threshold_ui_obj: A float indicating the uniqueness-ratio threshold for ui object columns.
+    :param threshold_act: A float indicating the uniqueness-ratio threshold for activity columns.
+    :param threshold_cont_att: A float indicating the uniqueness-ratio threshold that separates context attribute
+                                columns from value attribute columns.
+    :param threshold_timestamp: A float indicating the uniqueness-ratio threshold for the timestamp column.
+    :param threshold_compl: A float indicating how complete the main ui object type column should be.
+    :return: A tuple consisting of:
+                - a dictionary describing how to turn a preprocessed chunk into a classified chunk,
+                - a dictionary saving the column type of each column,
+                - a dictionary with the user-related columns,
+                - a dictionary including object type related columns,
+                - a dictionary with the column indices and lists of potential object types,
+                - a dictionary including the number of urls recognized and their column.
+    """
+    # call function to calculate the ratio of unique values/total values per column
+    uniqueness_ratio_dictionary = get_unique_value_ratio_from_profiles(profiles)
+
+    # call function to identify the event column of the ui log
+    activity_match_count_dictionary, activity_type_dictionary = find_element_types_from_profiles(
+        profiles, threshold_act, uniqueness_ratio_dictionary, action_labels)
+    title_log = pd.DataFrame([column_titles], columns=column_titles)
+    title_log = find_event_column(title_log, activity_match_count_dictionary)
+    event_column = title_log.iloc[0, 0]
+    event_profile = profiles[column_titles.index(event_column)]
+
+    # the activities are extracted from the distinct events, so all of them have to be known
+    if event_profile.is_sampled():
+        raise ValueError(f"The event column '{event_column}' has too many distinct values to be read in chunks. "
+                         "Please transform the log without --chunksize instead.")
+
+    # every chunk has to be split into as many parts as the longest event of the whole log
+    number_of_parts = max([len(value.split(' ')) for value in event_profile.value_counts] + [1])
+
+    # call function to separate the activities from the object types once per unique event
+    event_items = event_profile.items()
+    event_log = pd.DataFrame({'event': pd.Series([value for value, count in event_items], dtype=object)})
+    event_log = extract_activity(event_log, 0, action_labels, number_of_parts)
+
+    extracted_profiles = {}
+    for column in event_log.columns:
+        extracted_profiles[column] = ColumnProfile()
+        # rows of events without activity have been removed by extract_activity
+        values = event_log[column].reindex(range(len(event_items)))
+        for (event, count), value in zip(event_items, values):
+            extracted_profiles[column].add(value, count)
+
+    for column, profile in zip(column_titles, profiles):
+        if column != event_column:
+            extracted_profiles[column] = profile
+
+    # like extract_activity, remove columns that are empty after the activities have been extracted
+    extracted_columns = [column for column, profile in extracted_profiles.items() if profile.count() > 0]
+    profiles = [extracted_profiles[column] for column in extracted_columns]
+
+    # updated the uniqueness-ration dictionary since the columns changed
+    uniqueness_ratio_dictionary = get_unique_value_ratio_from_profiles(profiles)
+
+    # call function to calculate the completeness-ratio per column
+    col_compl_dict = get_column_completeness_from_profiles(profiles, row_count, threshold_compl)
+
+    # find ui object types and columns including them
+    ui_object_match_count_dictionary, ui_object_type_dictionary = find_element_types_from_profiles(
+        profiles, threshold_ui_obj, uniqueness_ratio_dictionary, ui_object_synonym)
+
+    # check for mail addresses, urls, and timestamps in one pass
+    regex_match_count_dictionaries = regex_scanner.scan_profiles(profiles)
+    mail_match_count_dictionary = regex_match_count_dictionaries['mail']
+    url_match_count_dictionary = regex_match_count_dictionaries['url']
+    timestamp_match_count_dictionary = regex_match_count_dictionaries['timestamp']
+
+    # call function to categorize the log columns
+    title_log = pd.DataFrame([extracted_columns], columns=extracted_columns)
+    title_log, column_type_dictionary, user_cols, ui_obj_att_cols, att_cols_obj_unclear = assign_column_types(
+        title_log, uniqueness_ratio_dictionary, col_compl_dict, ui_object_match_count_dictionary,
+        mail_match_count_dictionary, url_match_count_dictionary, timestamp_match_count_dictionary, threshold_cont_att,
+        threshold_timestamp)
+
+    chunk_plan = {
+        'event column': event_column,
+        'number of parts': number_of_parts,
+        'extracted columns': extracted_columns,
+        'columns': list(zip(title_log.columns, title_log.iloc[0]))  # classified column title and its origin
+    }
+
+    return (chunk_plan, column_type_dictionary, user_cols, ui_obj_att_cols, att_cols_obj_unclear,
+            url_match_count_dictionary)
+
+
+def read_classified_chunks(file_path, chunksize, csv_columns, column_titles, chunk_plan):
+    """
+    Reads a csv UI log chunk by chunk and preprocesses and classifies every chunk.
+
+    :param file_path: Path to the csv file of the UI log.
+    :param chunksize: Number of rows that are read at once.
+    :param csv_columns: A list with the titles of the csv columns that are kept.
+    :param column_titles: A list with the preprocessed titles of these columns.
+    :param chunk_plan: A dictionary describing how to turn a preprocessed chunk into a classified chunk.
+    :return: A generator yielding the classified chunks with a row index starting at 0.
+    """
+    for chunk in pd.read_csv(file_path, dtype=str, chunksize=chunksize):
+        # apply the preprocessing steps of profile_csv_in_chunks and keep only the columns kept there
+        chunk = delete_cases(chunk)
+        chunk = chunk.dropna(how='all', axis=0)
+        chunk = chunk[csv_columns]
+        chunk = unify_string_format(chunk)
+        chunk.columns = column_titles
+        chunk = unify_nan_values(chunk)
+
+        # move the event column to the first position and separate the activities from the object types
+        chunk = move_column(chunk, chunk_plan['event column'], 0, 'event')
+        chunk = extract_activity(chunk, 0, action_labels, chunk_plan['number of parts'])
+
+        # columns that are only empty in this chunk have been removed by extract_activity or turned into float columns
+        # by unify_nan_values, but the recognition expects object columns holding np.NaN like in the whole log
+        for index, column in enumerate(chunk_plan['extracted columns']):
+            empty_column = pd.Series(np.NaN, index=chunk.index, dtype=object)
+            if column not in chunk.columns:
+                chunk.insert(index, column, empty_column)
+            elif chunk[column].dtype != object:
+                chunk[column] = empty_column
+
+        # move and rename the columns like the classification did
+        chunk = chunk[[origin for column, origin in chunk_plan['columns']]]
+        chunk.columns = [column for column, origin in chunk_plan['columns']]
+
+        yield chunk.reset_index(drop=True)
+
+
+def transform_csv_in_chunks(file_path, threshold_ui_obj=0.2, threshold_act=0.2, threshold_cont_att=0.5,
+                            threshold_timestamp=1, threshold_compl=0.9, chunksize=100000, writer=None):
+    """
+    Transforms a csv UI log into object-centric event data without loading the whole log into memory.
+
+    The log is read twice: the first pass profiles the columns to classify them, the second pass recognizes the object
+    instances and creates the events chunk by chunk.
+
+    :param file_path: Path to the csv file of the UI log.
+    :param threshold_ui_obj: A float indicating the uniqueness-ratio threshold for ui object columns.
+    :param threshold_act: A float indicating the uniqueness-ratio threshold for activity columns.
+    :param threshold_cont_att: A float indicating the uniqueness-ratio threshold that separates context attribute
+                                columns from value attribute columns.
+    :param threshold_timestamp: A float indicating the uniqueness-ratio threshold for the timestamp column.
+    :param threshold_compl: A float indicating how complete the main ui object type column should be.
+    :param chunksize: Number of rows that are read at once.
+    :param writer: Optional JsonWriter the object-centric event data is written to instead of being returned.
+    :return: A dictionary with the events, ui objects, and process objects in a json friendly format, or None if a
+                writer is given.
+    """
+    file_path = get_log_path(file_path)
+    if not file_path.endswith('.csv'):
+        raise ValueError("Only csv files can be read in chunks. Please choose a file of type csv instead.")
+
+    # call function to profile the columns of the preprocessed log
+    csv_columns, column_titles, profiles, row_count = profile_csv_in_chunks(file_path, chunksize)
+
+    # call function to assign a type to each column
+    chunk_plan, column_type_dictionary, user_cols, ui_obj_att_cols, att_cols_obj_unclear, url_match_count_dictionary = classify_column_profiles(
+        column_titles, profiles, row_count, threshold_ui_obj, threshold_act, threshold_cont_att, threshold_timestamp,
+        threshold_compl)
+
+    # call function to recognize the object instances and create the object-centric event data chunk by chunk
+    chunks = read_classified_chunks(file_path, chunksize, csv_columns, column_titles, chunk_plan)
+    oc_dict = recognize_and_link_chunks(chunks, column_type_dictionary, user_cols, ui_obj_att_cols,
+                                        att_cols_obj_unclear, url_match_count_dictionary, writer)
+
+    return oc_dict
 # </editor-fold>
 
 
-# <editor-fold desc="3. Element Linkage">
-# unify nan values
-log = unify_nan_values(log)
-other_ui_obj_df = unify_nan_values(other_ui_obj_df)
-process_obj_df = unify_nan_values(process_obj_df)
-
-# call function to create the event json file
-event_dict = create_event_dict(log, val_att_cols, process_obj_df)
-
-# call function to create a df suitable to convert to json for the main ui objects
-ui_obj_dict = create_main_ui_obj_dict(log, cont_att_cols, val_att_cols)
-
-# call function to create the ui object json file
-ui_obj_dict = create_ui_obj_dict(ui_obj_dict, other_ui_obj_df, other_ui_obj_df_cont_att_cols,
-                                 other_ui_obj_df_val_att_cols)
-
-# call function to create the process object json file
-process_obj_dict = create_process_obj_dict(process_obj_df)
-
-# call function to merge all dictionaries and create the final object-centric event data json file
-merge_dicts_and_create_json(event_dict, ui_obj_dict, process_obj_dict)
-# </editor-fold>
\ No newline at end of file
+if __name__ == '__main__':
+    # retrieve command-line arguments
+    args = sys.argv[1:]
+
+    usage = "Usage: python main.py [--no-cache] [--clear-cache] [--compact] [--chunksize <number_of_rows>] [<file_path> <threshold_ui_object> <threshold_activity> <threshold_attribute> <threshold_timestamp> <threshold_col_completeness>]"
+
+    # the cache of threshold-independent steps can be switched off
+    use_cache = '--no-cache' not in args
+    args = [arg for arg in args if arg != '--no-cache']
+
+    # the cached results of all logs can be deleted before the transformation
+    if '--clear-cache' in args:
+        clear_cache()
+    args = [arg for arg in args if arg != '--clear-cache']
+
+    # the json file can be written without indentation to keep it small
+    compact = '--compact' in args
+    args = [arg for arg in args if arg != '--compact']
+
+    # csv logs can be read in chunks of the given number of rows instead of all at once
+    chunksize = None
+    if '--chunksize' in args:
+        index = args.index('--chunksize')
+        try:
+            chunksize = int(args[index + 1])
+        except (IndexError, ValueError):
+            print(usage)
+            sys.exit(1)
+        del args[index:index + 2]
+
+    # if only the file path is handed over, use default parameters
+    if len(args) == 1:
+        # check if the argument is a file path with valid extensions
+        file_path = args[0]
+        # check if the file format is correct
+        if not file_path.endswith(('.xls', '.xlsx', '.csv', '.parquet', '.arrow', '.feather')):
+            raise ValueError("Invalid file path provided. Please choose a file of type csv, xls, xlsx, parquet, arrow, "
+                             "or feather instead.")
+
+        # use default parameter values
+        threshold_ui_obj = 0.2  # for ui object columns
+        threshold_act = 0.2  # for activity columns
+        threshold_cont_att = 0.5  # for context attribute columns
+        threshold_timestamp = 1  # for timestamp column
+        threshold_compl = 0.9  # determines how complete a column should be
+
+    # if parameters are handed over, assign them to the ration thresholds determining the ratio of unique values a column should hold
+    elif len(args) == 6:
+        file_path = args[0]
+        threshold_ui_obj = float(args[1]) # for ui object columns
+        threshold_act = float(args[2]) # for activity columns
+        threshold_cont_att = float(args[3]) # for context attribute columns
+        threshold_timestamp = float(args[4]) # for timestamp column
+        threshold_compl = float(args[5]) # determines how complete a column should be
+
+    else:
+        print(usage)
+        sys.exit(1)
+
+    # the object-centric event data is written to the json file while it is created
+    with JsonWriter(compact=compact) as writer:
+        if chunksize is not None:
+            # call function to transform the csv log chunk by chunk
+            transform_csv_in_chunks(file_path, threshold_ui_obj, threshold_act, threshold_cont_att, threshold_timestamp,
+                                    threshold_compl, chunksize, writer)
+
+        else:
+            # call function to import and preprocess the ui log or to load it from the cache
+            log, cache_key = load_preprocessed_log(file_path, use_cache)
+
+            # call function to assign a type to each column
+            classification = classify_columns(log, threshold_ui_obj, threshold_act, threshold_cont_att,
+                                              threshold_timestamp, threshold_compl, cache_key)
+
+            # call function to recognize the object instances and create the object-centric event data
+            recognize_and_link_objects(*classification, writer=writer)
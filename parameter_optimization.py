@@ -1,6 +1,12 @@
-import subprocess
+import argparse
+import functools
+import multiprocessing
+import queue
 import numpy as np
+from nltk.corpus import wordnet
 from evaluation import *
+from functions import load_noun_lexicon
+from main import load_preprocessed_log, classify_columns, get_classification_fingerprint, recognize_and_link_objects
 
 # define the threshold ranges and step size
 threshold_ranges = {
@@ -10,56 +16,373 @@ threshold_ranges = {
     'threshold_compl': (1.0, 1.1, 0.1)
 }
 
-f1_scores = []
+# starting point, bounds, and names of the thresholds for the adaptive search
+default_thresholds = (0.2, 0.2, 0.5, 1.0, 0.9)
+threshold_bounds = (0.0, 1.0)
+threshold_names = ['threshold_ui_obj', 'threshold_act', 'threshold_att', 'threshold_timestamp', 'threshold_compl']
 
-# Iterate through all threshold combinations
-for threshold_ui_obj in np.arange(*threshold_ranges['threshold_ui_obj']):
-    for threshold_act in np.arange(*threshold_ranges['threshold_act']):
-        for threshold_att in np.arange(*threshold_ranges['threshold_att']):
-            for threshold_compl in np.arange(*threshold_ranges['threshold_compl']):
-                try:
+# UI log whose thresholds are optimized and the ground truth its transformation is scored against
+log_file_path = 'student_record.xlsx'
+ground_truth_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ground truth files',
+                                 'json_student_record.json')
+
+# state that every process loads only once and reuses for all threshold combinations and classifications it evaluates
+worker_log = None  # preprocessed log
+worker_cache_key = None  # cache key of the preprocessed log
+worker_json_truth = None  # ground truth of the log
+worker_fingerprints = set()  # fingerprints of the classifications this process has already sent back
+
+
+def get_threshold_combinations(threshold_ranges):
+    """
+    Lists all threshold combinations of the grid in the order in which the nested loops visit them.
+
+    :param threshold_ranges: A dictionary with the start, stop, and step of every threshold.
+    :return: A list of tuples (threshold_ui_obj, threshold_act, threshold_att, threshold_timestamp, threshold_compl).
+    """
+    threshold_combinations = []
+
+    # Iterate through all threshold combinations
+    for threshold_ui_obj in np.arange(*threshold_ranges['threshold_ui_obj']):
+        for threshold_act in np.arange(*threshold_ranges['threshold_act']):
+            for threshold_att in np.arange(*threshold_ranges['threshold_att']):
+                for threshold_compl in np.arange(*threshold_ranges['threshold_compl']):
                     threshold_timestamp = 1.0
-                    # Construct the command to run your main.py file with the current threshold combination
-                    command = [
-                        'python',
-                        'main.py',
-                        'student_record.xlsx',
-                        str(threshold_ui_obj),
-                        str(threshold_act),
-                        str(threshold_att),
-                        str(threshold_timestamp),
-                        str(threshold_compl)
-                    ]
-
-                    # execute the command and capture the output if needed
-                    output = subprocess.check_output(command, universal_newlines=True)
-
-                except subprocess.CalledProcessError as e:
-                    print(
-                        f"Error occurred with thresholds: {threshold_ui_obj}, {threshold_act}, {threshold_att}, {threshold_timestamp}, {threshold_compl}")
-                    print("Error:", e)
-                    continue
-
-                # get f1 score
-                f1 = get_log_micro_f1()
-                print(f1)
-
-
-                # Store the F1 score and threshold combination
-                f1_scores.append({
-                    'threshold_ui_obj': threshold_ui_obj,
-                    'threshold_act': threshold_act,
-                    'threshold_att': threshold_att,
-                    'threshold_timestamp': threshold_timestamp,
-                    'threshold_compl': threshold_compl,
-                    'f1_score': f1
-                })
-
-# create a DataFrame from the F1 scores list
-df_f1_scores = pd.DataFrame(f1_scores)
-
-# rearrange the columns for the desired order
-df_f1_scores = df_f1_scores[['threshold_ui_obj', 'threshold_act', 'threshold_att', 'threshold_timestamp', 'threshold_compl', 'f1_score']]
-
-# save the F1 scores to an Excel file
-df_f1_scores.to_excel('evaluation results/f1_scores_parameter_optimization.xlsx', index=False)
+                    threshold_combinations.append((threshold_ui_obj, threshold_act, threshold_att, threshold_timestamp,
+                                                   threshold_compl))
+
+    return threshold_combinations
+
+
+def init_worker(file_path, ground_truth_file_path):
+    """
+    Loads the input log, the action labels, WordNet, and the ground truth once per process.
+
+    :param file_path: Path to the UI log that is evaluated.
+    :param ground_truth_file_path: Path to the json file with the ground truth of the UI log.
+    """
+    global worker_log, worker_cache_key, worker_json_truth, worker_fingerprints
+
+    # the action labels are loaded when main.py is imported; load WordNet now instead of during the first evaluation,
+    # unless the noun lexicon replaces it
+    if load_noun_lexicon() is None:
+        wordnet.ensure_loaded()
+
+    worker_log, worker_cache_key = load_preprocessed_log(file_path)
+    with open(ground_truth_file_path, 'r') as file:
+        worker_json_truth = json.load(file)
+    worker_fingerprints = set()
+
+
+def classify_thresholds(thresholds):
+    """
+    Classifies the columns of the process' log with one threshold combination.
+
+    :param thresholds: A tuple (threshold_ui_obj, threshold_act, threshold_att, threshold_timestamp, threshold_compl).
+    :return: A tuple of the thresholds, the classification fingerprint, the classification, and an error message. The
+                classification is only sent back the first time this process finds it and is None otherwise. The
+                fingerprint and the classification are None if the classification failed.
+    """
+    try:
+        classification = classify_columns(worker_log, *thresholds, cache_key=worker_cache_key)
+        fingerprint = get_classification_fingerprint(classification[0], classification[1])
+    except Exception as e:
+        return thresholds, None, None, str(e)
+
+    if fingerprint in worker_fingerprints:
+        return thresholds, fingerprint, None, None
+    worker_fingerprints.add(fingerprint)
+
+    return thresholds, fingerprint, classification, None
+
+
+def score_classification(fingerprint_and_classification):
+    """
+    Recognizes the objects of one column classification, creates the object-centric event data, and scores it.
+
+    :param fingerprint_and_classification: A tuple of the classification fingerprint and the tuple returned by
+                                            classify_columns.
+    :return: A tuple of the fingerprint, the f1 score, and an error message. The f1 score is None if the transformation
+                failed.
+    """
+    fingerprint, classification = fingerprint_and_classification
+    try:
+        oc_dict = recognize_and_link_objects(*classification)
+        return fingerprint, get_log_micro_f1(oc_dict, worker_json_truth), None
+    except Exception as e:
+        return fingerprint, None, str(e)
+
+
+def evaluate_thresholds(pool, threshold_combinations, scores_per_classification, max_classification_tasks=1):
+    """
+    Transforms the log with every threshold combination and scores the results.
+
+    The thresholds are only compared against per-column ratios, so many combinations lead to the same column
+    classification. The processes therefore classify the columns for every threshold combination, but object
+    recognition and element linkage only run once per distinct classification: as soon as a classification arrives
+    whose fingerprint has not been seen yet, it is handed back to the pool to be scored.
+
+    :param pool: A process pool whose processes have been initialized with init_worker, or None to evaluate in this
+                    process, which then has to be initialized with init_worker.
+    :param threshold_combinations: A list of tuples (threshold_ui_obj, threshold_act, threshold_att,
+                                    threshold_timestamp, threshold_compl).
+    :param scores_per_classification: A dictionary with the f1 score and the error message per classification
+                                        fingerprint that is filled with the new classifications.
+    :param max_classification_tasks: Maximum number of threshold combinations handed to the pool at once, so the
+                                        classifications to score do not have to wait for the whole grid.
+    :return: A generator yielding a tuple of the thresholds, the classification fingerprint, the f1 score, and an error
+                message per threshold combination as soon as it is scored. The fingerprint and the f1 score are None if
+                the classification failed.
+    """
+    if pool is None:
+        for thresholds in threshold_combinations:
+            thresholds, fingerprint, classification, error = classify_thresholds(thresholds)
+            if fingerprint is None:
+                yield thresholds, None, None, error
+                continue
+            if fingerprint not in scores_per_classification:
+                scores_per_classification[fingerprint] = score_classification((fingerprint, classification))[1:]
+            yield (thresholds, fingerprint) + scores_per_classification[fingerprint]
+        return
+
+    results = queue.Queue()  # results of the pool's tasks, put there by the callbacks
+    thresholds_per_classification = {}  # fingerprint of a classification being scored -> threshold combinations
+    remaining = iter(threshold_combinations)
+    open_tasks = 0
+
+    def submit(function, argument):
+        pool.apply_async(function, (argument,), callback=lambda result: results.put((function, result)),
+                         error_callback=lambda exception: results.put((None, exception)))
+
+    def submit_next_thresholds():
+        thresholds = next(remaining, None)
+        if thresholds is None:
+            return 0
+        submit(classify_thresholds, thresholds)
+        return 1
+
+    for _ in range(max_classification_tasks):
+        open_tasks += submit_next_thresholds()
+
+    while open_tasks > 0:
+        function, result = results.get()
+        open_tasks -= 1
+        if function is None:
+            raise result
+
+        if function is score_classification:
+            fingerprint, f1, error = result
+            scores_per_classification[fingerprint] = (f1, error)
+            for thresholds in thresholds_per_classification.pop(fingerprint):
+                yield thresholds, fingerprint, f1, error
+            continue
+
+        # a classification has arrived, so hand the next threshold combination to the pool
+        open_tasks += submit_next_thresholds()
+
+        thresholds, fingerprint, classification, error = result
+        if fingerprint is None:
+            yield thresholds, None, None, error
+        elif fingerprint in scores_per_classification:
+            yield (thresholds, fingerprint) + scores_per_classification[fingerprint]
+        elif fingerprint in thresholds_per_classification:
+            thresholds_per_classification[fingerprint].append(thresholds)
+        else:
+            # the first arrival of a fingerprint always holds the classification, since every process sends it back
+            # the first time it finds it
+            thresholds_per_classification[fingerprint] = [thresholds]
+            submit(score_classification, (fingerprint, classification))
+            open_tasks += 1
+
+
+def snap_to_resolution(value, resolution):
+    """
+    Rounds a threshold to the search resolution and keeps it within the threshold bounds.
+
+    :param value: A float with the threshold.
+    :param resolution: A float with the smallest step of the search.
+    :return: A float with the rounded threshold.
+    """
+    value = min(max(value, threshold_bounds[0]), threshold_bounds[1])
+
+    # round a second time to get rid of floating point noise, so equal thresholds are equal dictionary keys
+    return round(round(value / resolution) * resolution, 10)
+
+
+def adaptive_search(evaluate, start, initial_step, resolution, budget, history):
+    """
+    Searches the best threshold combination with a compass search instead of the exhaustive grid.
+
+    Starting from the start thresholds, every threshold is moved up and down by the current step. The search moves to
+    the best neighbour if it scores higher and halves the step otherwise, until the step would fall below the
+    resolution or the budget of evaluations is used up.
+
+    :param evaluate: Function that transforms the log with a list of threshold combinations and yields the results
+                        like evaluate_thresholds.
+    :param start: A tuple with the thresholds to start the search from.
+    :param initial_step: A float with the first step size.
+    :param resolution: A float with the smallest step size.
+    :param budget: Maximum number of threshold combinations to evaluate.
+    :param history: A list the convergence report is appended to, one dictionary per iteration.
+    :return: A generator yielding the results of evaluate_thresholds as soon as they are finished.
+    """
+    evaluated = {}  # thresholds -> f1 score (-1 if the transformation failed)
+
+    def get_score(thresholds):
+        return evaluated.get(thresholds, -1)
+
+    best = tuple(snap_to_resolution(value, resolution) for value in start)
+    for result in evaluate([best]):
+        evaluated[result[0]] = result[2] if result[2] is not None else -1
+        yield result
+
+    step = max(snap_to_resolution(initial_step, resolution), resolution)
+
+    while len(evaluated) < budget:
+        # move every threshold up and down by the current step
+        neighbours = []
+        for index in range(len(best)):
+            for direction in (1, -1):
+                neighbour = list(best)
+                neighbour[index] = snap_to_resolution(best[index] + direction * step, resolution)
+                neighbour = tuple(neighbour)
+                if neighbour != best and neighbour not in neighbours:
+                    neighbours.append(neighbour)
+
+        # only evaluate neighbours that have not been evaluated yet, as long as the budget allows it
+        new_neighbours = [neighbour for neighbour in neighbours if neighbour not in evaluated]
+        new_neighbours = new_neighbours[:budget - len(evaluated)]
+        for result in evaluate(new_neighbours):
+            evaluated[result[0]] = result[2] if result[2] is not None else -1
+            yield result
+
+        # move to the best neighbour if it improves the score, otherwise refine the step
+        best_neighbour = max(neighbours, key=get_score)
+        improved = get_score(best_neighbour) > get_score(best)
+        if improved:
+            best = best_neighbour
+
+        history.append(dict(zip(threshold_names, best), step=step, evaluations=len(evaluated),
+                            f1_score=get_score(best), improved=improved))
+
+        if not improved:
+            if step <= resolution:
+                break
+            step = max(snap_to_resolution(step / 2, resolution), resolution)
+
+
+def record_result(result, f1_scores, grid_points_per_classification, f1_per_classification):
+    """
+    Prints the result of one threshold combination and adds it to the F1 scores.
+
+    :param result: A tuple returned by evaluate_thresholds.
+    :param f1_scores: A list of dictionaries with the thresholds and the f1 score of every successful evaluation.
+    :param grid_points_per_classification: A dictionary counting the threshold combinations per classification.
+    :param f1_per_classification: A dictionary with the f1 score per classification.
+    """
+    thresholds, fingerprint, f1, error = result
+    threshold_ui_obj, threshold_act, threshold_att, threshold_timestamp, threshold_compl = thresholds
+
+    if fingerprint is not None:
+        grid_points_per_classification[fingerprint] = grid_points_per_classification.get(fingerprint, 0) + 1
+        f1_per_classification[fingerprint] = f1
+
+    if error is not None:
+        print(
+            f"Error occurred with thresholds: {threshold_ui_obj}, {threshold_act}, {threshold_att}, {threshold_timestamp}, {threshold_compl}")
+        print("Error:", error)
+        return
+
+    # get f1 score
+    print(f1)
+
+    # Store the F1 score and threshold combination
+    f1_scores.append({
+        'threshold_ui_obj': threshold_ui_obj,
+        'threshold_act': threshold_act,
+        'threshold_att': threshold_att,
+        'threshold_timestamp': threshold_timestamp,
+        'threshold_compl': threshold_compl,
+        'f1_score': f1
+    })
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Evaluates the transformation for different threshold combinations.")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="number of processes evaluating threshold combinations in parallel (default: 1)")
+    parser.add_argument('--search', choices=['grid', 'adaptive'], default='grid',
+                        help="evaluate the whole grid of threshold_ranges or search adaptively (default: grid)")
+    parser.add_argument('--budget', type=int, default=200,
+                        help="maximum number of threshold combinations of the adaptive search (default: 200)")
+    parser.add_argument('--step', type=float, default=0.1,
+                        help="first step size of the adaptive search (default: 0.1)")
+    parser.add_argument('--resolution', type=float, default=0.01,
+                        help="smallest step size of the adaptive search (default: 0.01)")
+    args = parser.parse_args()
+
+    f1_scores = []
+    grid_points_per_classification = {}  # classification fingerprint -> number of threshold combinations
+    f1_per_classification = {}  # classification fingerprint -> f1 score
+
+    if args.workers > 1:
+        # every worker loads its state once and then takes threshold combinations and classifications from the pool
+        pool = multiprocessing.Pool(args.workers, initializer=init_worker, initargs=(log_file_path, ground_truth_path))
+    else:
+        pool = None
+        init_worker(log_file_path, ground_truth_path)
+
+    scores_per_classification = {}  # classification fingerprint -> (f1 score, error message)
+    evaluate = functools.partial(evaluate_thresholds, pool, scores_per_classification=scores_per_classification,
+                                 max_classification_tasks=2 * args.workers)
+
+    if args.search == 'adaptive':
+        history = []
+        results = adaptive_search(evaluate, default_thresholds, args.step, args.resolution, args.budget, history)
+    else:
+        results = evaluate(get_threshold_combinations(threshold_ranges))
+
+    # results stream in as soon as they are finished
+    for result in results:
+        record_result(result, f1_scores, grid_points_per_classification, f1_per_classification)
+
+    if pool is not None:
+        pool.close()
+        pool.join()
+
+    # report how many threshold combinations collapsed into each distinct classification
+    print(f"{sum(grid_points_per_classification.values())} threshold combinations led to "
+          f"{len(grid_points_per_classification)} distinct column classifications:")
+    for class_number, (fingerprint, grid_points) in enumerate(grid_points_per_classification.items(), start=1):
+        print(f"classification {class_number}: {grid_points} threshold combinations, f1 score: {f1_per_classification[fingerprint]}")
+
+    # create a DataFrame from the F1 scores list
+    df_f1_scores = pd.DataFrame(f1_scores)
+
+    # rearrange the columns for the desired order
+    df_f1_scores = df_f1_scores[['threshold_ui_obj', 'threshold_act', 'threshold_att', 'threshold_timestamp', 'threshold_compl', 'f1_score']]
+
+    if args.search == 'adaptive':
+        # report how the search converged
+        df_history = pd.DataFrame(history, columns=['evaluations', 'step', 'improved', 'f1_score'] + threshold_names)
+        print(df_history.to_string(index=False))
+        if history and not history[-1]['improved'] and history[-1]['step'] <= args.resolution:
+            print(f"Converged after {history[-1]['evaluations']} evaluations.")
+        else:
+            print(f"Stopped after using the budget of {args.budget} evaluations without converging.")
+        if history:
+            print("Best thresholds:", {name: history[-1][name] for name in threshold_names},
+                  "f1 score:", history[-1]['f1_score'])
+
+        # save the F1 scores and the convergence report to an Excel file
+        with pd.ExcelWriter('evaluation results/f1_scores_adaptive_search.xlsx') as writer:
+            df_f1_scores.to_excel(writer, sheet_name='F1 Scores', index=False)
+            df_history.to_excel(writer, sheet_name='Convergence', index=False)
+
+    else:
+        # parallel results arrive in completion order, so restore the order of the grid
+        df_f1_scores = df_f1_scores.sort_values(['threshold_ui_obj', 'threshold_act', 'threshold_att', 'threshold_compl'],
+                                                ignore_index=True)
+
+        # save the F1 scores to an Excel file
+        df_f1_scores.to_excel('evaluation results/f1_scores_parameter_optimization.xlsx', index=False)
@@ -0,0 +1,58 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions import ColumnProfile
+
+
+def profile_in_chunks(column, chunksize, max_uniqueness_ratio=0.5, max_values=100):
+    profile = ColumnProfile(max_uniqueness_ratio, max_values)
+    for start in range(0, len(column), chunksize):
+        profile.update(column.iloc[start:start + chunksize])
+    return profile
+
+
+def test_unique_column_keeps_a_bounded_sample_and_exact_counts():
+    column = pd.Series([f'2023-01-01 00:00:{index}' for index in range(5000)] + [np.NaN] * 10, dtype=object)
+
+    profile = profile_in_chunks(column, 700)
+
+    assert profile.is_sampled()
+    assert len(profile.value_counts) == 100
+    assert profile.count() == 5000
+    assert profile.null_count == 10
+    # every sampled value occurs once, so the number of unique values is exact
+    assert profile.nunique() == 5000
+    assert not profile.is_constant()
+    # the sampled values and the missing values
+    assert len(profile.items()) == 101
+    assert profile.items()[-1] == (np.NaN, 10)
+
+
+def test_sample_does_not_depend_on_the_chunks():
+    rng = np.random.default_rng(0)
+    column = pd.Series([f'value {value}' for value in rng.integers(0, 3000, 6000)], dtype=object)
+
+    whole = profile_in_chunks(column, len(column), max_uniqueness_ratio=0.1)
+    chunked = profile_in_chunks(column, 500, max_uniqueness_ratio=0.1)
+
+    assert whole.is_sampled() and chunked.is_sampled()
+    assert whole.value_counts == chunked.value_counts
+    assert whole.nunique() == chunked.nunique()
+    # the counts of the sampled values are exact
+    counts = column.value_counts()
+    assert all(counts[value] == count for value, count in chunked.value_counts.items())
+
+
+def test_categorical_column_keeps_all_values():
+    column = pd.Series([f'value {index % 300}' for index in range(5000)], dtype=object)
+
+    profile = profile_in_chunks(column, len(column))
+
+    assert not profile.is_sampled()
+    assert profile.nunique() == 300
+    assert profile.value_counts == column.value_counts().to_dict()
@@ -0,0 +1,51 @@
+import os
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip('pyarrow')
+
+from main import load_log, timestamp_regex
+
+
+def test_typed_parquet_columns_are_read_like_csv_values(tmp_path):
+    typed_log = pd.DataFrame({
+        'timeStamp': pd.to_datetime(['2019-10-21T00:10:09.640Z', None], utc=True),
+        'target.checked': pd.array([True, None], dtype='boolean'),
+        'target.id': [3.0, 1.5],
+        'rowCount': pd.array([7, None], dtype='Int64'),
+        'eventType': ['copyCell', None],
+    })
+    file_path = os.path.join(tmp_path, 'typed_log.parquet')
+    typed_log.to_parquet(file_path)
+
+    log = load_log(file_path)
+
+    assert log['timeStamp'].iloc[0] == '2019-10-21T00:10:09.640Z'
+    assert re.fullmatch(timestamp_regex, log['timeStamp'].iloc[0])
+    assert log['target.checked'].iloc[0] == 'True'
+    assert list(log['target.id']) == ['3', '1.5']
+    assert log['rowCount'].iloc[0] == '7'
+    assert log['eventType'].iloc[0] == 'copyCell'
+
+    # missing values are np.NaN, like in a csv file read with dtype=str
+    for column in ['timeStamp', 'target.checked', 'rowCount', 'eventType']:
+        assert log[column].iloc[1] is np.NaN
+
+
+def test_typed_parquet_log_is_transformed_like_the_csv_log(tmp_path):
+    from main import transform
+
+    csv_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'input datasets',
+                            'student_record_full_log.csv')
+    typed_log = pd.read_csv(csv_path)
+    typed_log['timeStamp'] = pd.to_datetime(typed_log['timeStamp'], utc=True)
+    file_path = os.path.join(tmp_path, 'student_record_full_log.parquet')
+    typed_log.to_parquet(file_path)
+
+    assert transform(load_log(file_path)) == transform(load_log(csv_path))
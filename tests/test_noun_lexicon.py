@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from nltk.data import find
+
+root_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    find('corpora/wordnet')
+except LookupError:
+    pytest.skip("the WordNet corpus is needed to build the noun lexicon", allow_module_level=True)
+
+
+def run_with_lexicon(lexicon_path, code):
+    """
+    Runs code in a new process in which the functions module uses the noun lexicon at lexicon_path.
+    """
+    setup = (f"import sys; sys.path.insert(0, {root_folder!r}); import functions; "
+             f"functions.noun_lexicon_path = {lexicon_path!r}; ")
+    return subprocess.run([sys.executable, '-W', 'ignore', '-c', setup + code], cwd=root_folder, check=True,
+                          capture_output=True, text=True).stdout.strip()
+
+
+def test_wordnet_is_not_loaded_when_the_noun_lexicon_exists(tmp_path):
+    lexicon_path = os.path.join(tmp_path, 'noun_lexicon.pkl')
+    run_with_lexicon(lexicon_path, "functions.build_noun_lexicon()")
+
+    loader = run_with_lexicon(lexicon_path, "import main; from nltk.corpus import wordnet; "
+                                            "main.transform(main.load_log('student_record.xlsx')); "
+                                            "print(type(wordnet).__name__)")
+
+    assert loader == 'LazyCorpusLoader'
+
+
+def test_noun_lexicon_lemmatizes_like_wordnet(tmp_path):
+    lexicon_path = os.path.join(tmp_path, 'noun_lexicon.pkl')
+    run_with_lexicon(lexicon_path, "functions.build_noun_lexicon()")
+
+    words = ['buttons', 'sheets', 'mice', 'glasses', 'women', 'first name', 'studentrecords', 'data']
+    lexicon_lemmas = run_with_lexicon(lexicon_path, f"print([functions.lemmatize_noun(w) for w in {words!r}])")
+    wordnet_lemmas = run_with_lexicon(os.path.join(tmp_path, 'missing.pkl'),
+                                      f"print([functions.lemmatize_noun(w) for w in {words!r}])")
+
+    assert lexicon_lemmas == wordnet_lemmas